@@ -0,0 +1,220 @@
+"""
+belt_sim
+
+belt + robot timing simulator, to compare main.py's stop-and-go cycle with picking on the fly
+(pick_planner). Caps ride the belt into the camera view at a given rate, the camera sees them
+trigger_hz times a second (noisy centers, some missed), the robot is a clock (RobotTiming, with
+some jitter) and the belt speed wanders a bit. No images, no modbus: just when things happen.
+
+stop-and-go: belt stops once an item is past main's trigger line, photos until it has settled, the
+robot picks everything in reach, main sees the cycle finish (CycleWaiter polls), belt on again.
+on the fly: belt keeps running, ItemTracker follows the caps, pick_planner plans each cycle and
+the robot goes down at the planned time; a grab works if a cap is within grip_tolerance px of
+the planned spot when the gripper closes.
+
+Not modelled: belt coasting after the conveyor goes off, the arm hiding caps from the camera,
+modbus write times.
+
+usage:
+    python belt_sim.py              # both modes at a few arrival rates
+"""
+import collections
+import numpy as np
+import camera_fxns
+import homography
+import item_tracker
+import pick_planner
+
+BELT_WIDTH = 1190 # belt image px (camera_fxns.BELT_CROP)
+BELT_HEIGHT = 208
+TRIGGER_X = 640   # camera_fxns.wait_for_items()
+
+# mode: 'stop' or 'fly'
+# arrivals_per_min: caps coming in per minute with the belt running
+# picked: caps put on a pallet
+# failed: grabs that closed on nothing (no cap within grip_tolerance)
+# missed: caps that went past the reach window and weren't picked
+# seconds: simulated time
+# belt_running: fraction of the time the belt was on
+# items_per_min: picked per minute
+SimResult = collections.namedtuple('SimResult', ['mode', 'arrivals_per_min', 'picked', 'failed', 'missed', 'seconds',
+                                                 'belt_running', 'items_per_min'])
+
+
+def default_model():
+    """
+    :returns: homography.HomographyModel fitted to camera_fxns' default points (for the world coords)
+    """
+    return homography.build_model(camera_fxns.CALIBRATION_IMG_PTS, camera_fxns.CALIBRATION_ROBOT_PTS)
+
+
+class Belt:
+    """
+    Belt
+
+    caps on a long strip: cap i is at image x = strip[i] + travel, travel grows while the belt runs
+    """
+    def __init__(self, arrivals_per_min, speed, seconds, rng, radius=14, speed_jitter=0.02):
+        self.speed = speed
+        self.speed_jitter = speed_jitter
+        self.rng = rng
+        self.radius = radius
+        mean_gap = speed * 60.0 / arrivals_per_min
+        min_gap = 2 * radius + 4
+        n = int(speed * seconds * 1.2 / mean_gap) + 10
+        gaps = min_gap + rng.exponential(max(mean_gap - min_gap, 1.0), n)
+        self.strip = -np.cumsum(gaps)
+        self.y = rng.uniform(45, BELT_HEIGHT - 38, n) # belt guides keep them in the robot's y range
+        self.classes = rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], n)
+        self.picked = np.zeros(n, dtype=bool)
+        self.travel = 0.0
+        self.running = True
+        self._v = speed
+        self._next_change = 0.0
+
+    def step(self, t, dt):
+        if t >= self._next_change: # speed wanders, new value every second
+            self._v = self.speed * (1 + self.rng.normal(0, self.speed_jitter))
+            self._next_change = t + 1.0
+        if self.running:
+            self.travel += self._v * dt
+
+    def positions(self):
+        return np.column_stack((self.strip + self.travel, self.y))
+
+    def visible(self):
+        x = self.strip + self.travel
+        return np.flatnonzero((x > self.radius + 1) & (x < BELT_WIDTH - self.radius - 2) & ~self.picked)
+
+    def grab(self, spot, tolerance, reach=pick_planner.REACH_WINDOW):
+        """
+        :returns: True if a cap within tolerance px of spot (and in reach) was taken off the belt
+        """
+        candidates = np.flatnonzero(~self.picked)
+        if not len(candidates) or not pick_planner.in_reach(spot, reach)[0]:
+            return False
+        distance = np.linalg.norm(self.positions()[candidates] - spot, axis=1)
+        nearest = int(np.argmin(distance))
+        if distance[nearest] > tolerance:
+            return False
+        self.picked[candidates[nearest]] = True
+        return True
+
+    def missed(self, reach=pick_planner.REACH_WINDOW):
+        return int(((self.strip + self.travel > reach[2]) & ~self.picked).sum())
+
+
+def _detect(belt, rng, noise_px, drop):
+    rows = belt.visible()
+    rows = rows[rng.random(len(rows)) > drop]
+    centers = belt.positions()[rows] + rng.normal(0, noise_px, (len(rows), 2))
+    return centers, belt.classes[rows]
+
+
+def simulate(mode='fly', arrivals_per_min=20.0, seconds=300.0, speed=90.0, fps=10.0,
+             timing=pick_planner.DEFAULT_TIMING, seed=0, noise_px=1.0, drop=0.05, speed_jitter=0.02,
+             timing_jitter=0.05, grip_tolerance=8.0, start_latency_s=0.02, poll_guard_s=0.5, picks_per_cycle=1,
+             settle_s=0.2, done_poll_s=0.03, model=None, dt=0.01):
+    """
+    simulate
+
+    :param mode: 'stop' (main.py's stop-and-go) or 'fly' (pick_planner, belt always on)
+    :param arrivals_per_min: caps coming in per minute at full belt speed
+    :param seconds: simulated time
+    :param speed: belt px/s
+    :param fps: camera frames per second (main's trigger_hz)
+    :param timing: RobotTiming the robot really takes (on average), also what the planner assumes
+    :param noise_px: detection center noise (1 sigma)
+    :param drop: fraction of caps the camera misses per frame
+    :param speed_jitter: belt speed wander (fraction, 1 sigma, new value every s)
+    :param timing_jitter: robot move time spread (fraction, 1 sigma)
+    :param grip_tolerance: px a cap may be off the gripper and still be picked
+    :param start_latency_s: START_COMMAND sent -> robot's timer reset (modbus + Epson polling)
+    :param poll_guard_s: on the fly: main starts polling for cycle done this long after START
+    :param picks_per_cycle: on the fly: pick_planner.plan_picks() max_picks
+    :param settle_s: stop-and-go: conveyor off -> settled photo (main.settled_photo())
+    :param done_poll_s: stop-and-go: robot done -> main seeing it (CycleWaiter polls)
+    :param model: homography.HomographyModel for the planner, None=default_model()
+    :param dt: simulation step (s)
+    :returns: SimResult
+    """
+    rng = np.random.default_rng(seed)
+    belt = Belt(arrivals_per_min, speed, seconds, rng, speed_jitter=speed_jitter)
+    model = default_model() if model is None else model
+    tracker = item_tracker.ItemTracker()
+    jitter = lambda s: s * max(0.0, 1 + rng.normal(0, timing_jitter))
+    frame_every = max(1, int(round(1.0 / (fps * dt))))
+    failed = 0
+    belt_on_steps = 0
+    grips = []           # (time, spot px) the gripper closes, in order
+    robot_done = 0.0     # robot's cycle ends (cycle_done on)
+    python_waits = 0.0   # main's loop busy (sleeping/polling) until then
+    state = 'running'
+    planned = ()
+    started = -poll_guard_s # on the fly: main polls cycle_done every frame from poll_guard_s after START
+    n_steps = int(seconds / dt)
+    for k in range(n_steps):
+        t = k * dt
+        belt.step(t, dt)
+        belt_on_steps += belt.running
+        while grips and grips[0][0] <= t:
+            _, spot = grips.pop(0)
+            failed += not belt.grab(spot, grip_tolerance)
+        if t < python_waits or k % frame_every:
+            continue
+
+        if mode == 'stop':
+            if state == 'running':
+                centers, _ = _detect(belt, rng, noise_px, drop)
+                if len(centers) and (centers[:, 0] >= TRIGGER_X).any():
+                    belt.running = False
+                    state = 'settle'
+                    python_waits = t + settle_s # photos until the caps stop moving
+            elif state == 'settle':
+                # still photo, everything in main's bounds goes to the robot (no margin)
+                centers, _ = _detect(belt, rng, 0.0, 0.0)
+                reachable = centers[pick_planner.in_reach(centers)]
+                free_at = t + start_latency_s + jitter(timing.start_s)
+                for spot in reachable:
+                    grip = free_at + jitter(timing.approach_s) + jitter(timing.descend_s)
+                    grips.append((grip, spot))
+                    free_at = grip + jitter(timing.place_s)
+                robot_done = free_at
+                python_waits = robot_done + done_poll_s
+                state = 'done'
+            else:
+                belt.running = True
+                state = 'running'
+            continue
+
+        centers, classes = _detect(belt, rng, noise_px, drop)
+        tracker.update(centers, classes, t)
+        if t < max(robot_done, started + poll_guard_s):
+            continue
+        plan = pick_planner.plan_picks(tracker, model, t, timing, exclude=planned, max_picks=picks_per_cycle)
+        if not len(plan.ids):
+            continue
+        planned = plan.ids.tolist()
+        timer_zero = t + start_latency_s
+        free_at = timer_zero + jitter(timing.start_s)
+        for spot, descend_at in zip(plan.pixels, plan.descend_at):
+            above = free_at + jitter(timing.approach_s)
+            grip = max(above, timer_zero + descend_at) + jitter(timing.descend_s)
+            grips.append((grip, spot))
+            free_at = grip + jitter(timing.place_s)
+        robot_done = free_at
+        started = t
+    picked = int(belt.picked.sum())
+    return SimResult(mode, arrivals_per_min, picked, failed, belt.missed(), seconds, belt_on_steps / n_steps,
+                     picked * 60.0 / seconds)
+
+
+if __name__ == '__main__':
+    model = default_model()
+    t = pick_planner.DEFAULT_TIMING
+    print(f"robot {t.approach_s + t.descend_s + t.place_s:.1f} s per pick ({t}), belt 90 px/s, 300 s simulated")
+    for rate in (6, 10, 15, 20, 30):
+        for mode in ('stop', 'fly'):
+            r = simulate(mode, rate, model=model)
+            print(f"{rate:3d} caps/min {mode:4s}: {r.items_per_min:5.1f} picked/min, {r.failed:3d} failed grabs, "
+                  f"{r.missed:3d} missed, belt on {r.belt_running * 100:3.0f}%")
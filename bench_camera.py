@@ -0,0 +1,485 @@
+"""
+bench_camera
+
+timing for the camera layer, runs against fake_mvsdk by default
+set SDK = mvsdk to time the real camera on the rig
+"""
+import contextlib
+import io
+import threading
+import time
+import tracemalloc
+import numpy as np
+import fake_mvsdk
+import mvsdk
+import camera_session
+import camera_stream
+import camera_trigger
+import camera_supervisor
+import camera_fxns
+
+SDK = fake_mvsdk
+n_frames = 20
+
+
+def bench_open_per_shot(n=n_frames):
+    """
+    bench_open_per_shot
+
+    old take_photo() path: enumerate/init/play/uninit around every frame
+
+    :param n: frames to grab
+    :returns: frames per second
+    """
+    start = time.perf_counter()
+    for _ in range(n):
+        camera_session.forget_cameras() # old path enumerated every time
+        with camera_session.CameraSession(sdk=SDK) as cam:
+            cam.grab()
+    return n / (time.perf_counter() - start)
+
+
+def check_camera_select():
+    """
+    check_camera_select
+
+    (fake_mvsdk only) two cameras: pick by serial, friendly name and IP without any
+    input(), enumerating only once per camera and again only after it drops off
+    """
+    fake_mvsdk.configure(init_delay=0, uninit_delay=0, enum_delay=0,
+                         devices=[('BeltCam', 'SN-A', '192.168.0.50'), ('PalletCam', 'SN-B', '192.168.0.51')])
+    camera_session.forget_cameras()
+    def opened():
+        return [args[0] for name, args in fake_mvsdk.calls if name == 'CameraInit'][-1]
+    def enumerations():
+        return [name for name, _ in fake_mvsdk.calls].count('CameraEnumerateDevice')
+
+    for select, sn in (('SN-B', 'SN-B'), ('BeltCam', 'SN-A'), ('192.168.0.51', 'SN-B'), ('SN-B', 'SN-B')):
+        with camera_session.CameraSession(sdk=fake_mvsdk, select=select):
+            pass
+        assert opened() == sn, (select, opened())
+    assert enumerations() == 3, enumerations() # 'SN-B' the second time came from the cache
+    try:
+        camera_session.CameraSession(sdk=fake_mvsdk).open()
+        raise AssertionError("opened one of two cameras without being told which")
+    except ValueError:
+        pass
+    # PalletCam swapped for a new unit with the same name: the cached one fails, open() enumerates again
+    fake_mvsdk.settings['devices'] = [('BeltCam', 'SN-A', '192.168.0.50'), ('PalletCam', 'SN-C', '192.168.0.51')]
+    with camera_session.CameraSession(sdk=fake_mvsdk, select='192.168.0.51'):
+        pass
+    assert opened() == 'SN-C' and enumerations() == 5, (opened(), enumerations())
+    fake_mvsdk.configure(devices=[('FakeCam', 'FAKE0001', '192.168.0.50')], enum_delay=0.1)
+    camera_session.forget_cameras()
+
+
+def bench_cached_open(n=5):
+    """
+    bench_cached_open
+
+    open + close of a session, enumerating each time vs. with find_camera()'s cache
+
+    :returns: (ms per open enumerating, ms per open cached)
+    """
+    results = []
+    for cached in (False, True):
+        camera_session.forget_cameras()
+        start = time.perf_counter()
+        for _ in range(n):
+            if not cached:
+                camera_session.forget_cameras()
+            with camera_session.CameraSession(sdk=SDK):
+                pass
+        results.append(1000 * (time.perf_counter() - start) / n)
+    return results
+
+
+def bench_session(n=n_frames):
+    """
+    bench_session
+
+    one CameraSession kept open for all frames (open/close not timed)
+
+    :param n: frames to grab
+    :returns: frames per second
+    """
+    with camera_session.CameraSession(sdk=SDK) as cam:
+        start = time.perf_counter()
+        for _ in range(n):
+            cam.grab()
+        return n / (time.perf_counter() - start)
+
+
+def check_belt_roi():
+    """
+    check_belt_roi
+
+    (fake_mvsdk only) ROI capture has to ask the camera for the belt_roi() window and
+    still give the exact same belt band as a full-sensor capture
+
+    :returns: the roi used
+    """
+    w, h = fake_mvsdk.settings['width'], fake_mvsdk.settings['height']
+    still = fake_mvsdk.default_frame(0, w, h) # same picture every frame
+    fake_mvsdk.configure(frame_delay=0, link_bytes_per_s=None, init_delay=0, uninit_delay=0,
+                         frame_source=lambda seq: still)
+    with camera_session.CameraSession(sdk=fake_mvsdk) as cam:
+        full = camera_fxns.take_belt_photo(cam)
+    with camera_session.CameraSession(sdk=fake_mvsdk) as cam:
+        roi = camera_fxns.use_belt_roi(cam)
+        frame = cam.grab()
+        part = camera_fxns.take_belt_photo(cam)
+    fake_mvsdk.settings['frame_source'] = None
+    roi_calls = [args for name, args in fake_mvsdk.calls if name == 'CameraSetImageResolutionEx']
+    assert roi_calls and tuple(roi_calls[-1][4:8]) == tuple(roi), roi_calls
+    assert frame.shape[:2] == (roi[3], roi[2]), (frame.shape, roi)
+    assert np.array_equal(full, part), "roi belt band differs from full-frame belt band"
+    return roi
+
+
+def bench_belt_roi(n=n_frames):
+    """
+    bench_belt_roi
+
+    belt band frames/s capturing the full sensor vs. only belt_roi()
+
+    :param n: frames to grab
+    :returns: (full fps, roi fps)
+    """
+    fps = []
+    for use_roi in (False, True):
+        with camera_session.CameraSession(sdk=SDK) as cam:
+            if use_roi:
+                camera_fxns.use_belt_roi(cam)
+            start = time.perf_counter()
+            for _ in range(n):
+                camera_fxns.take_belt_photo(cam)
+            fps.append(n / (time.perf_counter() - start))
+    return fps
+
+
+def check_lease_guards():
+    """
+    check_lease_guards
+
+    (fake_mvsdk only) a released FrameLease can't be read, and the pool refuses to
+    lease more buffers than it has or take one back twice
+    """
+    fake_mvsdk.configure(frame_delay=0, link_bytes_per_s=None, init_delay=0, uninit_delay=0)
+    with camera_session.CameraSession(sdk=fake_mvsdk, n_buffers=2) as cam:
+        a = cam.grab_lease()
+        b = cam.grab_lease()
+        try:
+            cam.grab_lease()
+            raise AssertionError("leased more buffers than the pool has")
+        except RuntimeError:
+            pass
+        a.release()
+        try:
+            a.image
+            raise AssertionError("image readable after release()")
+        except camera_session.BufferReleasedError:
+            pass
+        try:
+            cam.pool.release(a.address)
+            raise AssertionError("buffer released twice")
+        except camera_session.BufferReleasedError:
+            pass
+        b.release()
+        assert cam.pool.n_leased == 0
+
+
+def bench_lease(n=n_frames):
+    """
+    bench_lease
+
+    belt band from grab() (frame copied out of the SDK buffer) vs. grab_lease() (read in place)
+
+    :param n: frames
+    :returns: [(ms per frame, peak MB allocated)] for copy, lease
+    """
+    results = []
+    for leased in (False, True):
+        with camera_session.CameraSession(sdk=SDK) as cam:
+            tracemalloc.start()
+            start = time.perf_counter()
+            for _ in range(n):
+                if leased:
+                    with cam.grab_lease() as lease:
+                        camera_fxns.belt_view(lease.image)
+                else:
+                    camera_fxns.belt_view(cam.grab())
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results.append((1000 * elapsed / n, peak / 1e6))
+    return results
+
+
+def check_sdk_loading(n_threads=8):
+    """
+    check_sdk_loading
+
+    mvsdk loads its library on the first call, not at import: threads racing on that
+    first call load it exactly once, and set_backend() swaps in another library
+    (a stand-in object with the raw entry points here)
+
+    :param n_threads: threads making the first SDK call at the same time
+    """
+    class RawSdk:
+        # just enough of the C API for CameraSdkInit
+        def CameraSdkInit(self, iLanguageSel):
+            time.sleep(0.01)
+            return 0
+
+    loads = []
+    real_init = mvsdk._Init
+
+    def counting_init(backend):
+        loads.append(backend)
+        time.sleep(0.05) # slow load, so the threads pile up on the lock
+        return real_init(backend)
+
+    mvsdk._Init = counting_init
+    try:
+        mvsdk.set_backend(RawSdk())
+        assert not mvsdk.sdk_loaded()
+        start = threading.Barrier(n_threads)
+        results = []
+
+        def first_call():
+            start.wait()
+            results.append(mvsdk.CameraSdkInit(1))
+
+        threads = [threading.Thread(target=first_call) for _ in range(n_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [0] * n_threads, results
+        assert len(loads) == 1, f"SDK loaded {len(loads)} times"
+        assert mvsdk.sdk_loaded()
+    finally:
+        mvsdk._Init = real_init
+        mvsdk.set_backend(None)
+    assert not mvsdk.sdk_loaded()
+    return n_threads
+
+
+def check_triggers(rate_hz=20, seconds=0.5):
+    """
+    check_triggers
+
+    (fake_mvsdk only) timer-fired and one-off soft triggers each give exactly one
+    frame, tagged with the id of the trigger that caused it
+    """
+    fake_mvsdk.configure(frame_delay=0.005, link_bytes_per_s=None, init_delay=0, uninit_delay=0)
+    cam = camera_session.CameraSession(sdk=fake_mvsdk, trigger_mode=1)
+    with cam, camera_stream.CameraStream(cam) as stream:
+        seen = []
+        with camera_trigger.TriggerTimer(cam, rate_hz) as timer:
+            end = time.perf_counter() + seconds
+            while time.perf_counter() < end:
+                frame = stream.latest(seen[-1][0] if seen else -1, timeout=0.1)
+                if frame is not None:
+                    seen.append((frame.seq, frame.trigger))
+            timer.pause()
+            time.sleep(2.0 / rate_hz)
+            trigger = cam.soft_trigger()
+            frame = stream.latest(trigger=trigger)
+        fired = [name for name, _ in fake_mvsdk.calls].count('CameraSoftTrigger')
+    assert frame is not None and frame.trigger == trigger, frame
+    assert fired == trigger, (fired, trigger)
+    assert stream.seq + 1 == fired, (stream.seq, fired) # one frame per trigger
+    assert all(t == seq + 1 for seq, t in seen), seen # frame n answers trigger n+1
+    assert abs(len(seen) - rate_hz * seconds) <= 2, len(seen)
+    return fired
+
+
+def bench_idle(seconds=1.0, rate_hz=5):
+    """
+    bench_idle
+
+    CPU used by the acquisition side (frames grabbed + belt band remapped) over `seconds`:
+    continuous mode vs. soft triggers at rate_hz vs. triggers paused (belt stopped)
+
+    :returns: [(frames, cpu s)] for continuous, triggered, paused
+    """
+    results = []
+    for mode in ('continuous', 'triggered', 'paused'):
+        cam = camera_session.CameraSession(sdk=SDK, trigger_mode=0 if mode == 'continuous' else 1)
+        with cam, camera_stream.CameraStream(cam) as stream:
+            timer = camera_trigger.TriggerTimer(cam, rate_hz)
+            if mode == 'triggered':
+                timer.start()
+            cpu = time.process_time()
+            seq = -1
+            end = time.perf_counter() + seconds
+            while time.perf_counter() < end:
+                belt, frame = camera_fxns.stream_belt_photo(stream, seq, timeout=end - time.perf_counter())
+                if frame is not None:
+                    seq = frame.seq
+            results.append((stream.seq + 1, time.process_time() - cpu))
+            timer.stop()
+    return results
+
+
+def bench_recovery(drop_s=0.3, max_recovery_s=1.5):
+    """
+    bench_recovery
+
+    (fake_mvsdk only) link drops with a CameraSupervisor watching the stream:
+    the SDK's own reconnect, a drop that kills the handle (camera re-opened), and one
+    longer than max_recovery_s (has to give up within the bound instead of hanging)
+
+    :returns: {case: s from the link coming back (or from the drop, for 'dead') to the next frame / giving up}
+    """
+    fake_mvsdk.configure(frame_delay=1 / 60.0, link_bytes_per_s=None, init_delay=0.15, uninit_delay=0.05,
+                         enum_delay=0.1, lose_every=25, error_every=40)
+    results = {}
+    for case in ('auto reconnect', 're-open', 'dead'):
+        cam = camera_session.CameraSession(sdk=fake_mvsdk, timeout_ms=50)
+        cam.open()
+        supervisor = camera_supervisor.CameraSupervisor(cam, max_recovery_s=max_recovery_s, reconnect_grace_s=0.5)
+        supervisor.attach()
+        with camera_stream.CameraStream(cam, supervisor=supervisor) as stream:
+            frame = stream.latest()
+            time.sleep(1.0) # some frames (and lost/error ones) before the drop
+            if case == 'dead':
+                fake_mvsdk.inject_link_drop(10 * max_recovery_s, kill_handles=True)
+                start = time.perf_counter()
+                while not supervisor.failed and time.perf_counter() - start < 10 * max_recovery_s:
+                    time.sleep(0.01)
+                results[case] = time.perf_counter() - start
+                assert supervisor.failed and stream.latest(stream.seq, timeout=0.5) is None
+            else:
+                fake_mvsdk.inject_link_drop(drop_s, kill_handles=(case == 're-open'))
+                back_at = time.perf_counter() + drop_s
+                frame = stream.latest(frame.seq, since=back_at, timeout=drop_s + 2 * max_recovery_s)
+                assert frame is not None, case
+                results[case] = frame.grabbed_at - back_at
+                health = supervisor.health()
+                assert health['connected'] and not health['failed'], health
+                if case == 'auto reconnect': # same handle all along, so its counters cover the whole run
+                    assert health['reconnects'] == 1 and health['recoveries'] == 1, health
+                    assert health['frames_lost'] > 0 and health['frames_error'] > 0, health
+        print(f"  {case:15s} {results[case] * 1000:7.0f} ms  health: {supervisor.health()}")
+        cam.close()
+    fake_mvsdk.configure(lose_every=0, error_every=0)
+    return results
+
+
+def check_recovery_triggers(rate_hz=50, drop_s=0.3):
+    """
+    check_recovery_triggers
+
+    (fake_mvsdk only) a link drop that kills the handle while a TriggerTimer fires: no soft
+    trigger reaches the SDK from the start of the recovery until the camera is re-opened
+    and playing again, and triggered frames flow again afterwards (timer released)
+
+    :returns: soft triggers fired over the run
+    """
+    fake_mvsdk.configure(frame_delay=0.005, link_bytes_per_s=None, init_delay=0.05, uninit_delay=0.05, enum_delay=0)
+    cam = camera_session.CameraSession(sdk=fake_mvsdk, trigger_mode=1, timeout_ms=50)
+    cam.open()
+    timer = camera_trigger.TriggerTimer(cam, rate_hz)
+    supervisor = camera_supervisor.CameraSupervisor(cam, max_recovery_s=2.0, reconnect_grace_s=0.2, timer=timer)
+    supervisor.attach()
+    with camera_stream.CameraStream(cam, supervisor=supervisor) as stream, timer:
+        frame = stream.latest(timeout=1.0)
+        assert frame is not None
+        with contextlib.redirect_stdout(io.StringIO()): # CameraSoftTrigger failed while the link is down
+            fake_mvsdk.inject_link_drop(drop_s, kill_handles=True)
+            back_at = time.perf_counter() + drop_s
+            frame = stream.latest(frame.seq, since=back_at, timeout=drop_s + 2.0)
+    cam.close()
+    assert frame is not None and frame.trigger is not None, frame
+    assert len(supervisor.recoveries) == 1 and not supervisor.failed
+    names = [name for name, _ in fake_mvsdk.calls]
+    uninit = names.index('CameraUnInit') # first one: recovery's re-open
+    play = names.index('CameraPlay', uninit)
+    assert 'CameraSoftTrigger' not in names[uninit:play], names[uninit:play]
+    assert 'CameraSoftTrigger' in names[play:]
+    return names.count('CameraSoftTrigger')
+
+
+def bench_stream(n=n_frames, work_s=0.03):
+    """
+    bench_stream
+
+    control loop that grabs then works for work_s (preprocess, modbus, waitKey),
+    grabbing in the loop vs. taking the newest frame from a CameraStream
+
+    :param n: loop iterations
+    :param work_s: simulated per-iteration work
+    :returns: (sync loops/s, sync mean frame age ms, stream loops/s, stream mean frame age ms)
+    """
+    results = []
+    with camera_session.CameraSession(sdk=SDK) as cam:
+        ages = []
+        start = time.perf_counter()
+        for _ in range(n):
+            cam.grab()
+            grabbed_at = time.perf_counter()
+            time.sleep(work_s)
+            ages.append(time.perf_counter() - grabbed_at) # age when the work is done
+        results += [n / (time.perf_counter() - start), 1000 * sum(ages) / n]
+    with camera_session.CameraSession(sdk=SDK) as cam, camera_stream.CameraStream(cam) as stream:
+        ages = []
+        seq = -1
+        start = time.perf_counter()
+        for _ in range(n):
+            frame = stream.latest(seq)
+            seq = frame.seq
+            time.sleep(work_s)
+            ages.append(camera_stream.age(frame))
+        results += [n / (time.perf_counter() - start), 1000 * sum(ages) / n]
+    return results
+
+
+if __name__ == '__main__':
+    if SDK is fake_mvsdk:
+        fake_mvsdk.configure(frame_delay=1 / 60.0) # 60 fps camera
+    racing = check_sdk_loading()
+    print(f"mvsdk: loaded once for {racing} threads racing on the first call, backend swappable")
+    per_shot = bench_open_per_shot()
+    session = bench_session()
+    print(f"open-per-shot: {per_shot:8.2f} frames/s")
+    print(f"session:       {session:8.2f} frames/s ({session / per_shot:.1f}x)")
+    if SDK is fake_mvsdk:
+        check_camera_select()
+        print("camera picked by serial/name/IP, enumerated once per camera and on reconnect")
+    enum_ms, cached_ms = bench_cached_open()
+    print(f"open+close enumerating: {enum_ms:7.1f} ms  cached camera: {cached_ms:7.1f} ms")
+    if SDK is fake_mvsdk:
+        roi = check_belt_roi()
+        full = fake_mvsdk.settings['width'] * fake_mvsdk.settings['height']
+        print(f"belt roi {roi}: {roi[2] * roi[3] / full:.0%} of the sensor, same belt band as full frame")
+        fake_mvsdk.configure(frame_delay=1 / 60.0, link_bytes_per_s=100e6) # ~GigE payload rate
+    full_fps, roi_fps = bench_belt_roi()
+    print(f"belt band full sensor: {full_fps:8.2f} frames/s")
+    print(f"belt band roi:         {roi_fps:8.2f} frames/s ({roi_fps / full_fps:.1f}x)")
+    if SDK is fake_mvsdk:
+        check_lease_guards()
+        fake_mvsdk.configure(frame_delay=0, link_bytes_per_s=None) # just the host side
+    (copy_ms, copy_mb), (lease_ms, lease_mb) = bench_lease()
+    print(f"grab() copy:   {copy_ms:6.2f} ms/frame, peak {copy_mb:5.1f} MB allocated")
+    print(f"grab_lease():  {lease_ms:6.2f} ms/frame, peak {lease_mb:5.1f} MB allocated")
+    if SDK is fake_mvsdk:
+        fake_mvsdk.configure(frame_delay=1 / 60.0, link_bytes_per_s=100e6)
+    if SDK is fake_mvsdk:
+        fired = check_triggers()
+        print(f"soft triggers: {fired} fired, each matched to its own frame")
+        fired = check_recovery_triggers()
+        print(f"soft triggers: {fired} fired through a camera re-open, none while it was closed/opening")
+        fake_mvsdk.configure(frame_delay=1 / 60.0, link_bytes_per_s=100e6)
+    for mode, (frames, cpu) in zip(('continuous', 'triggered 5 Hz', 'triggers paused'), bench_idle()):
+        print(f"{mode:16s} {frames:4d} frames/s, {cpu * 1000:7.1f} ms CPU/s")
+    if SDK is fake_mvsdk:
+        print("link drops (time until frames flow again / until giving up):")
+        recovery = bench_recovery()
+        assert recovery['dead'] < 1.5 + 0.5, recovery # max_recovery_s + one open attempt
+        fake_mvsdk.configure(frame_delay=1 / 60.0, link_bytes_per_s=100e6)
+    sync_fps, sync_age, stream_fps, stream_age = bench_stream()
+    print(f"loop, grab in loop:  {sync_fps:8.2f} loops/s, frame {sync_age:6.1f} ms old when done")
+    print(f"loop, CameraStream:  {stream_fps:8.2f} loops/s, frame {stream_age:6.1f} ms old when done")
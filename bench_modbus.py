@@ -0,0 +1,677 @@
+"""
+bench_modbus
+
+timing (and result checks) for modbus_fxns, run against fake_epson (a pymodbus server on
+localhost standing in for the robot controller); latency_s adds a delay per request like
+the network/controller would
+"""
+import asyncio
+import contextlib
+import io
+import statistics
+import time
+import numpy as np
+import bench_vision
+import camera_fxns
+import fake_epson
+import modbus_async
+import modbus_fxns
+import pick_planner
+import robot_handshake
+from modbus_fxns import RobotState
+
+n_runs = 20
+
+
+def quiet():
+    # modbus_fxns prints every write, keep the bench output readable (same cost for both paths)
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def random_coords(rng, n):
+    return np.round(rng.uniform((100, -300), (400, 300), (n, 2)) + (0, 300), 2).tolist()
+
+
+def per_register_send(client, coords, coords_bad):
+    """
+    old main.py path: count + 2 writes per item, per class
+    """
+    modbus_fxns.send_target_count(client, len(coords))
+    for i in range(len(coords)):
+        modbus_fxns.send_modbus_coords(client, i+1, coords[i][0], coords[i][1])
+    modbus_fxns.send_target_count(client, len(coords_bad), False)
+    for i in range(len(coords_bad)):
+        modbus_fxns.send_modbus_coords(client, i+1, coords_bad[i][0], coords_bad[i][1], False)
+
+
+def epson_view(robot, good=True):
+    """
+    what Main1 reads: count, then x = InW(33 + 2*i)/100, y = InW(34 + 2*i)/100 (1-indexed words)
+
+    :returns: [(x, y), ...]
+    """
+    start, count_register = (32, 99) if good else (100, 129)
+    n = robot.registers(count_register)[0]
+    words = robot.registers(start, 2 * n)
+    return [(words[2 * i] / 100.0, words[2 * i + 1] / 100.0) for i in range(n)]
+
+
+def check_item_coords(seed=0):
+    """
+    check_item_coords
+
+    send_item_coords() leaves the same registers as the per-register path (what the robot
+    reads back), in 1 request instead of 2 + 2 per item; the slots not used are zeroed,
+    too many items sends nothing, and pick times land in their block (out of range ones aren't sent)
+
+    :returns: requests (per-register, bulk) for 15 good + 5 bad
+    """
+    rng = np.random.default_rng(seed)
+    coords, coords_bad = random_coords(rng, 15), random_coords(rng, 5)
+    with fake_epson.FakeEpson() as robot, quiet():
+        client = robot.client()
+        per_register_send(client, coords, coords_bad)
+        old = robot.registers(32, 98)
+        old_requests = robot.requests
+        robot.reset_counts()
+        modbus_fxns.send_item_coords(client, random_coords(rng, 33), random_coords(rng, 14)) # stale values
+        assert robot.requests == 1
+        modbus_fxns.send_item_coords(client, coords, coords_bad)
+        new = robot.registers(32, 98)
+        bulk_requests = robot.requests - 1
+        for good, sent in ((True, coords), (False, coords_bad)):
+            assert np.allclose(epson_view(robot, good), sent, atol=0.01 + 1e-9), good
+        assert new == old, [(32 + i, a, b) for i, (a, b) in enumerate(zip(old, new)) if a != b]
+        assert not any(robot.registers(32 + 2 * 15, 99 - 32 - 2 * 15)) and not any(robot.registers(100 + 2 * 5, 129 - 110))
+
+        robot.reset_counts()
+        assert not modbus_fxns.send_item_coords(client, coords, random_coords(rng, 15)) # 15th bad y is the count
+        assert robot.requests == 0 and robot.registers(32, 98) == new
+
+        assert modbus_fxns.send_pick_times(client, [0.5, 1.25, 3.0])
+        assert modbus_fxns.send_pick_times(client, [2.0], False) and modbus_fxns.send_pick_times(client, [])
+        assert robot.registers(modbus_fxns.PICK_TIMES_GOOD, 3) == [50, 125, 300]
+        assert robot.registers(modbus_fxns.PICK_TIMES_BAD, 1) == [200]
+        assert robot.requests == 2
+        # out of the register's range: nothing sent (not a 0 = "go down now")
+        assert not modbus_fxns.send_pick_times(client, [1.0, -0.2]) and not modbus_fxns.send_pick_times(client, [700.0], False)
+        assert robot.requests == 2 and robot.registers(modbus_fxns.PICK_TIMES_GOOD, 3) == [50, 125, 300]
+        client.close()
+    assert old_requests == 2 + 2 * (15 + 5), old_requests
+    return old_requests, bulk_requests
+
+
+def time_send(send, robot, client, coords, coords_bad, n=n_runs):
+    # median ms and requests per send
+    times = []
+    robot.reset_counts()
+    with quiet():
+        for _ in range(n):
+            start = time.perf_counter()
+            send(client, coords, coords_bad)
+            times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, robot.requests / n
+
+
+def bench_item_coords(latencies=(0.0, 0.001, 0.005), loads=((15, 5), (33, 14))):
+    """
+    bench_item_coords
+
+    sending a cycle's coords before START_COMMAND: per-register path vs. send_item_coords(),
+    on localhost and with a per-request delay like the network/controller (1, 5 ms guesses,
+    measure the real one with check_robot_cycle_complete() round trips on the rig)
+    """
+    old_requests, bulk_requests = check_item_coords()
+    print(f"item coords: registers match the per-register path, {old_requests} -> {bulk_requests} requests "
+          f"for 15 good + 5 bad")
+    rng = np.random.default_rng(1)
+    for latency in latencies:
+        with fake_epson.FakeEpson(latency_s=latency) as robot:
+            with quiet():
+                client = robot.client()
+            for n_good, n_bad in loads:
+                coords, coords_bad = random_coords(rng, n_good), random_coords(rng, n_bad)
+                n = n_runs if latency < 0.002 else 5
+                old_ms, old_req = time_send(per_register_send, robot, client, coords, coords_bad, n)
+                bulk_ms, bulk_req = time_send(modbus_fxns.send_item_coords, robot, client, coords, coords_bad, n)
+                print(f"            +{latency * 1000:3.0f} ms/request, {n_good:2d}+{n_bad:2d} items: per register "
+                      f"{old_ms:7.2f} ms ({old_req:3.0f} requests)  bulk {bulk_ms:6.2f} ms ({bulk_req:.0f})  "
+                      f"{old_ms / bulk_ms:5.1f}x")
+            client.close()
+
+
+
+def old_reset_bits(client, max_items=33, max_items_bad=15):
+    """
+    reset_bits() before the bulk reset: 2 coil writes, counts set to max_items(!), then
+    send_modbus_coords(i, 0, 0) for i from 0, which skips slot 0 and never gets to slot max_items
+    """
+    modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 0)
+    modbus_fxns.set_modbus_bit(client, modbus_fxns.CONVEYOR_ON, 0)
+    modbus_fxns.send_target_count(client, max_items)
+    for i in range(max_items):
+        modbus_fxns.send_modbus_coords(client, i, 0, 0)
+    modbus_fxns.send_target_count(client, max_items_bad, False)
+    for i in range(max_items_bad):
+        modbus_fxns.send_modbus_coords(client, i, 0, 0, False)
+
+
+def dirty_robot(robot, client, rng):
+    # everything Python writes set to something, like after a full on the fly cycle
+    modbus_fxns.send_item_coords(client, random_coords(rng, 33), random_coords(rng, 14))
+    modbus_fxns.send_pick_mode(client, True)
+    modbus_fxns.send_pick_times(client, rng.uniform(0.5, 9, 33).tolist())
+    modbus_fxns.send_pick_times(client, rng.uniform(0.5, 9, 15).tolist(), False)
+    modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
+    modbus_fxns.set_modbus_bit(client, modbus_fxns.CONVEYOR_ON, 1)
+    robot.reset_counts()
+
+
+def check_reset_bits(seed=0):
+    """
+    check_reset_bits
+
+    reset_bits() leaves every register Python writes at 0 and both bits off, in 3 requests;
+    only_dirty=True zeroes what a stop-and-go cycle wrote in 2 (1 if nothing was sent);
+    a reset that fails says so and keeps its registers dirty for the next one;
+    the old per-item reset left the counts at 33/15 and good slot 33 set
+
+    :returns: requests (old, new, only dirty after a stop-and-go cycle)
+    """
+    rng = np.random.default_rng(seed)
+    end = modbus_fxns.PICK_TIMES_END
+    with fake_epson.FakeEpson() as robot, quiet():
+        client = robot.client()
+        dirty_robot(robot, client, rng)
+        old_reset_bits(client)
+        old_requests = robot.requests
+        left = {address: value for address, value in enumerate(robot.registers(0, end)) if value}
+        assert left[99] == 33 and left[129] == 15 and 96 in left and 97 in left, left
+
+        dirty_robot(robot, client, rng)
+        assert modbus_fxns.reset_bits(client)
+        requests = robot.requests
+        assert requests == 3, requests
+        assert not any(robot.registers(0, end)), robot.registers(0, end)
+        assert not robot.coil(modbus_fxns.START_COMMAND) and not robot.coil(modbus_fxns.CONVEYOR_ON)
+
+        # a stop-and-go cycle's writes, then only those zeroed
+        modbus_fxns.send_item_coords(client, random_coords(rng, 15), random_coords(rng, 5))
+        modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
+        robot.reset_counts()
+        assert modbus_fxns.reset_bits(client, only_dirty=True)
+        dirty_requests = robot.requests
+        assert dirty_requests == 2, dirty_requests
+        assert not any(robot.registers(0, end)) and not robot.coil(modbus_fxns.START_COMMAND)
+        # single writes (old path) are tracked too, nothing written = just the bits
+        modbus_fxns.send_modbus_coords(client, 33, 1.0, 2.0)
+        modbus_fxns.send_target_count(client, 1, False)
+        robot.reset_counts()
+        assert modbus_fxns.reset_bits(client, only_dirty=True) and not any(robot.registers(0, end))
+        assert robot.requests == 2
+        assert modbus_fxns.reset_bits(client, only_dirty=True) and robot.requests == 3
+
+        # link down: nothing reset, still dirty, the next reset zeroes it
+        modbus_fxns.send_item_coords(client, random_coords(rng, 3), [])
+        with contextlib.redirect_stderr(io.StringIO()):
+            dead = modbus_fxns.initialize_modbus('tcp', '127.0.0.1', fake_epson.free_port())
+            assert not modbus_fxns.reset_bits(dead, only_dirty=True)
+            dead.close()
+        assert 'items' in modbus_fxns.dirty and any(robot.registers(0, end))
+        assert modbus_fxns.reset_bits(client, only_dirty=True) and not any(robot.registers(0, end))
+        assert not modbus_fxns.dirty
+        client.close()
+    return old_requests, requests, dirty_requests
+
+
+def bench_reset_bits(latencies=(0.0, 0.001, 0.005)):
+    """
+    bench_reset_bits
+
+    reset_bits() at start and after every cycle: old per-item path vs. bulk vs. only dirty
+    """
+    old_requests, requests, dirty_requests = check_reset_bits()
+    print(f"reset bits: all registers 0, {old_requests} -> {requests} requests "
+          f"({dirty_requests} only dirty after a stop-and-go cycle); old reset left counts 33/15 and good slot 33")
+    rng = np.random.default_rng(2)
+    for latency in latencies:
+        with fake_epson.FakeEpson(latency_s=latency) as robot:
+            with quiet():
+                client = robot.client()
+                results = []
+                for reset in (old_reset_bits, modbus_fxns.reset_bits,
+                              lambda client: modbus_fxns.reset_bits(client, only_dirty=True)):
+                    times = []
+                    for _ in range(5 if latency >= 0.002 else n_runs):
+                        modbus_fxns.send_item_coords(client, random_coords(rng, 15), random_coords(rng, 5))
+                        start = time.perf_counter()
+                        reset(client)
+                        times.append(time.perf_counter() - start)
+                    results.append(statistics.median(times) * 1000)
+            print(f"            +{latency * 1000:3.0f} ms/request: old {results[0]:7.2f} ms  bulk {results[1]:6.2f} ms  "
+                  f"only dirty {results[2]:6.2f} ms")
+            client.close()
+
+
+def check_async_ops(seed=0):
+    """
+    check_async_ops
+
+    modbus_async's operations leave the same registers and bits as modbus_fxns', and read
+    cycle_done the same way; wait_cycle_done() gives up on a robot that never finishes or a
+    link that's gone, start_cycle() gets the robot's ack and clears START, and refuses a busy
+    robot or a dead link (RobotState like CycleWaiter); RobotLink closes its client on stop
+    """
+    rng = np.random.default_rng(seed)
+    coords, coords_bad = random_coords(rng, 15), random_coords(rng, 5)
+
+    def sync_ops(client):
+        modbus_fxns.send_item_coords(client, coords, coords_bad)
+        modbus_fxns.send_modbus_coords(client, 2, 123.45, 67.8, False)
+        modbus_fxns.send_target_count(client, 3, False)
+        modbus_fxns.conveyor(client, 'on')
+        modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
+
+    async def async_ops(client):
+        assert await modbus_async.send_item_coords(client, coords, coords_bad)
+        await modbus_async.send_modbus_coords(client, 2, 123.45, 67.8, False)
+        await modbus_async.send_target_count(client, 3, False)
+        await modbus_async.conveyor(client, 'on')
+        assert await modbus_async.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
+
+    async def run_async(robot):
+        client = await robot.async_client()
+        await async_ops(client)
+        done = [await modbus_async.check_robot_cycle_complete(client)]
+        robot.set_cycle_done(False)
+        done.append(await modbus_async.check_robot_cycle_complete(client))
+        state, _ = await modbus_async.wait_cycle_done(client, 0.01, timeout_s=0.1)
+        assert state == RobotState.ERROR_STATE, state
+        client.close()
+        with contextlib.redirect_stderr(io.StringIO()):
+            dead = await modbus_async.initialize_modbus('127.0.0.1', fake_epson.free_port())
+            state, _ = await modbus_async.wait_cycle_done(dead, 0.01, max_failures=3)
+            dead.close()
+        assert state == RobotState.NO_COMM_STATE, state
+        return done
+
+    async def run_handshake(robot):
+        client = await robot.async_client()
+        state, _ = await modbus_async.start_cycle(client)
+        assert state == RobotState.MOVING_STATE and not robot.coil(modbus_fxns.START_COMMAND), state
+        state, _ = await modbus_async.start_cycle(client) # cycle running: cycle_done is off
+        assert state == RobotState.ERROR_STATE and not robot.coil(modbus_fxns.START_COMMAND), state
+        state, _ = await modbus_async.wait_cycle_done(client, 0.01, timeout_s=2.0)
+        assert state == RobotState.WAITING_STATE and len(robot.cycles) == 1, state
+        seconds = await modbus_async.robot_cycle(client, coords[:1], [], poll_s=0.01)
+        assert seconds is not None and len(robot.cycles) == 2, seconds
+        client.close()
+        with contextlib.redirect_stderr(io.StringIO()):
+            dead = await modbus_async.initialize_modbus('127.0.0.1', fake_epson.free_port())
+            state, _ = await modbus_async.start_cycle(dead)
+            assert state == RobotState.NO_COMM_STATE, state
+            assert await modbus_async.robot_cycle(dead, coords[:1], []) is None
+            dead.close()
+
+    seen = []
+    with quiet():
+        for ops in (sync_ops, run_async):
+            with fake_epson.FakeEpson() as robot:
+                if ops is sync_ops:
+                    client = robot.client()
+                    sync_ops(client)
+                    done = [modbus_fxns.check_robot_cycle_complete(client)]
+                    robot.set_cycle_done(False)
+                    done.append(modbus_fxns.check_robot_cycle_complete(client))
+                    client.close()
+                else:
+                    done = asyncio.run(run_async(robot))
+                seen.append((robot.registers(0, modbus_fxns.PICK_TIMES_END), robot.coil(modbus_fxns.START_COMMAND),
+                             robot.coil(modbus_fxns.CONVEYOR_ON), done))
+        with fake_epson.FakeEpson(cycle_s=0.1) as robot:
+            asyncio.run(run_handshake(robot))
+        modbus_fxns.dirty.clear()
+    assert seen[0] == seen[1], seen
+    assert seen[0][1:] == (True, True, [1, 0])
+    # RobotLink from a non-asyncio thread, and one that couldn't connect still stops cleanly
+    with quiet(), contextlib.redirect_stderr(io.StringIO()):
+        with fake_epson.FakeEpson() as robot, modbus_async.RobotLink('127.0.0.1', robot.port) as link:
+            assert link.run(modbus_async.wait_cycle_done, 0.01, timeout_s=1.0)[0] == RobotState.WAITING_STATE
+            client = link.client
+        assert not client.connected
+        with modbus_async.RobotLink('127.0.0.1', fake_epson.free_port()) as link:
+            assert not link.client.connected
+
+
+def process_frame(frame):
+    # main.py's per-frame vision: masks + items
+    img, _, bad_img = camera_fxns.preprocess(frame, True)
+    return camera_fxns.detect_contours([img, bad_img])
+
+
+def sync_stop_and_go(robot, coords, coords_bad):
+    """
+    main.py's stop-and-go robot section (CycleWaiter.cycle()), blocking (no frames processed meanwhile)
+
+    :returns: s from START_COMMAND to done seen, frames processed meanwhile (0)
+    """
+    client = robot.client()
+    modbus_fxns.send_item_coords(client, coords, coords_bad)
+    waiter = robot_handshake.CycleWaiter(0.01, 0.02, seed=0)
+    assert waiter.cycle(client) == RobotState.WAITING_STATE
+    client.close()
+    return waiter.durations[-1], 0
+
+
+async def async_stop_and_go(robot, coords, coords_bad, frame):
+    """
+    the same handshake (modbus_async.robot_cycle, 20 ms polls) as a task, frames processed while it runs
+
+    :returns: s from START_COMMAND to done seen, frames processed meanwhile
+    """
+    client = await robot.async_client()
+    cycle = asyncio.create_task(modbus_async.robot_cycle(client, coords, coords_bad, poll_s=0.02))
+    frames = 0
+    while not cycle.done():
+        await asyncio.to_thread(process_frame, frame)
+        frames += 1
+    client.close()
+    return cycle.result(), frames
+
+
+def sync_fly_loop(robot, frame):
+    """
+    main.py's on the fly loop while the robot works: START acknowledged (CycleWaiter.start()),
+    then a frame and a cycle_done poll at a time, until the cycle is seen done
+
+    :returns: frames per s meanwhile, s from the robot's cycle_done on to main seeing it
+    """
+    client = robot.client()
+    waiter = robot_handshake.CycleWaiter(seed=0)
+    assert waiter.start(client) == RobotState.MOVING_STATE
+    start = waiter.started_at
+    frames = 0
+    while waiter.poll(client) == RobotState.MOVING_STATE:
+        process_frame(frame)
+        frames += 1
+    seen = time.perf_counter()
+    assert waiter.state == RobotState.WAITING_STATE, waiter.state
+    client.close()
+    return frames / (seen - start), seen - robot.cycles[0][1]
+
+
+async def async_fly_loop(robot, frame, poll_s):
+    """
+    the same with modbus_async.start_cycle(), then wait_cycle_done as a task next to the frames
+
+    :returns: frames per s meanwhile, s from the robot's cycle_done on to the task seeing it
+    """
+    client = await robot.async_client()
+    state, start = await modbus_async.start_cycle(client)
+    assert state == RobotState.MOVING_STATE, state
+    cycle = asyncio.create_task(modbus_async.wait_cycle_done(client, poll_s))
+    frames = 0
+    while not cycle.done():
+        await asyncio.to_thread(process_frame, frame)
+        frames += 1
+    client.close()
+    state, seen = cycle.result()
+    assert state == RobotState.WAITING_STATE, state
+    return frames / (seen - start), seen - robot.cycles[0][1]
+
+
+def bench_async(cycle_s=3.2, latency_s=0.005, fly_cycle_s=3.0, poll_s=0.02):
+    """
+    bench_async
+
+    one robot cycle end to end against fake_epson's robot (cycle_s from START_COMMAND), sync
+    (modbus_fxns, blocking) vs. asyncio (modbus_async, vision and handshake as tasks):
+    stop-and-go: main's handshake (acknowledged START, cycle_done polls), frames processed while it runs;
+    on the fly: frames per s with the cycle_done poll in the frame loop vs. on its own task,
+    and how long after the robot is done that's seen
+    """
+    check_async_ops()
+    print("async ops: same registers/bits/cycle_done reads as modbus_fxns")
+    rng = np.random.default_rng(3)
+    coords, coords_bad = random_coords(rng, 15), random_coords(rng, 5)
+    frame, _ = bench_vision.synthetic_belt(15, 5)
+    frame_ms = bench_vision.time_it(lambda: process_frame(frame))
+    with quiet():
+        with fake_epson.FakeEpson(latency_s=latency_s, cycle_s=cycle_s) as robot:
+            sync = sync_stop_and_go(robot, coords, coords_bad)
+        with fake_epson.FakeEpson(latency_s=latency_s, cycle_s=cycle_s) as robot:
+            async_ = asyncio.run(async_stop_and_go(robot, coords, coords_bad, frame))
+            modbus_fxns.dirty.clear()
+    print(f"stop-and-go, {cycle_s} s robot cycle, +{latency_s * 1000:.0f} ms/request, {frame_ms:.1f} ms/frame vision:")
+    print(f"    sync  {sync[0]:5.2f} s START -> done seen, {sync[1]:3d} frames processed meanwhile")
+    print(f"    async {async_[0]:5.2f} s START -> done seen, {async_[1]:3d} frames processed meanwhile")
+    with quiet():
+        with fake_epson.FakeEpson(latency_s=latency_s, cycle_s=fly_cycle_s) as robot:
+            sync = sync_fly_loop(robot, frame)
+        with fake_epson.FakeEpson(latency_s=latency_s, cycle_s=fly_cycle_s) as robot:
+            async_ = asyncio.run(async_fly_loop(robot, frame, poll_s))
+    print(f"on the fly, {fly_cycle_s} s robot cycle:")
+    print(f"    sync  {sync[0]:5.1f} frames/s while it runs, done seen {sync[1] * 1000:4.0f} ms after the robot set it (poll per frame)")
+    print(f"    async {async_[0]:5.1f} frames/s while it runs, done seen {async_[1] * 1000:4.0f} ms after (own task, {poll_s * 1000:.0f} ms polls)")
+
+
+def check_cycle_waiter():
+    """
+    check_cycle_waiter
+
+    CycleWaiter only calls a cycle done after seeing cycle_done drop (the bit is still on from the
+    last cycle until the robot takes START), measures the cycle, and gives up on a robot that never
+    starts/finishes (deadline) or can't be read
+    """
+    with quiet():
+        # robot slow to take START (checks it every 0.2 s): the old done bit is on meanwhile
+        with fake_epson.FakeEpson(cycle_s=0.3, poll_s=0.2) as robot:
+            client = robot.client()
+            waiter = robot_handshake.CycleWaiter(timeout_s=5.0, seed=0)
+            modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
+            started = time.perf_counter()
+            waiter.begin(started)
+            assert modbus_fxns.check_robot_cycle_complete(client) == 1 # robot hasn't seen START yet
+            assert waiter.poll(client) == RobotState.MOVING_STATE # stale done, not this cycle's
+            time.sleep(0.25) # START pulse (on at the end of the cycle = the robot's next cycle)
+            modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 0)
+            state = waiter.wait(client)
+            (robot_start, robot_done), = robot.cycles[:1]
+            seen = time.perf_counter()
+            assert state == RobotState.WAITING_STATE, state
+            assert robot_start > started and seen >= robot_done and seen - robot_done < 0.1, (robot_done, seen)
+            assert abs(waiter.durations[-1] - (seen - started)) < 0.01
+            client.close()
+        # nothing happens: done stuck on (START never taken), then stuck off
+        with fake_epson.FakeEpson() as robot:
+            client = robot.client()
+            waiter = robot_handshake.CycleWaiter(timeout_s=0.2)
+            assert waiter.wait(client, time.perf_counter()) == RobotState.ERROR_STATE
+            robot.set_cycle_done(False)
+            assert waiter.wait(client, time.perf_counter()) == RobotState.ERROR_STATE
+            assert not waiter.durations
+            client.close()
+        # nothing listening (pymodbus logs the refused connections to stderr)
+        with contextlib.redirect_stderr(io.StringIO()):
+            client = modbus_fxns.initialize_modbus('tcp', '127.0.0.1', fake_epson.free_port())
+            assert robot_handshake.CycleWaiter(max_failures=3).wait(client, time.perf_counter()) == RobotState.NO_COMM_STATE
+            client.close()
+
+
+def old_wait(client):
+    # main.py's wait before CycleWaiter
+    time.sleep(2)
+    while modbus_fxns.check_robot_cycle_complete(client) == 0:
+        time.sleep(1)
+
+
+def run_cycles(robot, wait, coords, coords_bad, n_cycles):
+    """
+    stop-and-go robot sections back to back: coords, START pulse (1 s, main's), wait for done
+
+    :returns: cycles per minute, mean s from the robot's done to Python seeing it
+    """
+    client = robot.client()
+    robot.cycles.clear()
+    seen = []
+    start = time.perf_counter()
+    for _ in range(n_cycles):
+        modbus_fxns.send_item_coords(client, coords, coords_bad)
+        modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
+        started = time.perf_counter()
+        time.sleep(1)
+        modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 0)
+        wait(client, started)
+        seen.append(time.perf_counter())
+    elapsed = time.perf_counter() - start
+    client.close()
+    late = [s - done for s, (_, done) in zip(seen, robot.cycles)]
+    return n_cycles * 60.0 / elapsed, statistics.mean(late)
+
+
+def bench_cycle_waiter(cycles=((1.5, 1.5), (2.0, 4.0)), n_cycles=5, latency_s=0.002):
+    """
+    bench_cycle_waiter
+
+    stop-and-go cycles end to end against fake_epson's robot (cycle times uniform in each
+    (low, high) range, from START seen): main's 2 s sleep + 1 s polls vs. CycleWaiter
+    """
+    check_cycle_waiter()
+    print("cycle waiter: waits for the cycle_done edge (not the stale bit), deadline and no-comm errors")
+    rng = np.random.default_rng(4)
+    coords, coords_bad = random_coords(rng, 15), random_coords(rng, 5)
+    for low, high in cycles:
+        results = []
+        waiter = robot_handshake.CycleWaiter(seed=0)
+        for wait in (lambda client, started: old_wait(client), waiter.wait):
+            cycle_s = lambda: float(rng.uniform(low, high))
+            with quiet(), fake_epson.FakeEpson(latency_s=latency_s, cycle_s=cycle_s) as robot:
+                results.append(run_cycles(robot, wait, coords, coords_bad, n_cycles))
+        modbus_fxns.dirty.clear()
+        (old_rate, old_late), (new_rate, new_late) = results
+        print(f"    robot cycle {low}-{high} s: sleep+1 s polls {old_rate:5.1f} cycles/min (done seen {old_late * 1000:4.0f} ms late)"
+              f"  CycleWaiter {new_rate:5.1f} cycles/min ({new_late * 1000:3.0f} ms late, measured "
+              f"{statistics.median(waiter.durations):.2f} s median START->done)  {new_rate / old_rate:4.2f}x")
+
+
+FAST_TIMING = pick_planner.RobotTiming(approach_s=0.15, descend_s=0.1, place_s=0.25, start_s=0.05) # checks, not the robot's
+
+
+def check_handshake(seed=0):
+    """
+    check_handshake
+
+    CycleWaiter.start()/cycle() against fake_epson's Main1 state machine: START held only until
+    the robot drops cycle_done and cleared right away, one cycle per start, the items it picks
+    are the ones sent (stop-and-go order, and by descend time on the fly, not before it),
+    and the errors: robot busy, START not taken (program not running / pallets full)
+    """
+    rng = np.random.default_rng(seed)
+    with quiet():
+        program = fake_epson.EpsonProgram(FAST_TIMING, home_s=0.05, limit_good=4, limit_bad=3)
+        with fake_epson.FakeEpson(program=program) as robot:
+            client = robot.client()
+            waiter = robot_handshake.CycleWaiter(seed=0, ack_timeout_s=0.5)
+            coords, coords_bad = random_coords(rng, 2), random_coords(rng, 1)
+            modbus_fxns.send_item_coords(client, coords, coords_bad)
+            assert waiter.start(client) == RobotState.MOVING_STATE
+            assert not robot.coil(modbus_fxns.START_COMMAND) and program.state == fake_epson.PICKING
+            assert waiter.acks[-1] < 0.05, waiter.acks
+            assert waiter.wait(client) == RobotState.WAITING_STATE
+            assert len(program.cycles) == 1 and program.state == fake_epson.WAIT_START
+            picked = [(p.x, p.y) for p in program.picks]
+            assert np.allclose(picked, coords + coords_bad, atol=0.01 + 1e-9)
+            assert [p.good for p in program.picks] == [True, True, False]
+            expected = FAST_TIMING.start_s + 3 * (FAST_TIMING.approach_s + FAST_TIMING.descend_s + FAST_TIMING.place_s) + 0.05
+            assert expected <= waiter.durations[-1] < expected + 0.1, (expected, waiter.durations)
+
+            # on the fly: good and bad merged by descend time, nobody goes down early
+            modbus_fxns.send_item_coords(client, coords[:1], coords_bad)
+            modbus_fxns.send_pick_times(client, [1.2])
+            modbus_fxns.send_pick_times(client, [0.5], False)
+            modbus_fxns.send_pick_mode(client, True)
+            assert waiter.cycle(client) == RobotState.WAITING_STATE
+            fly = program.picks[3:]
+            assert [p.good for p in fly] == [False, True] and [p.descend_at for p in fly] == [0.5, 1.2]
+            assert all(p.gripped >= p.descend_at + FAST_TIMING.descend_s for p in fly), fly
+
+            # 3rd good makes 4: good pallet full after this cycle, the program ends
+            modbus_fxns.reset_bits(client)
+            modbus_fxns.send_item_coords(client, coords[:1], [])
+            assert waiter.cycle(client) == RobotState.WAITING_STATE
+            assert program.state == fake_epson.FINISHED and program.total_good == 4
+            assert waiter.start(client) == RobotState.ERROR_STATE # nobody in Wait Sw(robot_start)
+            assert not robot.coil(modbus_fxns.START_COMMAND) and len(program.cycles) == 3
+            client.close()
+
+        with fake_epson.FakeEpson(cycle_done=False) as robot:
+            client = robot.client()
+            waiter = robot_handshake.CycleWaiter()
+            assert waiter.start(client) == RobotState.ERROR_STATE # robot busy: START not raised
+            assert robot.function_codes[5] == 0
+            client.close()
+        modbus_fxns.dirty.clear()
+
+
+def pulse_cycle(client, waiter):
+    # main.py's START before CycleWaiter: 1 s pulse, then wait for the cycle_done edge
+    modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
+    waiter.begin()
+    time.sleep(1)
+    modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 0)
+    return waiter.wait(client)
+
+
+def old_cycle(client, waiter):
+    # main.py before CycleWaiter: 1 s pulse, 2 s sleep, 1 s polls
+    modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
+    time.sleep(1)
+    modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 0)
+    old_wait(client)
+    return RobotState.WAITING_STATE
+
+
+def bench_handshake(items=(0, 1, 2), n_cycles=4, latency_s=0.002, settle_s=0.5):
+    """
+    bench_handshake
+
+    stop-and-go cycles end to end against fake_epson's Main1 (pick_planner.DEFAULT_TIMING moves,
+    n items per cycle), conveyor off -> cycle seen done: main's 0.5 s settle sleep + 1 s START
+    pulse + 2 s sleep + 1 s polls, vs. the same with CycleWaiter's polls, vs. no settle sleep
+    (main's settled photos, not simulated here) + acknowledged START + CycleWaiter.
+    With a pulse, a cycle shorter than the pulse runs again: START is still on when Main1 loops
+    """
+    check_handshake()
+    print("handshake: START held until the robot takes it, 1 cycle per start, Main1 picks what was sent; busy/no-ack errors")
+    rng = np.random.default_rng(5)
+    for n in items:
+        coords = random_coords(rng, n)
+        results = []
+        for name, settle, run in (('sleeps', settle_s, old_cycle), ('pulse+waiter', settle_s, pulse_cycle),
+                                  ('ack+waiter', 0.0, lambda client, waiter: waiter.cycle(client))):
+            program = fake_epson.EpsonProgram(limit_good=None, limit_bad=None)
+            with quiet(), fake_epson.FakeEpson(latency_s=latency_s, program=program) as robot:
+                client = robot.client()
+                waiter = robot_handshake.CycleWaiter(seed=0)
+                start = time.perf_counter()
+                for _ in range(n_cycles):
+                    modbus_fxns.conveyor(client, 'off')
+                    time.sleep(settle)
+                    modbus_fxns.send_item_coords(client, coords, [])
+                    assert run(client, waiter) == RobotState.WAITING_STATE
+                    modbus_fxns.reset_bits(client, only_dirty=True)
+                elapsed = time.perf_counter() - start
+                client.close()
+            results.append((name, elapsed / n_cycles, len(program.cycles) - n_cycles))
+        base = results[0][1]
+        print(f"    {n} item(s)/cycle: " + "  ".join(f"{name} {seconds:5.2f} s/cycle ({extra} extra robot cycles)"
+                                                  for name, seconds, extra in results) +
+              f"  {base / results[-1][1]:4.2f}x")
+
+
+if __name__ == '__main__':
+    bench_item_coords()
+    bench_reset_bits()
+    bench_async()
+    bench_cycle_waiter()
+    bench_handshake()
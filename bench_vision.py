@@ -0,0 +1,1003 @@
+"""
+bench_vision
+
+timing (and result checks) for the image processing in camera_fxns,
+run on the saved full-res frame undistorted_frame.jpg
+"""
+import collections
+import itertools
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import cv2
+import numpy as np
+import camera_fxns
+import item_overlay
+import homography
+import calibrate_robot
+import item_tracker
+import pick_planner
+import belt_sim
+
+frame_file = 'undistorted_frame.jpg'
+n_runs = 50
+
+
+def time_it(fn, n=n_runs):
+    """
+    time_it
+
+    :param fn: no-arg function to time
+    :param n: runs
+    :returns: mean ms per call
+    """
+    fn() # warm up (caches, first-call allocations)
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1000
+
+
+def bench_undistort(frame):
+    """
+    bench_undistort
+
+    cv2.undistort every frame vs. camera_fxns.undistort with cached remap tables
+    """
+    mtx, dist = camera_fxns.camera_matrix, camera_fxns.dist_coeffs
+    old = time_it(lambda: cv2.undistort(frame, mtx, dist))
+    new = time_it(lambda: camera_fxns.undistort(frame))
+    diff = cv2.absdiff(cv2.undistort(frame, mtx, dist), camera_fxns.undistort(frame))
+    print(f"undistort  cv2.undistort: {old:7.2f} ms  cached remap: {new:7.2f} ms  ({old / new:.1f}x)  max diff: {diff.max()}")
+
+
+def old_belt_chain(frame):
+    """
+    old_belt_chain
+
+    take_photo() + crop_img() before the fused remap: undistort, rotate, mirror, crop
+    """
+    flipped = cv2.flip(cv2.rotate(camera_fxns.undistort(frame), cv2.ROTATE_180), 1)
+    return camera_fxns.crop_img(flipped)
+
+
+def check_belt_view(frame, tolerance=0):
+    """
+    check_belt_view
+
+    regression check: camera_fxns.belt_view() must give the same belt band as the old chain
+
+    :param tolerance: max allowed per-pixel difference (the fused maps are the same
+        fixed-point maps, just fewer of them, so it should be exact)
+    """
+    old = old_belt_chain(frame)
+    new = camera_fxns.belt_view(frame)
+    assert old.shape == new.shape, (old.shape, new.shape)
+    diff = int(cv2.absdiff(old, new).max())
+    assert diff <= tolerance, f"belt_view differs from the old chain by {diff}"
+    return diff
+
+
+def bench_belt_view(frame):
+    """
+    bench_belt_view
+
+    undistort + rotate + flip + crop vs. one fused remap over just the belt band
+    """
+    old = time_it(lambda: old_belt_chain(frame))
+    new = time_it(lambda: camera_fxns.belt_view(frame))
+    diff = check_belt_view(frame)
+    print(f"belt band  old chain:     {old:7.2f} ms  fused remap:  {new:7.2f} ms  ({old / new:.1f}x)  max diff: {diff}")
+
+
+def synthetic_belt(n_good, n_bad, seed=0, radius=14, touching=0):
+    """
+    synthetic_belt
+
+    belt band with white (good) and orange (bad) caps at known spots, for checks that need
+    ground truth (the saved frame has no labelled items)
+
+    :param n_good, n_bad: caps of each kind
+    :param seed: random seed, same seed = same frame
+    :param radius: cap radius in px (14 px ~ 615 px area, inside find_items' 500-800 window)
+    :param touching: extra good/bad pairs drawn touching each other
+    :returns: frame (208x1190 BGR), items as list of (x, y, good) cap centers
+    """
+    rng = np.random.default_rng(seed)
+    h, w = 208, 1190
+    frame = np.full((h, w, 3), 35, dtype=np.uint8)
+    frame = cv2.add(frame, rng.integers(0, 12, (h, w, 3), dtype=np.uint8)) # sensor noise
+    items = []
+
+    def free(x, y, r):
+        return all((x - ix) ** 2 + (y - iy) ** 2 > (r + 2 * radius + 6) ** 2 for ix, iy, _ in items)
+
+    kinds = [True] * n_good + [False] * n_bad + [None] * touching
+    for good in kinds:
+        for _ in range(1000):
+            x = int(rng.integers(radius + 2, w - 3 * radius - 4))
+            y = int(rng.integers(radius + 2, h - radius - 2))
+            if free(x, y, 2 * radius if good is None else 0):
+                break
+        else:
+            raise ValueError("too many caps for the belt")
+        pair = [(x, y, True), (x + 2 * radius, y, False)] if good is None else [(x, y, good)]
+        for cx, cy, g in pair:
+            color = (235, 235, 235) if g else (0, 140, 255)
+            cv2.circle(frame, (cx, cy), radius, color, -1)
+            items.append((cx, cy, g))
+    return frame, items
+
+
+def belt_corpus(n_frames=10, max_items=33):
+    """
+    belt_corpus
+
+    :returns: list of (synthetic belt frame, cap centers), from empty to max_items caps
+    """
+    corpus = []
+    for i in range(n_frames):
+        n = round(i * max_items / (n_frames - 1))
+        corpus.append(synthetic_belt(n - n // 3, n // 3, seed=i, touching=i % 3))
+    return corpus
+
+
+def two_mask_items(belt):
+    """
+    two_mask_items
+
+    old path: a hsv mask per class and a findContours pass per mask
+    """
+    img, cropped, bad_img = camera_fxns.preprocess(belt, True)
+    return [camera_fxns.find_items(img, cropped, True), camera_fxns.find_items(bad_img, cropped, False)]
+
+
+def contour_items(belt, lut_bits=None):
+    """
+    contour_items
+
+    main.py's detector: two-mask path as Detections (detect_contours(), nothing drawn)
+    """
+    img, _, bad_img = camera_fxns.preprocess(belt, True, lut_bits=lut_bits)
+    return camera_fxns.item_coords(camera_fxns.detect_contours([img, bad_img]))
+
+
+def item_set(coords):
+    """
+    :returns: set of (x, y, good) from [good coords, bad coords]
+    """
+    return {(x, y, good) for good, c in zip((True, False), coords) for x, y in c}
+
+
+def check_detections(frame, corpus):
+    """
+    check_detections
+
+    regression check: detect_contours() finds exactly find_items()' items on the saved
+    frame's belt band, and on frames with known caps those are the caps that were drawn
+    (bbox centers, within half a pixel)
+
+    :returns: items found over all synthetic frames
+    """
+    saved = camera_fxns.belt_view(frame)
+    assert item_set(contour_items(saved)) == item_set(two_mask_items(saved.copy()))
+    found = 0
+    for belt, caps in corpus:
+        new = item_set(contour_items(belt))
+        assert new == item_set(two_mask_items(belt.copy()))
+        assert len(new) == len(caps), (len(new), len(caps))
+        for x, y, good in caps:
+            assert any(abs(x - nx) <= 0.5 and abs(y - ny) <= 0.5 and good == ng for nx, ny, ng in new), (x, y, good)
+        found += len(new)
+    return found
+
+
+def bench_detections(frame, corpus):
+    """
+    bench_detections
+
+    find_items() on both masks (drawing on the frame) vs. detect_contours() (data only),
+    on the saved frame's belt band and the synthetic corpus
+    """
+    found = check_detections(frame, corpus)
+    frames = [camera_fxns.belt_view(frame)] + [belt for belt, _ in corpus]
+    # find_items draws on the frame it's given, so each run gets fresh copies
+    old = time_it(lambda: [two_mask_items(belt.copy()) for belt in frames]) / len(frames)
+    new = time_it(lambda: [contour_items(belt.copy()) for belt in frames]) / len(frames)
+    print(f"detect     find_items:    {old:7.2f} ms  detect_contours: {new:7.2f} ms  ({old / new:.1f}x)  "
+          f"same {found} items on {len(corpus)} synthetic frames + the saved frame")
+
+
+def bench_bgr_lut(frame, corpus, bits=5):
+    """
+    bench_bgr_lut
+
+    quantized BGR table vs. the exact hsv thresholds: pixel and item agreement on the
+    saved frame + synthetic corpus, and preprocess() speed (both masks) on the 1190x208 belt band
+
+    :param bits: bits per channel of the table
+    """
+    camera_fxns._bgr_luts.clear()
+    start = time.perf_counter()
+    camera_fxns.get_bgr_lut(bits=bits) # built the first time, from LABEL_LUT_CACHE_DIR after that
+    load_ms = (time.perf_counter() - start) * 1000
+
+    frames = [camera_fxns.belt_view(frame)] + [belt for belt, _ in corpus]
+    blurs = [cv2.GaussianBlur(belt, (7, 7), 0) for belt in frames]
+    same = total = 0
+    for blur in blurs:
+        exact = camera_fxns.label_hsv(cv2.cvtColor(blur, cv2.COLOR_BGR2HSV))
+        same += np.count_nonzero(exact == camera_fxns.label_bgr(blur, bits=bits))
+        total += exact.size
+    missed = extra = 0
+    for belt, _ in corpus:
+        exact = item_set(contour_items(belt))
+        table = item_set(contour_items(belt, lut_bits=bits))
+        missed += len(exact - table)
+        extra += len(table - exact)
+
+    hsv_ms = time_it(lambda: [camera_fxns.preprocess(belt, True) for belt in frames]) / len(frames)
+    bgr_ms = time_it(lambda: [camera_fxns.preprocess(belt, True, lut_bits=bits) for belt in frames]) / len(frames)
+    print(f"masks      hsv inRange:   {hsv_ms:7.2f} ms  {1 << 3 * bits} BGR table: {bgr_ms:7.2f} ms  "
+          f"({hsv_ms / bgr_ms:.1f}x, blur included)  table ready in {load_ms:.0f} ms")
+    print(f"           BGR table vs exact: {same / total:.4%} of pixels the same, "
+          f"{missed} items missed / {extra} extra on {len(corpus)} synthetic frames")
+    return missed + extra
+
+
+def contour_centers(mask):
+    """
+    contour_centers
+
+    find_items()' contour mode without the drawing, to time just the detection
+    """
+    coords = []
+    for contour in cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)[0]:
+        area = cv2.contourArea(contour)
+        if camera_fxns.ITEM_MIN_AREA < area < camera_fxns.ITEM_MAX_AREA:
+            x, y, w, h = cv2.boundingRect(contour)
+            coords.append([x + 0.5 * w, y + 0.5 * h])
+    return coords
+
+
+def bench_item_density(max_items=33):
+    """
+    bench_item_density
+
+    detection only: findContours + per-contour loop on one white mask, from an empty belt to
+    max_items caps (main.max_items); and what find_items() adds by drawing
+    """
+    for n in (0, 1, 5, 10, 20, max_items):
+        white, cropped, _ = camera_fxns.preprocess(synthetic_belt(n, 0, seed=n)[0], True)
+        scratch = np.zeros_like(cropped) # find_items draws, so give it something else to draw on
+        contours = time_it(lambda: contour_centers(white), n=200)
+        drawn = time_it(lambda: camera_fxns.find_items(white, scratch, True), n=200)
+        print(f"items      {n:2d} items: contours {contours:6.3f} ms  {drawn - contours:+6.3f} ms drawing")
+
+
+def subpixel_belt(n_items, seed=0, radius=14, scale=8):
+    """
+    subpixel_belt
+
+    synthetic_belt() with the caps at sub-pixel spots: drawn at scale x the resolution and
+    area-averaged down, so the edges are anti-aliased like a real camera's
+
+    :returns: frame (208x1190 BGR), (n,2) true centers in pixel index coords, (n,) good
+    """
+    rng = np.random.default_rng(seed)
+    h, w = 208, 1190
+    big = np.full((h * scale, w * scale, 3), 35, dtype=np.uint8)
+    centers, goods = [], []
+    while len(centers) < n_items:
+        x, y = rng.uniform((radius + 3, radius + 3), (w - radius - 3, h - radius - 3))
+        if all((x - cx) ** 2 + (y - cy) ** 2 > (2 * radius + 6) ** 2 for cx, cy in centers):
+            good = bool(rng.integers(0, 2))
+            # big pixel X is 1x pixel (X + 0.5) / scale - 0.5 (pixel index coords, both)
+            X, Y = int(round((x + 0.5) * scale - 0.5)), int(round((y + 0.5) * scale - 0.5))
+            cv2.circle(big, (X, Y), radius * scale, (235, 235, 235) if good else (0, 140, 255), -1)
+            centers.append(((X + 0.5) / scale - 0.5, (Y + 0.5) / scale - 0.5))
+            goods.append(good)
+    frame = cv2.resize(big, (w, h), interpolation=cv2.INTER_AREA)
+    frame = cv2.add(frame, rng.integers(0, 12, (h, w, 3), dtype=np.uint8)) # sensor noise
+    return frame, np.array(centers), np.array(goods)
+
+
+def centroid_errors(frames, centers='bbox', weighted=False):
+    """
+    centroid_errors
+
+    detect_contours() on subpixel_belt() frames, matched to the true centers
+
+    :returns: (N,2) x, y errors (px), (N,2) reported sigmas (None for bbox)
+    """
+    errors, sigmas = [], []
+    for frame, truth, _ in frames:
+        white, cropped, orange = camera_fxns.preprocess(frame, True)
+        weights = cv2.cvtColor(cropped, cv2.COLOR_BGR2GRAY) if weighted else None
+        items = camera_fxns.detect_contours([white, orange], centers=centers, weights=weights)
+        assert len(items.centers) == len(truth), (len(items.centers), len(truth))
+        nearest = np.linalg.norm(items.centers[:, None] - truth[None], axis=2).argmin(axis=1)
+        assert len(set(nearest.tolist())) == len(truth)
+        errors.append(items.centers - truth[nearest])
+        if items.sigmas is not None:
+            sigmas.append(items.sigmas)
+    return np.vstack(errors), (np.vstack(sigmas) if sigmas else None)
+
+
+def check_centroids(frames):
+    """
+    check_centroids
+
+    moments centers on sub-pixel ground truth: no bias, clearly tighter than bbox centers
+    (which sit +0.5 px off in pixel index coords), reported sigmas in the right range,
+    and touching good/bad items still get a centroid each (one mask per class)
+
+    :returns: {mode: (errors, sigmas)}
+    """
+    results = {'bbox': centroid_errors(frames), 'moments': centroid_errors(frames, 'moments'),
+               'weighted': centroid_errors(frames, 'moments', weighted=True)}
+    bbox, _ = results['bbox']
+    assert np.abs(bbox.mean(axis=0) - 0.5).max() < 0.1, bbox.mean(axis=0) # the half pixel
+    for mode in ('moments', 'weighted'):
+        errors, sigmas = results[mode]
+        assert np.abs(errors.mean(axis=0)).max() < 0.05, (mode, errors.mean(axis=0))
+        assert np.sqrt(np.mean(errors ** 2)) < 0.5 * np.sqrt(np.mean((bbox - 0.5) ** 2)), mode
+        assert sigmas.shape == errors.shape and (sigmas > 0).all() and (sigmas < 0.5).all()
+
+    # touching good/bad pair: every part centered on its own cap, not on the pair
+    frame, truth = synthetic_belt(4, 4, seed=3, touching=2)
+    white, _, orange = camera_fxns.preprocess(frame, True)
+    items = camera_fxns.detect_contours([white, orange], centers='moments')
+    truth = np.array([(x, y) for x, y, _ in truth], dtype=np.float64)
+    assert len(items.centers) == len(truth)
+    assert np.linalg.norm(items.centers[:, None] - truth[None], axis=2).min(axis=1).max() < 1.0
+    return results
+
+
+def bench_centroids(n_frames=8, n_items=25):
+    """
+    bench_centroids
+
+    accuracy on sub-pixel ground truth and cost of detect_contours()' bbox centers vs.
+    mask moments vs. gray-weighted moments
+    """
+    frames = [subpixel_belt(n_items, seed=i) for i in range(n_frames)]
+    results = check_centroids(frames)
+    print(f"centroids  {n_frames * n_items} caps at sub-pixel spots, error vs truth (pixel index coords):")
+    for mode, (errors, sigmas) in results.items():
+        rms = np.sqrt(np.mean(errors ** 2, axis=0))
+        line = (f"           {mode:8s}: bias ({errors[:, 0].mean():+.3f}, {errors[:, 1].mean():+.3f}) px  "
+                f"rms ({rms[0]:.3f}, {rms[1]:.3f}) px  max {np.abs(errors).max():.3f} px")
+        if sigmas is not None:
+            line += f"  reported sigma {sigmas.mean():.3f} px"
+        else:
+            unbiased = errors - errors.mean(axis=0)
+            line += f"  rms without the bias ({np.sqrt(np.mean(unbiased[:, 0] ** 2)):.3f}, {np.sqrt(np.mean(unbiased[:, 1] ** 2)):.3f})"
+        print(line)
+    for n in (5, 33):
+        white, cropped, orange = camera_fxns.preprocess(subpixel_belt(n, seed=50 + n)[0], True)
+        masks = [white, orange]
+        gray = cv2.cvtColor(cropped, cv2.COLOR_BGR2GRAY)
+        bbox = time_it(lambda: camera_fxns.detect_contours(masks), n=200)
+        moments = time_it(lambda: camera_fxns.detect_contours(masks, centers='moments'), n=200)
+        weighted = time_it(lambda: camera_fxns.detect_contours(masks, centers='moments', weights=gray), n=200)
+        print(f"           {n:2d} items: bbox {bbox:6.3f} ms  moments {moments:6.3f} ms ({moments - bbox:+.3f})  "
+              f"weighted {weighted:6.3f} ms ({weighted - bbox:+.3f})")
+
+
+def moving_belt(n_frames, speed=90.0, fps=10.0, spacing=60.0, seed=0, radius=14, render=True):
+    """
+    moving_belt
+
+    caps riding the belt to the right at speed px/s, seen every 1/fps s: new caps come in on
+    the left every ~spacing px of belt travel (random y, random class) and leave on the right
+
+    :param render: draw the frames (else just the true positions, for quick tracker runs)
+    :returns: list of (t, frame or None, (n,2) true centers, (n,) true ids, (n,) labels)
+    """
+    rng = np.random.default_rng(seed)
+    h, w = 208, 1190
+    # belt position (px) of every cap, placed on a long strip that moves past the view
+    n_caps = int((speed * n_frames / fps + w) / spacing) + 2
+    strip_x = -np.arange(n_caps) * spacing - rng.uniform(0, spacing / 3, n_caps) + w
+    strip_y = rng.uniform(radius + 4, h - radius - 4, n_caps)
+    labels = rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], n_caps)
+    sequence = []
+    for k in range(n_frames):
+        t = k / fps
+        x = strip_x + speed * t
+        # only caps all the way in the view (partial ones are under detect_contours()' area window)
+        inside = np.flatnonzero((x > radius + 1) & (x < w - radius - 2))
+        centers = np.column_stack((x[inside], strip_y[inside]))
+        frame = None
+        if render:
+            frame = np.full((h, w, 3), 35, dtype=np.uint8)
+            frame = cv2.add(frame, rng.integers(0, 12, (h, w, 3), dtype=np.uint8))
+            for (cx, cy), label in zip(centers, labels[inside]):
+                color = (235, 235, 235) if label == camera_fxns.LABEL_GOOD else (0, 140, 255)
+                cv2.circle(frame, (int(round(cx * 16)), int(round(cy * 16))), radius * 16, color, -1, shift=4)
+        sequence.append((t, frame, centers, inside, labels[inside]))
+    return sequence
+
+
+def track_sequence(tracker, observations):
+    """
+    track_sequence
+
+    runs the tracker over (t, centers, classes, true ids) observations
+
+    :returns: id switches (a true cap given a new tracker id, or a tracker id moving to another cap),
+        {true id: set of tracker ids}
+    """
+    given = collections.defaultdict(set)
+    last_id, owner = {}, {}
+    switches = 0
+    for t, centers, classes, true_ids in observations:
+        _, ids = tracker.update(centers, classes, t)
+        for true_id, item_id in zip(true_ids.tolist(), ids.tolist()):
+            # counted once when it happens (a swap of two caps' ids counts 2)
+            if last_id.get(true_id, item_id) != item_id or owner.get(item_id, true_id) != true_id:
+                switches += 1
+            last_id[true_id] = item_id
+            owner[item_id] = true_id
+            given[true_id].add(item_id)
+    return switches, given
+
+
+def check_tracker(fps=10.0, speed=90.0):
+    """
+    check_tracker
+
+    tracker on rendered moving-belt frames through preprocess()/detect_contours(): every cap keeps
+    one id, the belt speed comes out within 1%, positions predicted 1 s ahead are within 2 px,
+    and after halt() predictions stay where the belt stopped. On point sequences with 20% of
+    detections dropped and 1 px noise, greedy and Hungarian both keep every id
+
+    :returns: tracker (rendered run)
+    """
+    sequence = moving_belt(40, speed, fps)
+    tracker = item_tracker.ItemTracker()
+    observations = []
+    for t, frame, centers, true_ids, _ in sequence:
+        white, _, orange = camera_fxns.preprocess(frame, True)
+        items = camera_fxns.detect_contours([white, orange], centers='moments')
+        near = np.linalg.norm(items.centers[:, None] - centers[None], axis=2)
+        assert len(items.centers) == len(centers) and (near.min(axis=1) < 1.0).all()
+        observations.append((t, items.centers, items.classes, true_ids[near.argmin(axis=1)]))
+    switches, given = track_sequence(tracker, observations)
+    assert switches == 0, switches
+    assert np.abs(tracker.velocity - (speed, 0)).max() < speed * 0.01, tracker.velocity
+
+    # the belt is rigid: 1 s later every cap in the last frame is speed px further right
+    t_last, _, centers, true_ids, _ = sequence[-1]
+    later = tracker.predict(t_last + 1.0, ids=[min(given[true_id]) for true_id in true_ids.tolist()])
+    error = np.linalg.norm(later - (centers + (speed, 0)), axis=1).max()
+    assert error < 2.0, error
+
+    # belt stops 0.05 s after the last frame for 10 s: predictions stay put, then go on from there,
+    # and the first frame after the restart keeps ids and the measured speed (the stop isn't travel)
+    tracker.halt(t_last + 0.05)
+    stopped = tracker.predict(t_last + 0.05)
+    assert np.allclose(tracker.predict(t_last + 5), stopped)
+    tracker.resume(t_last + 10.05)
+    assert np.allclose(tracker.predict(t_last + 10.15), stopped + tracker.velocity * 0.1)
+    t_next = t_last + 10.0 + 1 / fps
+    _, ids = tracker.update(centers + (speed / fps, 0), sequence[-1][4], t_next)
+    assert ids.tolist() == [min(given[true_id]) for true_id in true_ids.tolist()]
+    assert np.abs(tracker.velocity - (speed, 0)).max() < speed * 0.01, tracker.velocity
+
+    rng = np.random.default_rng(3)
+    points = moving_belt(200, speed, fps, render=False, seed=1)
+    for assignment in ('greedy', 'hungarian'):
+        observations = []
+        for t, _, centers, true_ids, labels in points:
+            keep = rng.random(len(centers)) > 0.2
+            observations.append((t, centers[keep] + rng.normal(0, 1, (keep.sum(), 2)), labels[keep], true_ids[keep]))
+        # max_missed 8: a cap dropped 9 frames in a row (0.2^9) is the only way to a new id
+        switches, _ = track_sequence(item_tracker.ItemTracker(max_missed=8, assignment=assignment), observations)
+        assert switches == 0, (assignment, switches)
+    return tracker
+
+
+def bench_tracker(fps=10.0):
+    """
+    bench_tracker
+
+    tracker cost per frame at belt photo item counts, and how fast the belt can go (px per
+    frame vs. the space between caps) before greedy / Hungarian start swapping ids
+    """
+    tracker = check_tracker(fps)
+    print(f"tracker    rendered moving belt: ids kept, belt speed {tracker.velocity[0]:.1f} px/s (true 90.0), "
+          f"1 s prediction within 2 px")
+    rng = np.random.default_rng(4)
+    for n in (5, 33):
+        centers = rng.uniform((0, 0), (1190, 208), (n, 2))
+        classes = rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], n)
+        for assignment in ('greedy', 'hungarian'):
+            tracker = item_tracker.ItemTracker(assignment=assignment)
+            tracker.update(centers, classes, 0.0)
+            step = [0.0]
+
+            def update():
+                step[0] += 0.1
+                tracker.update(centers + (9 * step[0] * 10, 0), classes, step[0])
+
+            print(f"           {n:2d} items {assignment:9s}: {time_it(update, n=300):6.3f} ms per frame")
+    print("           id switches, 200 frames, 20% dropped, 1 px noise, caps ~40 px apart "
+          "(greedy / hungarian, from standstill | from the belt speed):")
+    for per_frame in (10, 20, 30, 40):
+        counts = []
+        for assignment, velocity in itertools.product(('greedy', 'hungarian'), ((0, 0), (per_frame * fps, 0))):
+            points = moving_belt(200, per_frame * fps, fps, spacing=40.0, render=False, seed=7)
+            drop = np.random.default_rng(8)
+            observations = []
+            for t, _, centers, true_ids, labels in points:
+                keep = drop.random(len(centers)) > 0.2
+                observations.append((t, centers[keep] + drop.normal(0, 1, (keep.sum(), 2)), labels[keep], true_ids[keep]))
+            tracker = item_tracker.ItemTracker(max_missed=8, assignment=assignment, max_distance=per_frame + 10,
+                                               velocity=velocity)
+            counts.append(track_sequence(tracker, observations)[0])
+        print(f"           {per_frame:2d} px/frame: {counts[0]:4d} / {counts[2]:4d} | {counts[1]:4d} / {counts[3]:4d}")
+
+
+
+def check_pick_planner(speed=90.0, fps=10.0):
+    """
+    check_pick_planner
+
+    on a tracked moving belt (exact centers): planned grip spots are where the caps really are
+    at grip time, descend times follow the robot timing, everything planned is in reach, and
+    excluded / just-seen / already-past caps aren't planned
+
+    :returns: PickPlan
+    """
+    model = belt_sim.default_model()
+    timing = pick_planner.DEFAULT_TIMING
+    points = moving_belt(30, speed, fps, spacing=150.0, render=False, seed=2)
+    tracker = item_tracker.ItemTracker()
+    for t, _, centers, _, labels in points:
+        tracker.update(centers, labels, t)
+    t_last, _, centers, true_ids, labels = points[-1]
+    start = t_last + 0.05
+    plan = pick_planner.plan_picks(tracker, model, start, timing)
+    assert len(plan.ids) >= 2, plan
+    rows = {item_id: row for row, item_id in enumerate(tracker.tracks.ids.tolist())}
+    for item_id, pixel, grip in zip(plan.ids.tolist(), plan.pixels, plan.grip_at):
+        # rigid belt: where that cap is at grip time
+        truth = tracker.tracks.centers[rows[item_id]] + (speed * (grip - t_last), 0)
+        assert np.linalg.norm(pixel - truth) < 0.5, (pixel, truth)
+    assert pick_planner.in_reach(plan.pixels, margin=10.0).all()
+    assert np.allclose(plan.grip_at - plan.start, plan.descend_at + timing.descend_s)
+    gaps = np.diff(plan.grip_at)
+    assert (gaps >= timing.place_s + timing.approach_s + timing.descend_s - 1e-9).all(), gaps
+    assert plan.descend_at[0] >= timing.start_s + timing.approach_s
+    assert np.allclose(plan.world, homography.to_world(model, plan.pixels, plan.classes))
+    # nothing past the window, nothing excluded, one pick when asked
+    past = tracker.tracks.ids[tracker.predict(start)[:, 0] > pick_planner.REACH_WINDOW[2]]
+    assert not set(plan.ids.tolist()) & set(past.tolist())
+    again = pick_planner.plan_picks(tracker, model, start, timing, exclude=plan.ids[:1], max_picks=1)
+    assert len(again.ids) == 1 and again.ids[0] != plan.ids[0]
+    # a cap seen once (belt speed not measured on it yet) waits for the next frames
+    tracker.update(np.vstack((centers + (speed / fps, 0), (600.0, 100.0))), np.append(labels, labels[0]), t_last + 1 / fps)
+    fresh = tracker.tracks.ids[-1]
+    assert fresh not in pick_planner.plan_picks(tracker, model, t_last + 1 / fps, timing).ids
+    return plan
+
+
+def bench_pick_on_the_fly(rates=(6, 10, 15, 20, 30), seconds=600.0):
+    """
+    bench_pick_on_the_fly
+
+    belt_sim: picked items per minute, stop-and-go (main.py's sleeps) vs. pick on the fly
+    (pick_planner, 1 item per robot cycle), at a few cap arrival rates. Robot timing is
+    pick_planner.DEFAULT_TIMING (a guess until measured), belt 90 px/s
+    """
+    plan = check_pick_planner()
+    print(f"pick plan  {len(plan.ids)} picks, grip spots within 0.5 px of the caps at grip time, "
+          f"first descend at {plan.descend_at[0]:.2f} s")
+    model = belt_sim.default_model()
+    start = time.perf_counter()
+    for rate in rates:
+        stop = belt_sim.simulate('stop', rate, seconds, model=model)
+        fly = belt_sim.simulate('fly', rate, seconds, model=model)
+        print(f"           {rate:2d} caps/min: stop-and-go {stop.items_per_min:5.1f}/min (belt on "
+              f"{stop.belt_running * 100:3.0f}%)  on the fly {fly.items_per_min:5.1f}/min "
+              f"({fly.failed} failed grabs, {fly.missed} caps went by)")
+        if rate >= 15:
+            assert fly.items_per_min > stop.items_per_min, (stop, fly)
+        assert fly.failed < 0.2 * fly.picked, fly
+    print(f"           ({len(rates) * 2} x {seconds:.0f} s simulated in {time.perf_counter() - start:.1f} s)")
+
+
+
+def loop_rate(step, frames, seconds=2.0):
+    """
+    loop_rate
+
+    :param step: fn(belt) run for every frame, cycling through frames
+    :returns: frames per second
+    """
+    n = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        step(frames[n % len(frames)])
+        n += 1
+    return n / (time.perf_counter() - start)
+
+
+def bench_overlay(corpus, rate_hz=5):
+    """
+    bench_overlay
+
+    detection loop throughput: drawing every frame (find_items(), old way) vs. pure
+    detection headless vs. detection + OverlayRenderer at rate_hz, inline and drawn on its own
+    thread. No display on the bench box, so show just notes the thread it was called on:
+    always the submitting (main) one, HighGUI can't show from a worker on Qt/Cocoa
+    """
+    frames = [belt for belt, _ in corpus]
+
+    def detect(belt):
+        white, cropped, orange = camera_fxns.preprocess(belt, True)
+        items = camera_fxns.detect_contours([white, orange])
+        camera_fxns.item_coords(items)
+        return cropped, items
+
+    # detection must leave the frame alone, the overlay draws on its own copy
+    before = frames[-1].copy()
+    with item_overlay.OverlayRenderer(1000, threaded=False, show=lambda img: False) as overlay:
+        overlay.submit(*detect(frames[-1]))
+    assert overlay.drawn == 1 and np.array_equal(before, frames[-1])
+
+    def draw_every_frame(belt):
+        belt = belt.copy() # drawn on
+        two_mask_items(belt)
+
+    drawn = loop_rate(draw_every_frame, frames)
+    headless = loop_rate(lambda belt: (belt.copy(), detect(belt)), frames)
+    print(f"overlay    draw every frame: {drawn:6.0f} frames/s  headless: {headless:6.0f} frames/s")
+    for threaded in (False, True):
+        shown_on = set()
+        show = lambda img: shown_on.add(threading.current_thread()) or False
+        with item_overlay.OverlayRenderer(rate_hz, threaded=threaded, show=show) as overlay:
+            rate = loop_rate(lambda belt: (belt.copy(), overlay.submit(*detect(belt))), frames)
+        assert overlay.drawn > 0 and shown_on == {threading.main_thread()}, shown_on
+        mode = 'drawn on own thread' if threaded else 'inline             '
+        print(f"           overlay {rate_hz} Hz {mode}: {rate:6.0f} frames/s  ({overlay.drawn} of {overlay.submitted} drawn)")
+
+
+def random_homography(rng, H):
+    """
+    :returns: H with every entry jittered by up to 5%, for property checks
+    """
+    return H * (1 + rng.uniform(-0.05, 0.05, H.shape))
+
+
+def check_pix_to_world(n_cases=2000, seed=0):
+    """
+    check_pix_to_world
+
+    property check: for random homographies, 0-33 random item centers anywhere on the belt
+    and random classes, pix_to_world() matches convert_pix_to_world() point by point within 1e-9.
+    Raw camera pixels (where the belt_view() remap samples each belt pixel from) go
+    through pix_to_world(raw_size=...) to the same robot coordinates too
+
+    :returns: largest difference, largest raw point difference (mm)
+    """
+    rng = np.random.default_rng(seed)
+    H0 = camera_fxns.calculate_homography()
+    w, h = camera_fxns.BELT_CROP[2:]
+    worst = 0.0
+    for _ in range(n_cases):
+        H = random_homography(rng, H0)
+        n = int(rng.integers(0, 34))
+        points = rng.uniform((0, 0), (w, h), (n, 2))
+        points[: n // 2] = np.round(points[: n // 2] * 2) / 2 # bbox centers are on half pixels
+        classes = rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], n)
+        batch = camera_fxns.pix_to_world(points, classes, H)
+        scalar = [camera_fxns.convert_pix_to_world(x, y, H, c == camera_fxns.LABEL_GOOD)
+                  for (x, y), c in zip(points, classes)]
+        assert batch.shape == (n, 2)
+        if n:
+            worst = max(worst, float(np.abs(batch - np.array(scalar)).max()))
+    assert worst <= 1e-9, worst
+
+    # raw pixels of belt pixels from the float undistort maps, back through the batch transform
+    size = (1280, 1024)
+    map_x, map_y = cv2.initUndistortRectifyMap(camera_fxns.camera_matrix, camera_fxns.dist_coeffs, None,
+                                               camera_fxns.camera_matrix, size, cv2.CV_32FC1)
+    x0, y0 = camera_fxns.BELT_CROP[:2]
+    cols, rows = rng.integers(0, w, 500), rng.integers(0, h, 500)
+    src = (size[1] - 1 - (y0 + rows), x0 + cols)
+    raw = np.column_stack((map_x[src], map_y[src]))
+    classes = rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], len(raw))
+    belt = camera_fxns.pix_to_world(np.column_stack((cols, rows)), classes, H0)
+    raw_worst = float(np.abs(camera_fxns.pix_to_world(raw, classes, H0, raw_size=size) - belt).max())
+    assert raw_worst < 0.01, raw_worst # float32 maps, ~1e-4 px
+    return worst, raw_worst
+
+
+def bench_pix_to_world():
+    """
+    bench_pix_to_world
+
+    convert_pix_to_world() per item (main's loop) vs. one pix_to_world() call, at item counts
+    a belt photo really has
+    """
+    worst, raw_worst = check_pix_to_world()
+    print(f"pix->world batch vs per point: max diff {worst:.1e} mm, from raw pixels {raw_worst:.1e} mm")
+    H = camera_fxns.calculate_homography()
+    rng = np.random.default_rng(1)
+    for n in (1, 5, 15, 33):
+        points = rng.uniform((0, 0), camera_fxns.BELT_CROP[2:], (n, 2))
+        classes = rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], n)
+        scalar = time_it(lambda: [camera_fxns.convert_pix_to_world(x, y, H, c == camera_fxns.LABEL_GOOD)
+                                  for (x, y), c in zip(points.tolist(), classes)], n=500)
+        batch = time_it(lambda: camera_fxns.pix_to_world(points, classes, H), n=500)
+        raw = time_it(lambda: camera_fxns.pix_to_world(points, classes, H, raw_size=(1280, 1024)), n=500)
+        print(f"           {n:2d} items: per point {scalar * 1000:7.1f} us  batch {batch * 1000:6.1f} us "
+              f"({scalar / batch:4.1f}x)  batch from raw pixels {raw * 1000:6.1f} us")
+
+
+def check_homography_file():
+    """
+    check_homography_file
+
+    the saved calibration artifact: loads to the same H/offsets it was built from, to_world()
+    matches pix_to_world(), a new file is picked up by HomographyFile.model, and files with a
+    broken hash, another camera calibration or a wrong H_inv are turned down (old model kept)
+
+    :returns: HomographyFile on a temp copy (for bench_homography)
+    """
+    tmp = os.path.join(tempfile.mkdtemp(), 'homography.json')
+    model = homography.build_model(camera_fxns.CALIBRATION_IMG_PTS, camera_fxns.CALIBRATION_ROBOT_PTS)
+    assert np.allclose(model.H, camera_fxns.calculate_homography(), atol=1e-12)
+    assert float(model.residuals.max()) < 1e-3 # 4 points, exact fit (up to findHomography's solver)
+    homography.save_model(model, tmp)
+    loaded = homography.load_model(tmp)
+    assert loaded.sha1 == model.sha1 and loaded.offsets == camera_fxns.CLASS_OFFSETS
+    assert np.array_equal(loaded.H, model.H) and np.array_equal(loaded.H_inv, model.H_inv)
+
+    rng = np.random.default_rng(0)
+    points = rng.uniform((0, 0), camera_fxns.BELT_CROP[2:], (33, 2))
+    classes = rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], 33)
+    assert np.array_equal(homography.to_world(loaded, points, classes),
+                          camera_fxns.pix_to_world(points, classes, model.H))
+
+    calib = homography.HomographyFile(tmp)
+    assert calib.model.sha1 == model.sha1 and calib.reloads == 0
+
+    # new offsets -> new hash, picked up on the next .model
+    moved = homography.build_model(model.img_pts, model.robot_pts, {camera_fxns.LABEL_GOOD: (-14, 8),
+                                                                    camera_fxns.LABEL_BAD: (-17, 7)})
+    assert moved.sha1 != model.sha1
+    homography.save_model(moved, tmp)
+    os.utime(tmp, ns=(0, 1)) # same size, make sure the stamp differs even on coarse mtime
+    assert calib.model.sha1 == moved.sha1 and calib.reloads == 1
+    assert calib.model is calib.model # unchanged file isn't read again
+
+    def rewrite(content, rehash, stamp):
+        if rehash:
+            content.pop('sha1', None)
+            content['sha1'] = homography._hash(content)
+        with open(tmp, 'w') as json_file:
+            json.dump(content, json_file)
+        os.utime(tmp, ns=(0, stamp))
+
+    with open(tmp, 'r') as json_file:
+        good = json.load(json_file)
+    bad_files = [
+        (dict(good, rms_mm=0.0), False),                      # hand edit, hash not updated
+        (dict(good, calibration='0' * 16), True),             # other camera-params.json
+        (dict(good, crop=[0, 0, 10, 10]), True),              # other belt band
+        (dict(good, H_inv=np.eye(3).tolist()), True),         # H_inv not H's inverse
+        (dict(good, version=homography.VERSION + 1), True),
+    ]
+    for stamp, (content, rehash) in enumerate(bad_files, 2):
+        rewrite(content, rehash, stamp)
+        try:
+            homography.load_model(tmp)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("accepted a bad artifact: {}".format(content))
+        assert calib.model.sha1 == moved.sha1 # kept the last good one
+    assert calib.reloads == 1
+    rewrite(good, False, len(bad_files) + 2)
+    assert calib.model.sha1 == moved.sha1 and calib.reloads == 2
+    return calib
+
+
+def bench_homography():
+    """
+    bench_homography
+
+    start-up cost of the calibration: fitting it (findHomography, as main did every start)
+    vs. loading the checked artifact, and the per-pick .model freshness check
+    """
+    calib = check_homography_file()
+    print(f"homography artifact: load/hash/calibration checks ok, hot reload ok, "
+          f"{calib.reloads} reloads, bad files kept the old model")
+    fit = time_it(camera_fxns.calculate_homography, n=200)
+    load = time_it(lambda: homography.load_model(calib.path), n=200)
+    check = time_it(lambda: calib.model, n=2000)
+    print(f"           fit {fit * 1000:6.1f} us  load artifact {load * 1000:6.1f} us  "
+          f".model (stat only) {check * 1000:5.1f} us")
+
+
+def synthetic_correspondences(rng, H, offsets, n_grid=(6, 4), n_items=40, marker_px=0.3, item_px=0.7,
+                              n_outliers=3):
+    """
+    synthetic_correspondences
+
+    what a calibration run records, with a known answer: markers on a grid over the belt
+    (pixel picked to marker_px), items of both classes at random spots (detected center noise
+    item_px) whose robot point is H(px) + their class offset, and a few mis-recorded rows
+
+    :returns: img_pts, robot_pts, classes, (N,2) mm each robot point was mis-recorded by (0 for most)
+    """
+    w, h = camera_fxns.BELT_CROP[2:]
+    gx, gy = np.meshgrid(np.linspace(40, w - 40, n_grid[0]), np.linspace(20, h - 20, n_grid[1]))
+    true_px = np.vstack((np.column_stack((gx.ravel(), gy.ravel())), rng.uniform((20, 10), (w - 20, h - 10), (n_items, 2))))
+    classes = np.concatenate((np.zeros(gx.size, dtype=np.int32),
+                              rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], n_items)))
+    robot_pts = camera_fxns.pix_to_world(true_px, np.maximum(classes, 1), H, offsets=offsets)
+    robot_pts[classes == calibrate_robot.MARKER] = cv2.perspectiveTransform(
+        true_px[classes == calibrate_robot.MARKER].reshape(-1, 1, 2), H).reshape(-1, 2)
+    noise = np.where(classes[:, None] == calibrate_robot.MARKER, marker_px, item_px)
+    img_pts = true_px + rng.normal(0, 1, true_px.shape) * noise
+    mistakes = np.zeros_like(robot_pts)
+    mistakes[rng.choice(len(img_pts), n_outliers, replace=False)] = (rng.uniform(15, 40, (n_outliers, 2)) *
+                                                                     rng.choice([-1, 1], (n_outliers, 2)))
+    return img_pts, robot_pts + mistakes, classes, mistakes
+
+
+def pick_errors(H, offsets, H_true, offsets_true, n=2000, seed=9):
+    """
+    :returns: (n,) mm between where a fitted calibration sends random items and where they are
+    """
+    rng = np.random.default_rng(seed)
+    points = rng.uniform((0, 0), camera_fxns.BELT_CROP[2:], (n, 2))
+    classes = rng.choice([camera_fxns.LABEL_GOOD, camera_fxns.LABEL_BAD], n)
+    return np.linalg.norm(camera_fxns.pix_to_world(points, classes, H, offsets=offsets) -
+                          camera_fxns.pix_to_world(points, classes, H_true, offsets=offsets_true), axis=1)
+
+
+def check_robot_calibration(seed=0):
+    """
+    check_robot_calibration
+
+    calibrate_robot on synthetic point pairs: RANSAC finds the mis-recorded rows, the offsets
+    come back within 0.5 mm, items land within 1.5 mm across the belt, a CSV round trip fits
+    the same, and with no markers the offsets' difference still comes back
+
+    :returns: fit, pick errors (mm) of the fit
+    """
+    rng = np.random.default_rng(seed)
+    H = camera_fxns.calculate_homography()
+    offsets = camera_fxns.CLASS_OFFSETS
+    img_pts, robot_pts, classes, mistakes = synthetic_correspondences(rng, H, offsets)
+    outliers = mistakes.any(axis=1)
+    fit = calibrate_robot.fit_correspondences(img_pts, robot_pts, classes)
+    assert np.array_equal(~fit.inliers & outliers, outliers), "outliers kept"
+    assert (~fit.inliers).sum() <= outliers.sum() + 2
+    for label, offset in offsets.items():
+        assert np.abs(np.subtract(fit.offsets[label], offset)).max() < 0.5, (label, fit.offsets[label])
+    errors = pick_errors(fit.H, fit.offsets, H, offsets)
+    assert errors.max() < 1.5, errors.max()
+
+    tmp = os.path.join(tempfile.mkdtemp(), 'points.csv')
+    calibrate_robot.write_correspondences(tmp, img_pts, robot_pts, classes)
+    again = calibrate_robot.fit_correspondences(*calibrate_robot.read_correspondences(tmp))
+    assert np.allclose(again.H, fit.H) and again.offsets == fit.offsets
+
+    # artifact: H kept, point pairs refit (python homography.py) to about the same H
+    model = calibrate_robot.to_model(fit, img_pts, robot_pts, classes)
+    assert np.array_equal(model.H, fit.H) and model.offsets == fit.offsets
+    refit = homography.build_model(model.img_pts, model.robot_pts, model.offsets)
+    assert pick_errors(refit.H, refit.offsets, fit.H, fit.offsets).max() < 0.5 # lsq vs RANSAC's own refine
+
+    items = classes != calibrate_robot.MARKER
+    no_markers = calibrate_robot.fit_correspondences(img_pts[items], robot_pts[items], classes[items])
+    diff = np.subtract(no_markers.offsets[camera_fxns.LABEL_GOOD], no_markers.offsets[camera_fxns.LABEL_BAD])
+    assert np.abs(diff - np.subtract(offsets[camera_fxns.LABEL_GOOD], offsets[camera_fxns.LABEL_BAD])).max() < 0.5
+    assert np.percentile(pick_errors(no_markers.H, no_markers.offsets, H, offsets), 95) < 2.0 # noisier, no grid
+
+    heat = calibrate_robot.residual_heatmap(img_pts, fit)
+    assert heat.shape == (camera_fxns.BELT_CROP[3], camera_fxns.BELT_CROP[2], 3)
+    return fit, errors
+
+
+def bench_robot_calibration(n_trials=20, tolerance_mm=2.0):
+    """
+    bench_robot_calibration
+
+    pick accuracy over the belt: 4 hand-picked points (least squares, offsets from the same
+    item rows) vs. least squares over all rows vs. RANSAC over all rows, on synthetic
+    calibration runs with click/detection noise and 3 mis-recorded rows each.
+    tolerance_mm is a guess at how far off a pick can be and still grab the item
+    """
+    fit, errors = check_robot_calibration()
+    print(f"robot calibration: outliers found, offsets {fit.offsets}, rms {fit.rms:.2f} mm, "
+          f"max pick error {errors.max():.2f} mm")
+    H = camera_fxns.calculate_homography()
+    offsets = camera_fxns.CLASS_OFFSETS
+    results = {'4 points': [], 'lsq all': [], 'ransac all': []}
+    times = {'lsq all': [], 'ransac all': []}
+    for trial in range(n_trials):
+        rng = np.random.default_rng(100 + trial)
+        img_pts, robot_pts, classes, mistakes = synthetic_correspondences(rng, H, offsets)
+        # 4 grid corners, like the hand-picked set (a mis-recorded corner would be noticed, so not here),
+        # offsets as the median leftover of the item rows, like tuning them by hand at best
+        corners = [0, 5, 18, 23]
+        clean = robot_pts - mistakes
+        H4, _ = cv2.findHomography(img_pts[corners], clean[corners])
+        leftover = robot_pts - cv2.perspectiveTransform(img_pts.reshape(-1, 1, 2), H4).reshape(-1, 2)
+        offsets4 = {label: tuple(np.median(leftover[classes == label], axis=0)) for label in offsets}
+        results['4 points'].append(pick_errors(H4, offsets4, H, offsets))
+        for name, method in (('lsq all', 'lsq'), ('ransac all', 'ransac')):
+            start = time.perf_counter()
+            fit = calibrate_robot.fit_correspondences(img_pts, robot_pts, classes, method)
+            times[name].append(time.perf_counter() - start)
+            results[name].append(pick_errors(fit.H, fit.offsets, H, offsets))
+    for name, errors in results.items():
+        errors = np.concatenate(errors)
+        fit_ms = f"  fit {statistics.median(times[name]) * 1000:5.1f} ms" if name in times else ''
+        print(f"           {name:10s}: mean {errors.mean():5.2f} mm  p95 {np.percentile(errors, 95):5.2f} mm  "
+              f"max {errors.max():6.2f} mm  > {tolerance_mm:g} mm: {(errors > tolerance_mm).mean() * 100:5.1f}%{fit_ms}")
+
+
+def import_ms(code, n=5):
+    """
+    import_ms
+
+    :param code: python code run in a fresh interpreter (imports aren't cached there)
+    :param n: runs
+    :returns: median ms for the whole interpreter run, None if the code fails
+    """
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        if subprocess.run([sys.executable, '-c', code], capture_output=True).returncode != 0:
+            return None
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def bench_import():
+    """
+    bench_import
+
+    start-up of an image-only tool: import camera_fxns with the SDK loaded lazily vs.
+    loading libMVSDK at import like mvsdk used to (fails outright without the vendor SDK)
+    """
+    lazy = import_ms("import camera_fxns, mvsdk; assert not mvsdk.sdk_loaded()")
+    assert lazy is not None, "import camera_fxns loaded (or needed) the camera SDK"
+    eager = import_ms("import camera_fxns, mvsdk; mvsdk._sdk._load()")
+    if eager is None:
+        print(f"import     lazy SDK:      {lazy:7.1f} ms  loading libMVSDK at import: fails (no vendor SDK here)")
+    else:
+        print(f"import     lazy SDK:      {lazy:7.1f} ms  loading libMVSDK at import: {eager:7.1f} ms")
+
+
+if __name__ == '__main__':
+    frame = cv2.imread(frame_file)
+    print(f"{frame_file}: {frame.shape[1]}x{frame.shape[0]}")
+    bench_undistort(frame)
+    bench_belt_view(frame)
+    corpus = belt_corpus()
+    bench_detections(frame, corpus)
+    bench_bgr_lut(frame, corpus)
+    bench_item_density()
+    bench_centroids()
+    bench_tracker()
+    bench_pick_on_the_fly()
+    bench_overlay(corpus)
+    bench_pix_to_world()
+    bench_homography()
+    bench_robot_calibration()
+    bench_import()
@@ -0,0 +1,318 @@
+"""
+calibrate_robot
+
+hand-eye calibration for the belt: fits the pixel -> robot homography and the per-class
+offsets from many recorded point pairs (instead of 4 hand-picked points and hand-tuned
+offsets), reports how far off every point is, draws a residual heatmap over the belt
+and writes homography.json (homography.py) for main.py. Works offline on a CSV.
+
+CSV columns (CORRESPONDENCE_FIELDS), recorded with record_grid() or by hand:
+    px_x, px_y: belt image px (take_belt_photo() image) of the point
+    robot_x, robot_y: robot coords of the same point
+    class: 'marker' (or empty) = a point whose pixel is exact (a cross, the tool tip),
+        'good'/'bad' = a detected item's center + where the robot picks that item right;
+        these rows fit that class's offset (detected centers are shifted by the lighting)
+
+usage:
+    python calibrate_robot.py points.csv                # fit (RANSAC), report, write homography.json
+    python calibrate_robot.py points.csv --method lsq --dry-run
+    python calibrate_robot.py points.csv --record --x 0 560 --y 0 160 --n 6 4
+                                                         # grid jog: records one row per grid point first
+"""
+import argparse
+import collections
+import csv
+import os
+import cv2
+import numpy as np
+import camera_fxns
+import homography
+
+CORRESPONDENCE_FIELDS = ['px_x', 'px_y', 'robot_x', 'robot_y', 'class']
+MARKER = 0 # class of marker rows (item classes are camera_fxns labels, 1..)
+HEATMAP_FILE = 'homography_residuals.png'
+
+# H: 3x3 belt px -> robot (before offsets)
+# offsets: {label: (x, y)} fitted per item class
+# inliers: (N,) bool, rows H/offsets were fitted from (RANSAC drops the rest)
+# residuals: (N,) mm from each robot point to H(px) + its class offset
+# rms: inlier rms (mm)
+# method: 'ransac' / 'lsq'
+Fit = collections.namedtuple('Fit', ['H', 'offsets', 'inliers', 'residuals', 'rms', 'method'])
+
+
+def class_labels():
+    """
+    :returns: {csv class name: label}, marker rows included
+    """
+    labels = {name: label for label, (name, _, _) in enumerate(camera_fxns.ITEM_CLASSES, 1)}
+    labels.update({'': MARKER, 'marker': MARKER})
+    return labels
+
+
+def read_correspondences(path):
+    """
+    read_correspondences
+
+    :param path: CSV with CORRESPONDENCE_FIELDS header (class column optional, default marker);
+        lines starting with # are skipped
+    :returns: img_pts (N,2), robot_pts (N,2), classes (N,) labels (MARKER for markers)
+    :raises ValueError: on a row that can't be read (with its line number)
+    """
+    labels = class_labels()
+    img_pts, robot_pts, classes = [], [], []
+    with open(path, 'r', newline='') as csv_file:
+        rows = csv.DictReader(line for line in csv_file if not line.lstrip().startswith('#'))
+        missing = set(CORRESPONDENCE_FIELDS[:4]) - set(rows.fieldnames or [])
+        if missing:
+            raise ValueError("{}: missing columns {}".format(path, sorted(missing)))
+        for row in rows:
+            try:
+                img_pts.append((float(row['px_x']), float(row['px_y'])))
+                robot_pts.append((float(row['robot_x']), float(row['robot_y'])))
+                classes.append(labels[(row.get('class') or '').strip().lower()])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("{}: bad row at line {}: {}".format(path, rows.line_num, row))
+    return (np.array(img_pts, dtype=np.float64).reshape(-1, 2), np.array(robot_pts, dtype=np.float64).reshape(-1, 2),
+            np.array(classes, dtype=np.int32))
+
+
+def write_correspondences(path, img_pts, robot_pts, classes, append=False):
+    """
+    write_correspondences
+
+    :param append: add the rows to an existing file (header only written to a new one)
+    """
+    names = {label: name for name, label in class_labels().items() if name}
+    new = not (append and os.path.isfile(path))
+    with open(path, 'w' if new else 'a', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        if new:
+            writer.writerow(CORRESPONDENCE_FIELDS)
+        for (px_x, px_y), (robot_x, robot_y), label in zip(img_pts, robot_pts, classes):
+            writer.writerow([px_x, px_y, robot_x, robot_y, names[int(label)]])
+
+
+def _shift(H, shift):
+    # H followed by a robot x/y shift (exact for a homography, the shift is after the divide)
+    T = np.eye(3)
+    T[:2, 2] = shift
+    return T @ H
+
+
+def fit_correspondences(img_pts, robot_pts, classes, method='ransac', ransac_mm=3.0, iterations=10):
+    """
+    fit_correspondences
+
+    fits H and the per-class offsets together: H on every row's robot point minus its class
+    offset, then each offset as the median of its class's leftover, until the offsets settle.
+    Marker rows have no offset, so with markers H is where a pixel really is; without any,
+    offsets are relative to the average item (their row-weighted mean is 0, H takes the rest)
+
+    :param img_pts: (N,2) belt image px
+    :param robot_pts: (N,2) robot coords
+    :param classes: (N,) labels, MARKER for markers
+    :param method: 'ransac' (rows off by more than ransac_mm are dropped) or 'lsq' (all rows)
+    :param ransac_mm: RANSAC inlier distance in robot mm
+    :param iterations: most H/offset rounds
+    :returns: Fit
+    :raises ValueError: fewer than 4 rows or no H fits them
+    """
+    img_pts = np.asarray(img_pts, dtype=np.float64).reshape(-1, 2)
+    robot_pts = np.asarray(robot_pts, dtype=np.float64).reshape(-1, 2)
+    classes = np.asarray(classes).reshape(-1)
+    if len(img_pts) < 4:
+        raise ValueError("need at least 4 point pairs, got {}".format(len(img_pts)))
+    cv_method = {'ransac': cv2.RANSAC, 'lsq': 0}[method]
+    labels = [label for label in np.unique(classes) if label != MARKER]
+    offset_of = np.zeros((int(classes.max()) + 1, 2)) # row lookup, MARKER row stays 0
+    inliers = np.ones(len(img_pts), dtype=bool)
+    markers = classes == MARKER
+    if markers.sum() >= 4:
+        # start the offsets from the markers' H, else RANSAC can take the (more, offset) item
+        # rows as the consensus and throw the markers out
+        H, _ = cv2.findHomography(img_pts[markers], robot_pts[markers], cv_method, ransac_mm)
+        if H is not None:
+            leftover = robot_pts - cv2.perspectiveTransform(img_pts.reshape(-1, 1, 2), H).reshape(-1, 2)
+            for label in labels:
+                offset_of[label] = np.median(leftover[classes == label], axis=0)
+    for _ in range(iterations):
+        H, mask = cv2.findHomography(img_pts, robot_pts - offset_of[classes], cv_method, ransac_mm)
+        if H is None:
+            raise ValueError("no homography fits these {} points".format(len(img_pts)))
+        if mask is not None:
+            inliers = mask.reshape(-1).astype(bool)
+        leftover = robot_pts - cv2.perspectiveTransform(img_pts.reshape(-1, 1, 2), H).reshape(-1, 2)
+        before = offset_of.copy()
+        for label in labels:
+            # all the class's rows (without markers, the first round's RANSAC can drop a whole
+            # class), the median doesn't mind the few real outliers
+            offset_of[label] = np.median(leftover[classes == label], axis=0)
+        if not markers.any():
+            shift = offset_of[classes[inliers]].mean(axis=0)
+            offset_of[labels] -= shift
+            H = _shift(H, shift)
+        if np.abs(offset_of - before).max() < 1e-3:
+            break
+    fitted = cv2.perspectiveTransform(img_pts.reshape(-1, 1, 2), H).reshape(-1, 2) + offset_of[classes]
+    residuals = np.linalg.norm(robot_pts - fitted, axis=1)
+    rms = float(np.sqrt(np.mean(np.square(residuals[inliers])))) if inliers.any() else float('nan')
+    offsets = {int(label): tuple(round(float(v), 3) for v in offset_of[label]) for label in labels}
+    return Fit(H, offsets, inliers, residuals, rms, method)
+
+
+def to_model(fit, img_pts, robot_pts, classes, offsets=None):
+    """
+    to_model
+
+    the fit as a homography.HomographyModel to save. Its point pairs are the inliers with the
+    class offset taken off the robot point (what H itself maps them to), so `python homography.py`
+    refits the same H from them
+
+    :param offsets: offsets for classes the CSV had no rows for, default camera_fxns.CLASS_OFFSETS
+    """
+    classes = np.asarray(classes).reshape(-1)
+    all_offsets = dict(camera_fxns.CLASS_OFFSETS if offsets is None else offsets)
+    all_offsets.update(fit.offsets)
+    shift = np.array([all_offsets.get(int(label), (0.0, 0.0)) if label != MARKER else (0.0, 0.0)
+                      for label in classes]).reshape(-1, 2)
+    rows = fit.inliers
+    return homography.build_model(np.asarray(img_pts)[rows], (np.asarray(robot_pts) - shift)[rows],
+                                  all_offsets, H=fit.H)
+
+
+def residual_heatmap(img_pts, fit, size=None, scale=8, max_mm=None):
+    """
+    residual_heatmap
+
+    residuals spread over the belt image (inverse distance weighting between the points),
+    blue = on target, red = max_mm or worse; inliers drawn as dots with their residual,
+    RANSAC outliers as white x's
+
+    :param size: (w, h) of the belt image, default camera_fxns.BELT_CROP's
+    :param scale: px per heatmap cell (interpolation is done on the coarse grid)
+    :param max_mm: residual drawn full red, None=largest inlier residual
+    :returns: BGR image of the belt's size
+    """
+    w, h = camera_fxns.BELT_CROP[2:] if size is None else size
+    img_pts = np.asarray(img_pts, dtype=np.float64).reshape(-1, 2)
+    pts, values = img_pts[fit.inliers], fit.residuals[fit.inliers]
+    if max_mm is None:
+        max_mm = max(float(values.max()) if len(values) else 1.0, 1e-6)
+    gx, gy = np.meshgrid((np.arange(0, w, scale) + scale / 2), (np.arange(0, h, scale) + scale / 2))
+    d2 = (gx[..., None] - pts[:, 0]) ** 2 + (gy[..., None] - pts[:, 1]) ** 2
+    weights = 1.0 / np.maximum(d2, 1e-6)
+    grid = (weights * values).sum(axis=-1) / weights.sum(axis=-1)
+    grid = np.clip(grid / max_mm * 255, 0, 255).astype(np.uint8)
+    heat = cv2.applyColorMap(cv2.resize(grid, (w, h), interpolation=cv2.INTER_LINEAR), cv2.COLORMAP_JET)
+    for (x, y), value in zip(pts, values):
+        cv2.circle(heat, (int(round(x)), int(round(y))), 3, (255, 255, 255), -1)
+        cv2.putText(heat, "{:.1f}".format(value), (int(round(x)) + 4, int(round(y)) - 4),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.35, (255, 255, 255), 1, cv2.LINE_AA)
+    for x, y in img_pts[~fit.inliers]:
+        cv2.drawMarker(heat, (int(round(x)), int(round(y))), (255, 255, 255), cv2.MARKER_TILTED_CROSS, 10, 2)
+    cv2.putText(heat, "residual mm, red >= {:.1f}".format(max_mm), (5, h - 6),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 255, 255), 1, cv2.LINE_AA)
+    return heat
+
+
+def report(fit, img_pts, robot_pts, classes):
+    """
+    report
+
+    prints every point's residual, the per-class rms and fitted offsets, and the outliers
+    """
+    names = {label: name for name, label in class_labels().items() if name}
+    classes = np.asarray(classes).reshape(-1)
+    print(" #    px_x    px_y  robot_x  robot_y  class   resid mm")
+    for i, ((px, py), (rx, ry), label, resid, inlier) in enumerate(
+            zip(img_pts, robot_pts, classes, fit.residuals, fit.inliers)):
+        print("{:2d} {:7.1f} {:7.1f} {:8.2f} {:8.2f}  {:6s} {:7.2f}{}".format(
+            i, px, py, rx, ry, names[int(label)], resid, '' if inlier else '  OUTLIER'))
+    for label in np.unique(classes):
+        rows = fit.inliers & (classes == label)
+        if rows.any():
+            rms = np.sqrt(np.mean(np.square(fit.residuals[rows])))
+            offset = " offset {}".format(fit.offsets[int(label)]) if label != MARKER else ''
+            print("{:6s}: {:3d} points, rms {:.2f} mm, max {:.2f} mm{}".format(
+                names[int(label)], int(rows.sum()), rms, fit.residuals[rows].max(), offset))
+    print("{}: {} of {} points used, rms {:.2f} mm".format(fit.method, int(fit.inliers.sum()), len(fit.inliers), fit.rms))
+
+
+def grid_robot_pts(x_range, y_range, n_x, n_y):
+    """
+    :returns: (n_x*n_y, 2) robot points on a grid over the range, row by row
+    """
+    xs = np.linspace(x_range[0], x_range[1], n_x)
+    ys = np.linspace(y_range[0], y_range[1], n_y)
+    return np.array([(x, y) for y in ys for x in xs])
+
+
+def record_grid(path, robot_pts, session=None, as_marker=False, lut_bits=None, centers='bbox'):
+    """
+    record_grid
+
+    grid jog routine: for each robot point, asks to jog the robot there and leave an item
+    under the tool, takes a belt photo and appends the detected item's center to the CSV
+    (needs exactly one item on the belt, else the point can be retaken or skipped)
+
+    :param path: CSV to append to
+    :param robot_pts: (N,2) robot points to visit (grid_robot_pts())
+    :param session: open camera_session.CameraSession, None=open the camera per photo
+    :param as_marker: record rows as markers (the item's center is exact), else as its class
+    :param centers: detected item centers, the same main.py will use (item_centers)
+    :returns: rows recorded
+    """
+    recorded = 0
+    for i, (robot_x, robot_y) in enumerate(robot_pts):
+        while True:
+            answer = input("[{}/{}] jog to ({:.2f}, {:.2f}), place an item, move clear, "
+                           "enter=photo s=skip q=quit: ".format(i + 1, len(robot_pts), robot_x, robot_y)).strip().lower()
+            if answer in ('s', 'q'):
+                break
+            belt = camera_fxns.take_belt_photo(session)
+            if belt is None:
+                print("No photo, try again.")
+                continue
+            img, _, bad_img = camera_fxns.preprocess(belt, is_belt=True, lut_bits=lut_bits)
+            items = camera_fxns.detect_contours([img, bad_img], centers=centers)
+            if len(items.centers) != 1:
+                print("Found {} items, need exactly 1.".format(len(items.centers)))
+                continue
+            label = MARKER if as_marker else int(items.classes[0])
+            write_correspondences(path, items.centers, [(robot_x, robot_y)], [label], append=True)
+            print("px ({:.1f}, {:.1f}) -> robot ({:.2f}, {:.2f})".format(*items.centers[0], robot_x, robot_y))
+            recorded += 1
+            break
+        if answer == 'q':
+            break
+    return recorded
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="fit homography.json from recorded pixel/robot point pairs")
+    parser.add_argument('csv', help="point pairs (px_x,px_y,robot_x,robot_y,class)")
+    parser.add_argument('--method', choices=['ransac', 'lsq'], default='ransac')
+    parser.add_argument('--ransac-mm', type=float, default=3.0, help="RANSAC inlier distance (mm)")
+    parser.add_argument('--out', default=homography.ARTIFACT_FILE)
+    parser.add_argument('--heatmap', default=HEATMAP_FILE)
+    parser.add_argument('--dry-run', action='store_true', help="report only, don't write the artifact")
+    parser.add_argument('--record', action='store_true', help="grid jog first, appending to the csv")
+    parser.add_argument('--x', type=float, nargs=2, default=(0, 560), help="grid robot x range")
+    parser.add_argument('--y', type=float, nargs=2, default=(0, 160), help="grid robot y range")
+    parser.add_argument('--n', type=int, nargs=2, default=(6, 4), help="grid points in x, y")
+    parser.add_argument('--marker', action='store_true', help="record rows as markers")
+    parser.add_argument('--centers', choices=['bbox', 'moments'], default='bbox', help="item centers to record")
+    args = parser.parse_args()
+
+    if args.record:
+        record_grid(args.csv, grid_robot_pts(args.x, args.y, *args.n), as_marker=args.marker, centers=args.centers)
+    img_pts, robot_pts, classes = read_correspondences(args.csv)
+    fit = fit_correspondences(img_pts, robot_pts, classes, args.method, args.ransac_mm)
+    report(fit, img_pts, robot_pts, classes)
+    cv2.imwrite(args.heatmap, residual_heatmap(img_pts, fit))
+    print("Heatmap: {}".format(args.heatmap))
+    if not args.dry_run:
+        model = to_model(fit, img_pts, robot_pts, classes)
+        homography.save_model(model, args.out)
+        print("{}: calibration {}, offsets {}".format(args.out, model.sha1, model.offsets))
@@ -1,273 +1,773 @@
-"""
-camera_fxns
-
-all camera helper functions used in main.py
-Note: gig-E camera used
-"""
-import cv2
-import numpy as np
-import time
-import json
-import mvsdk 
-
-def calibrate_camera():
-    """Calibrate the camera--only needs to be used once per program
-
-    Returns:
-        new_mtx, new_dist: camera params necessary for undistorting new images
-        
-        usage:  
-        image = cv2.imread("photo.jpg")
-        undistorted = cv2.undistort(image, camera_matrix, dist_coeffs)
-    """
-    # Load camera parameters from JSON file
-    with open('camera-params.json', 'r') as json_file:
-        camera_params = json.load(json_file)
-    new_mtx = np.array(camera_params['camera_matrix'])
-    new_dist = np.array(camera_params['distortion_coefficients'])
-    return new_mtx, new_dist
-# LOAD CALIB FIRST
-camera_matrix, dist_coeffs = calibrate_camera()
-
-def take_photo():
-    """takes and returns photo
-
-    Returns:
-        img: image taken
-    """
-    ret_frame=None # what we will be returning
-    # Enumerate cameras
-    DevList = mvsdk.CameraEnumerateDevice()
-    nDev = len(DevList)
-    if nDev < 1:
-        print("No camera was found!")
-        return
-
-    for i, DevInfo in enumerate(DevList):
-        print("{}: {} {}".format(i, DevInfo.GetFriendlyName(), DevInfo.GetPortType()))
-    i = 0 if nDev == 1 else int(input("Select camera: "))
-    DevInfo = DevList[i]
-    # Open the camera
-    hCamera = 0
-    try:
-        hCamera = mvsdk.CameraInit(DevInfo, -1, -1)
-    except mvsdk.CameraException as e:
-        print("CameraInit Failed({}): {}".format(e.error_code, e.message))
-        return
-    cap = mvsdk.CameraGetCapability(hCamera)
-    monoCamera = (cap.sIspCapacity.bMonoSensor != 0)
-    if monoCamera:
-        mvsdk.CameraSetIspOutFormat(hCamera, mvsdk.CAMERA_MEDIA_TYPE_MONO8)
-    else:
-        mvsdk.CameraSetIspOutFormat(hCamera, mvsdk.CAMERA_MEDIA_TYPE_BGR8)
-    # Set camera mode to continuous acquisition
-    mvsdk.CameraSetTriggerMode(hCamera, 0)
-    # Manual exposure, exposure time = 80 ms
-    mvsdk.CameraSetAeState(hCamera, 0)
-    mvsdk.CameraSetExposureTime(hCamera,50 * 1000)
-    # Start the SDK’s internal image capture thread
-    mvsdk.CameraPlay(hCamera)
-    # Allocate it according to the camera’s maximum resolution
-    FrameBufferSize = cap.sResolutionRange.iWidthMax * cap.sResolutionRange.iHeightMax * (1 if monoCamera else 3)
-    # Allocate the RGB buffer
-    pFrameBuffer = mvsdk.CameraAlignMalloc(FrameBufferSize, 16)
-    # Capture one frame from the camera
-    try:
-        pRawData, FrameHead = mvsdk.CameraGetImageBuffer(hCamera, 200)
-        mvsdk.CameraImageProcess(hCamera, pRawData, pFrameBuffer, FrameHead)
-        mvsdk.CameraReleaseImageBuffer(hCamera, pRawData)
-        frame_data = (mvsdk.c_ubyte * FrameHead.uBytes).from_address(pFrameBuffer)
-        frame = np.frombuffer(frame_data, dtype=np.uint8)
-        frame = frame.reshape((FrameHead.iHeight, FrameHead.iWidth, 1 if FrameHead.uiMediaType == mvsdk.CAMERA_MEDIA_TYPE_MONO8 else 3))
-        ret_frame=frame.copy()        
-    except mvsdk.CameraException as e:
-        if e.error_code != mvsdk.CAMERA_STATUS_TIME_OUT:
-            print("CameraGetImageBuffer failed({}): {}".format(e.error_code, e.message))
-    # Close the camera
-    mvsdk.CameraUnInit(hCamera)
-    # Free the frame buffer
-    mvsdk.CameraAlignFree(pFrameBuffer)
-
-    camera_matrix, dist_coeffs = calibrate_camera()
-    undistorted = cv2.undistort(ret_frame, camera_matrix, dist_coeffs)
-    rotated = cv2.rotate(undistorted, cv2.ROTATE_180)
-    flipped = cv2.flip(rotated, 1)
-    return flipped
-
-def crop_img(img, x=0, y=374, w=1190, h=208):
-    """
-    crop_img
-
-    crops image to just be conveyor belt
-    
-    :param img: original image
-    :param x: start x
-    :param y: start y
-    :param w: width
-    :param h: height
-    """
-    y_start, y_end = y, y+h
-    x_start, x_end = x, x+w
-    cropped_img = img[y_start:y_end, x_start:x_end]
-    # show_img(cropped_img)
-    return cropped_img
-
-
-def preprocess(img):
-    """
-    preprocess
-
-    crop, blur, hsv mask for both good (white) and bad (orange) items
-    
-    :param img: image to prep
-    :returns ret_img=white mask, cropped=plain cropped for display, ret_bad=orange mask
-    """
-    cropped = crop_img(img)
-    blur = cv2.GaussianBlur(cropped, (7,7), 0)
-    hsv = cv2.cvtColor(blur, cv2.COLOR_BGR2HSV)
-    lower_white = np.array([0, 0, 100])     # low saturation, high value
-    upper_white = np.array([179, 50, 255])
-    ret_img = cv2.inRange(hsv, lower_white, upper_white)
-
-    lower_orange = np.array([10, 120, 100])
-    upper_orange = np.array([30, 255, 255])
-    ret_bad = cv2.inRange(hsv, lower_orange, upper_orange)
-    # ret = cv2.medianBlur(ret_bad,5)
-    return ret_img, cropped, ret_bad
-
-
-def find_items(img,orig_img,good_item):
-    """
-    find_items
-
-    locates all items in the image, displaying circles on the orig_img (b/c img is binary)
-    red outline=unreachable
-    green outline=reachable
-    yellow outline=not reachable yet, but will be on next cycle
-    red center=bad (orange) item
-    blue center=good (white) item
-
-    :param img: binary preprocessed img
-    :param orig_img: cropped image for displaying
-    :param good_item: if masked img is for good or bad items
-    :returns: list of image coordinates (centers)
-    """
-    coords=[]
-    contours, _ = cv2.findContours(img, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE) 
-    for contour in contours:
-        # print(cv2.contourArea(contour))
-        area = cv2.contourArea(contour)
-        if (area > 500) and(area<800) :  # For the outside of the die...
-            # print(cv2.contourArea(contour))
-            # cv2.drawContours(orig_img, contour, -1, (0, 255, 0), 2)
-            x, y, w, h = cv2.boundingRect(contour)
-            x_loc = x+(0.5*w)
-            y_loc = y+(0.5*h)
-            coords.append([x_loc,y_loc])
-            # Draw circle centers based on reachability
-            color=None
-            center_color=None
-            if(x_loc<=323):
-                # not yet reachable but will be next
-                color=(0,255,255) # yellow
-            elif((x_loc>780) or (y_loc<=30) or (y_loc>=185)):
-                # past reachability
-                color=(0,0,255) # red
-            else:
-                # reachable
-                color=(0,255,0) # green
-            cv2.circle(orig_img, (int(x_loc),int(y_loc)), 15, color, 2) 
-            if good_item:
-                center_color=(255,0,0) # good items get blue center
-            else:
-                center_color=(0,0,255) # bad items get red center
-            cv2.circle(orig_img, (int(x_loc),int(y_loc)), 1, center_color, 2)
-    return coords
-
-def start_img_window(window='default'):
-    """
-    starts the image window at the beginning of the program
-        so the show_img() is not blocking
-    
-    :param window: name of window
-    """
-    cv2.startWindowThread()
-    cv2.namedWindow(window, cv2.WINDOW_NORMAL)  
-
-def show_img(img, window='default', resize=True):
-    """
-    shows a blown-up version of the img
-    
-    :param img: image to show
-    :param window: name of window
-    :param resize: if it should be resized or not
-    """
-    if resize:
-        cv2.resizeWindow(window, (1190*2), (208*2)) # scale up
-    cv2.imshow(window, img) # Display the frame
-    # cv2.waitKey(0)
-    # cv2.destroyAllWindows()
-
-
-def calculate_homography():
-    """
-    calculates homography matrix from these calinration points
-
-    returns the H matrix for converting to robot coords later
-    """
-    img_pts = np.array([
-        [287,168],
-        [775,166],
-        [758,35],
-        [331,49]
-    ])
-    robot_pts = np.array([
-        [0,0], # ACCORDING TO FRAME 2....
-        [577.422,7.586],
-        [556.064,160.082],
-        [52.424,140.5]
-    ])
-    H, _ = cv2.findHomography(img_pts, robot_pts)
-    return H
-    
-
-def convert_pix_to_world(pix_x,pix_y,H, good=True):
-    """
-    convert_pix_to_world
-
-    converts pixel value to robot value
-    
-    :param pix_x: pixel x val
-    :param pix_y: pixel y val
-    :param H: Homography matrix
-    :param good: if good or bad item b/c offsets are a little different (orange mask was a little off bc of lighting)
-    """
-    if good:
-        x_offset = -15
-        y_offset = 8
-    else: # offset for orange caps
-        x_offset = -17
-        y_offset = 7
-    point = np.array([pix_x,pix_y,1.0])
-    world_pt = H @ point
-    world_pt /= world_pt[2] # normalize
-    return world_pt[0]+x_offset, world_pt[1]+y_offset
-
-def wait_for_items(img_coords, img_coords_bad):
-    """
-    wait_for_items
-
-    iterates through image coordinates and returns True if any item is beyond the value threshold
-    
-    :param img_coords: good item coords
-    :param img_coords_bad: bad item coords
-    """
-    value = 640
-    # iterate thru coords, return True if in range
-    for coord in img_coords:
-        if (coord[0]>=value):# and (coord[0]<(value+10)): # ignore starting unreachables
-            return True
-    for coord in img_coords_bad:
-        if (coord[0]>=value):# and (coord[0]<(value+10)):
-            return True
-    return False
\ No newline at end of file
+"""
+camera_fxns
+
+all camera helper functions used in main.py
+Note: gig-E camera used
+"""
+import collections
+import cv2
+import numpy as np
+import time
+import json
+import os
+import hashlib
+import mvsdk
+import camera_session
+
+def calibrate_camera():
+    """Calibrate the camera--only needs to be used once per program
+
+    Returns:
+        new_mtx, new_dist: camera params necessary for undistorting new images
+        
+        usage:  
+        image = cv2.imread("photo.jpg")
+        undistorted = cv2.undistort(image, camera_matrix, dist_coeffs)
+    """
+    # Load camera parameters from JSON file
+    with open('camera-params.json', 'r') as json_file:
+        camera_params = json.load(json_file)
+    new_mtx = np.array(camera_params['camera_matrix'])
+    new_dist = np.array(camera_params['distortion_coefficients'])
+    return new_mtx, new_dist
+# LOAD CALIB FIRST
+camera_matrix, dist_coeffs = calibrate_camera()
+
+# undistort maps, built once per calibration + resolution (also saved to disk)
+UNDISTORT_CACHE_DIR = '.undistort_cache'
+_undistort_maps = {}
+
+def calibration_id(mtx=None, dist=None):
+    """
+    :returns: short hash of a camera calibration (default: the loaded camera-params.json one)
+    """
+    if mtx is None:
+        mtx = camera_matrix
+    if dist is None:
+        dist = dist_coeffs
+    h = hashlib.sha1()
+    h.update(np.asarray(mtx, dtype=np.float64).tobytes())
+    h.update(np.asarray(dist, dtype=np.float64).tobytes())
+    return h.hexdigest()[:16]
+
+def _maps_key(size, mtx, dist):
+    """
+    cache key for remap tables: hash of the calibration + frame size
+    """
+    return "{}_{}x{}".format(calibration_id(mtx, dist), size[0], size[1])
+
+def get_undistort_maps(size, mtx=None, dist=None):
+    """
+    get_undistort_maps
+
+    returns the fixed-point (CV_16SC2) remap tables that cv2.undistort would build,
+    computing them only the first time for this calibration + resolution
+
+    :param size: (width, height) of the frames
+    :param mtx: camera matrix (default: the loaded camera-params.json one)
+    :param dist: distortion coeffs (default: the loaded camera-params.json ones)
+    :returns map1, map2 for cv2.remap
+    """
+    if mtx is None:
+        mtx = camera_matrix
+    if dist is None:
+        dist = dist_coeffs
+    key = _maps_key(size, mtx, dist)
+    if key in _undistort_maps:
+        return _undistort_maps[key]
+
+    path = os.path.join(UNDISTORT_CACHE_DIR, key + '.npz')
+    if os.path.isfile(path):
+        cached = np.load(path)
+        maps = (cached['map1'], cached['map2'])
+    else:
+        # same maps cv2.undistort makes internally (new camera matrix = old one)
+        maps = cv2.initUndistortRectifyMap(mtx, dist, None, mtx, tuple(size), cv2.CV_16SC2)
+        os.makedirs(UNDISTORT_CACHE_DIR, exist_ok=True)
+        np.savez(path, map1=maps[0], map2=maps[1])
+    _undistort_maps[key] = maps
+    return maps
+
+def undistort(img):
+    """
+    undistort
+
+    same result as cv2.undistort(img, camera_matrix, dist_coeffs) but with the cached maps,
+    so each frame is a single remap
+
+    :param img: distorted image
+    """
+    map1, map2 = get_undistort_maps((img.shape[1], img.shape[0]))
+    return cv2.remap(img, map1, map2, cv2.INTER_LINEAR)
+
+# conveyor belt band (x, y, w, h) in the undistorted + rotated + mirrored frame, see crop_img()
+BELT_CROP = (0, 374, 1190, 208)
+_belt_maps = {}
+
+def get_belt_maps(size, crop=BELT_CROP, roi=None):
+    """
+    get_belt_maps
+
+    remap tables that go straight from the raw camera frame to the belt band,
+    i.e. undistort + rotate 180 + mirror + crop_img() folded into one remap.
+    Rotating 180 and then mirroring left/right is just an upside-down flip, so row r
+    of the band is row H-1-(y+r) of the undistorted frame and column c is column x+c.
+    Those rows/cols of the undistort maps are picked out once, so each frame only
+    interpolates the ~20% of pixels in the band. A remap samples each output pixel on
+    its own, so the result is pixel-identical to the old chain (max diff 0).
+
+    :param size: (width, height) of the full sensor frame
+    :param crop: (x, y, w, h) of the belt band in the take_photo() frame
+    :param roi: (x, y, w, h) sensor window the frames actually cover (see belt_roi()), None=full frame
+    :returns map1, map2 for cv2.remap, h x w
+    """
+    key = (_maps_key(size, camera_matrix, dist_coeffs), tuple(crop), roi and tuple(roi))
+    if key in _belt_maps:
+        return _belt_maps[key]
+    if roi is not None:
+        map1, map2 = get_belt_maps(size, crop)
+        # same sample points, just relative to the roi corner
+        map1 = map1 - np.array([roi[0], roi[1]], dtype=map1.dtype)
+        _belt_maps[key] = (map1, map2)
+        return map1, map2
+    x, y, w, h = crop
+    height = size[1]
+    map1, map2 = get_undistort_maps(size)
+    rows = slice(height - 1 - y, height - 1 - y - h if height - 1 - y - h >= 0 else None, -1)
+    cols = slice(x, x + w)
+    maps = (np.ascontiguousarray(map1[rows, cols]), np.ascontiguousarray(map2[rows, cols]))
+    _belt_maps[key] = maps
+    return maps
+
+def belt_roi(size, crop=BELT_CROP, align=16):
+    """
+    belt_roi
+
+    smallest sensor window that has every raw pixel the belt band is interpolated from,
+    so the camera only has to send that part (about a fifth of the sensor)
+
+    :param size: (width, height) of the full sensor
+    :param crop: (x, y, w, h) of the belt band in the take_photo() frame
+    :param align: offsets/sizes are rounded out to a multiple of this (camera ROI step)
+    :returns (x, y, w, h) in sensor pixels
+    """
+    map1, _ = get_belt_maps(size, crop)
+    width, height = size
+    # map1 is the top-left of each 2x2 interpolation neighbourhood, so +2 on the far side
+    x0 = max(int(map1[..., 0].min()), 0) // align * align
+    y0 = max(int(map1[..., 1].min()), 0) // align * align
+    x1 = min(-(-(int(map1[..., 0].max()) + 2) // align) * align, width)
+    y1 = min(-(-(int(map1[..., 1].max()) + 2) // align) * align, height)
+    return (x0, y0, x1 - x0, y1 - y0)
+
+def use_belt_roi(session, crop=BELT_CROP):
+    """
+    use_belt_roi
+
+    sets an open camera session to only capture the belt band's sensor window;
+    take_belt_photo(session) still returns the same belt band (same coordinates)
+
+    :param session: open camera_session.CameraSession
+    :param crop: (x, y, w, h) of the belt band in the take_photo() frame
+    :returns: the roi that was set
+    """
+    roi = belt_roi(session.sensor_size, crop)
+    session.set_roi(roi)
+    return roi
+
+def belt_view(img, crop=BELT_CROP, roi=None, size=None):
+    """
+    belt_view
+
+    same pixels as crop_img(flip(rotate_180(undistort(img)))) in a single remap
+
+    :param img: raw (distorted) camera frame, or just the roi part of one
+    :param crop: (x, y, w, h) of the belt band in the take_photo() frame
+    :param roi: (x, y, w, h) sensor window img covers, None=img is the full frame
+    :param size: (width, height) of the full sensor, needed with roi
+    """
+    if roi is None:
+        size = (img.shape[1], img.shape[0])
+    map1, map2 = get_belt_maps(size, crop, roi)
+    return cv2.remap(img, map1, map2, cv2.INTER_LINEAR)
+
+def grab_frame(session=None):
+    """
+    grab_frame
+
+    gets one raw (distorted, not rotated) frame
+
+    :param session: open camera_session.CameraSession to grab from; if None the
+        camera is opened and closed just for this one shot (slow, full GigE handshake)
+    :returns: frame, None if the camera couldn't be opened or timed out
+    """
+    if session is None:
+        try:
+            with camera_session.CameraSession() as cam:
+                return cam.grab()
+        except mvsdk.CameraException as e:
+            print("CameraInit Failed({}): {}".format(e.error_code, e.message))
+            return
+    return session.grab()
+
+def take_belt_photo(session=None):
+    """
+    take_belt_photo
+
+    takes a photo and returns just the conveyor belt band, same as crop_img(take_photo())
+
+    :param session: see grab_frame()
+    :returns: belt band image, None if no frame
+    """
+    if session is None:
+        frame = grab_frame()
+        if frame is None:
+            return
+        return belt_view(frame)
+    # the remap reads the pooled SDK buffer directly, no full-frame copy
+    lease = session.grab_lease()
+    if lease is None:
+        return
+    with lease:
+        if session.roi is not None:
+            return belt_view(lease.image, roi=session.roi, size=session.sensor_size)
+        return belt_view(lease.image)
+
+def stream_belt_photo(stream, newer_than=-1, since=None, timeout=1.0, trigger=None):
+    """
+    stream_belt_photo
+
+    belt band of the newest frame from a running camera_stream.CameraStream
+
+    :param stream: running CameraStream
+    :param newer_than: only use a frame with seq > this (the last one processed)
+    :param since: only use a frame that arrived after this time.perf_counter() value
+    :param timeout: s to wait for such a frame
+    :param trigger: only use the frame for this soft trigger id (session.soft_trigger())
+    :returns: belt_img, frame (camera_stream.Frame for seq/age), or None, None on timeout
+    """
+    frame = stream.latest(newer_than, since, timeout, trigger)
+    if frame is None:
+        return None, None
+    session = stream.session
+    if session.roi is not None:
+        return belt_view(frame.image, roi=session.roi, size=session.sensor_size), frame
+    return belt_view(frame.image), frame
+
+def take_photo(session=None):
+    """takes and returns photo
+
+    :param session: open camera_session.CameraSession (full sensor, no roi) to grab from;
+        if None the camera is opened and closed just for this one shot (slow, full GigE handshake)
+    Returns:
+        img: image taken
+    """
+    ret_frame = grab_frame(session)
+    if ret_frame is None:
+        return
+
+    undistorted = undistort(ret_frame)
+    rotated = cv2.rotate(undistorted, cv2.ROTATE_180)
+    flipped = cv2.flip(rotated, 1)
+    return flipped
+
+def crop_img(img, x=0, y=374, w=1190, h=208):
+    """
+    crop_img
+
+    crops image to just be conveyor belt
+    
+    :param img: original image
+    :param x: start x
+    :param y: start y
+    :param w: width
+    :param h: height
+    """
+    y_start, y_end = y, y+h
+    x_start, x_end = x, x+w
+    cropped_img = img[y_start:y_end, x_start:x_end]
+    # show_img(cropped_img)
+    return cropped_img
+
+
+# item classes for the label image: (name, hsv lower, hsv upper), label = index+1, 0 = background
+# a pixel inside more than one range gets the first class
+ITEM_CLASSES = [
+    ('good', (0, 0, 100), (179, 50, 255)),   # white: low saturation, high value
+    ('bad', (10, 120, 100), (30, 255, 255)), # orange
+]
+LABEL_GOOD = 1
+LABEL_BAD = 2
+
+
+def preprocess(img, is_belt=False, lut_bits=None):
+    """
+    preprocess
+
+    crop, blur, hsv mask for both good (white) and bad (orange) items
+    
+    :param img: image to prep
+    :param is_belt: img is already the belt band (take_belt_photo()), don't crop again
+    :param lut_bits: None = exact hsv thresholds, else both masks from the quantized BGR table
+        with this many bits per channel (get_bgr_lut(), 5 = 32K entries), no hsv conversion
+    :returns ret_img=white mask, cropped=plain cropped for display, ret_bad=orange mask
+    """
+    cropped = img if is_belt else crop_img(img)
+    blur = cv2.GaussianBlur(cropped, (7,7), 0)
+    if lut_bits is not None:
+        labels = label_bgr(blur, ITEM_CLASSES, lut_bits)
+        return cv2.compare(labels, LABEL_GOOD, cv2.CMP_EQ), cropped, cv2.compare(labels, LABEL_BAD, cv2.CMP_EQ)
+    hsv = cv2.cvtColor(blur, cv2.COLOR_BGR2HSV)
+    _, lower_white, upper_white = ITEM_CLASSES[LABEL_GOOD - 1]
+    ret_img = cv2.inRange(hsv, np.array(lower_white), np.array(upper_white))
+
+    _, lower_orange, upper_orange = ITEM_CLASSES[LABEL_BAD - 1]
+    ret_bad = cv2.inRange(hsv, np.array(lower_orange), np.array(upper_orange))
+    # ret = cv2.medianBlur(ret_bad,5)
+    return ret_img, cropped, ret_bad
+
+
+# (channel_luts, bits_to_label) per threshold set, see get_label_luts()
+_label_luts = {}
+# BGR label tables (get_bgr_lut()), in memory and on disk
+LABEL_LUT_CACHE_DIR = '.label_lut_cache'
+_bgr_luts = {}
+
+
+def get_label_luts(classes=ITEM_CLASSES):
+    """
+    get_label_luts
+
+    HSV -> label lookup tables, built once per threshold set. The class ranges are boxes
+    in HSV, so the full 3-D table factors into one 256-entry table per channel (bit i set =
+    channel value inside class i's range) plus a bits -> label table: same labels as a
+    180x256x256 table, but cv2.LUT can apply it
+
+    :param classes: list of (name, hsv lower, hsv upper), at most 8
+    :returns: channel_luts (h, s, v tables, 256 uint8 each), bits_to_label (256 uint8)
+    """
+    key = tuple((tuple(lower), tuple(upper)) for _, lower, upper in classes)
+    if key not in _label_luts:
+        if len(classes) > 8:
+            raise ValueError("at most 8 item classes (one bit each)")
+        values = np.arange(256)
+        channel_luts = [np.zeros(256, dtype=np.uint8) for _ in range(3)]
+        bits_to_label = np.zeros(256, dtype=np.uint8)
+        for i, (_, lower, upper) in enumerate(classes):
+            for c in range(3):
+                channel_luts[c][(values >= lower[c]) & (values <= upper[c])] |= 1 << i
+        for i in reversed(range(len(classes))): # lowest bit (first class) wins
+            bits_to_label[(values >> i) & 1 == 1] = i + 1
+        _label_luts[key] = (channel_luts, bits_to_label)
+    return _label_luts[key]
+
+
+def label_hsv(hsv, classes=ITEM_CLASSES):
+    """
+    label_hsv
+
+    :param hsv: HSV image
+    :param classes: see ITEM_CLASSES
+    :returns: uint8 label image, 0=background, i+1=classes[i]
+    """
+    (h_lut, s_lut, v_lut), bits_to_label = get_label_luts(classes)
+    h, s, v = cv2.split(hsv)
+    bits = cv2.bitwise_and(cv2.bitwise_and(cv2.LUT(h, h_lut), cv2.LUT(s, s_lut)), cv2.LUT(v, v_lut))
+    return cv2.LUT(bits, bits_to_label)
+
+
+def _bgr_lut_key(classes, bits):
+    """
+    cache key for BGR label tables: hash of the thresholds + bits per channel
+    """
+    h = hashlib.sha1(repr([(tuple(lower), tuple(upper)) for _, lower, upper in classes]).encode())
+    return "{}_{}bit".format(h.hexdigest()[:16], bits)
+
+def get_bgr_lut(classes=ITEM_CLASSES, bits=5):
+    """
+    get_bgr_lut
+
+    quantized BGR -> label table so preprocess() can skip the hsv conversion. Each cell
+    (2**(8-bits) values per channel) gets the label most of its colours get from the exact
+    hsv thresholds. Built only the first time for these thresholds (~0.5 s), then loaded
+    from LABEL_LUT_CACHE_DIR
+
+    :param classes: see ITEM_CLASSES
+    :param bits: bits kept per channel, 5 = 32K entries
+    :returns: table (2**(3*bits) uint8 labels), index_luts (b, g, r -> uint16 part of the table index)
+    """
+    key = _bgr_lut_key(classes, bits)
+    if key in _bgr_luts:
+        return _bgr_luts[key]
+
+    path = os.path.join(LABEL_LUT_CACHE_DIR, key + '.npy')
+    n = 1 << bits
+    if os.path.isfile(path):
+        table = np.load(path)
+    else:
+        # label every 24-bit colour exactly, then take the most common label per cell
+        values = np.arange(256, dtype=np.uint8)
+        cube = np.empty((256, 256, 256, 3), dtype=np.uint8)
+        cube[..., 0] = values[:, None, None]
+        cube[..., 1] = values[None, :, None]
+        cube[..., 2] = values[None, None, :]
+        hsv = cv2.cvtColor(cube.reshape(256 * 256, 256, 3), cv2.COLOR_BGR2HSV)
+        labels = label_hsv(hsv, classes).reshape(n, 256 // n, n, 256 // n, n, 256 // n)
+        counts = [(labels == label).sum(axis=(1, 3, 5), dtype=np.int32) for label in range(len(classes) + 1)]
+        table = np.argmax(counts, axis=0).astype(np.uint8).ravel()
+        os.makedirs(LABEL_LUT_CACHE_DIR, exist_ok=True)
+        np.save(path, table)
+    index = (np.arange(256) >> (8 - bits)).astype(np.uint16)
+    index_luts = (index << (2 * bits), index << bits, index)
+    _bgr_luts[key] = (table, index_luts)
+    return _bgr_luts[key]
+
+
+def label_bgr(img, classes=ITEM_CLASSES, bits=5):
+    """
+    label_bgr
+
+    label_hsv() straight from BGR: one lookup in the get_bgr_lut() table per pixel
+
+    :param img: BGR image
+    :param classes: see ITEM_CLASSES
+    :param bits: bits per channel of the table
+    :returns: uint8 label image, 0=background, i+1=classes[i]
+    """
+    table, (b_lut, g_lut, r_lut) = get_bgr_lut(classes, bits)
+    b, g, r = cv2.split(img)
+    index = cv2.bitwise_or(cv2.bitwise_or(cv2.LUT(b, b_lut), cv2.LUT(g, g_lut)), cv2.LUT(r, r_lut))
+    return np.take(table, index)
+
+
+# reachability zones of an item on the belt (see reach_zone())
+ZONE_NOT_YET = 0   # not reachable yet, but will be on next cycle
+ZONE_REACHABLE = 1
+ZONE_PAST = 2      # past reachability
+ZONE_COLORS = {ZONE_NOT_YET: (0,255,255), ZONE_REACHABLE: (0,255,0), ZONE_PAST: (0,0,255)} # yellow, green, red
+CLASS_COLORS = {LABEL_GOOD: (255,0,0), LABEL_BAD: (0,0,255)} # blue, red center dots
+
+# detected items, one row per item:
+# centers: (N,2) float x, y (bbox centers, or centroids, see detect_contours())
+# areas: (N,) px (contourArea())
+# bboxes: (N,4) x, y, w, h
+# classes: (N,) LABEL_GOOD/LABEL_BAD/...
+# zones: (N,) ZONE_*
+# sigmas: (N,2) x, y centroid uncertainty (px, 1 sigma), None for bbox centers
+Detections = collections.namedtuple('Detections', ['centers', 'areas', 'bboxes', 'classes', 'zones', 'sigmas'],
+                                    defaults=(None,))
+
+
+def reach_zone(centers):
+    """
+    reach_zone
+
+    :param centers: (N,2) item centers in the belt image
+    :returns: (N,) ZONE_NOT_YET/ZONE_REACHABLE/ZONE_PAST per item
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    x, y = centers[:, 0], centers[:, 1]
+    zones = np.full(len(centers), ZONE_REACHABLE, dtype=np.uint8)
+    zones[(x > 780) | (y <= 30) | (y >= 185)] = ZONE_PAST
+    zones[x <= 323] = ZONE_NOT_YET # checked first
+    return zones
+
+
+def draw_item(orig_img, x_loc, y_loc, good_item, zone=None):
+    """
+    draw_item
+
+    reachability circle and class dot for one item
+    red outline=unreachable
+    green outline=reachable
+    yellow outline=not reachable yet, but will be on next cycle
+    red center=bad (orange) item
+    blue center=good (white) item
+
+    :param orig_img: cropped image for displaying
+    :param x_loc, y_loc: item center (px)
+    :param good_item: good or bad item
+    :param zone: reach_zone() of the item if already known
+    """
+    if zone is None:
+        zone = reach_zone([[x_loc, y_loc]])[0]
+    cv2.circle(orig_img, (int(x_loc),int(y_loc)), 15, ZONE_COLORS[zone], 2) 
+    center_color = CLASS_COLORS[LABEL_GOOD if good_item else LABEL_BAD]
+    cv2.circle(orig_img, (int(x_loc),int(y_loc)), 1, center_color, 2)
+
+
+def draw_detections(img, detections):
+    """
+    draw_detections
+
+    overlay for detect_contours() results (the rendering half of find_items())
+
+    :param img: belt image to draw on (drawn in place)
+    :param detections: Detections
+    :returns: img
+    """
+    for (x_loc, y_loc), label, zone in zip(detections.centers, detections.classes, detections.zones):
+        cv2.circle(img, (int(x_loc),int(y_loc)), 15, ZONE_COLORS[zone], 2)
+        cv2.circle(img, (int(x_loc),int(y_loc)), 1, CLASS_COLORS.get(label, (255,255,255)), 2)
+    return img
+
+
+# item size window: contours with contourArea() (px) strictly inside it are items
+ITEM_MIN_AREA = 500
+ITEM_MAX_AREA = 800
+
+
+def find_items(img,orig_img,good_item):
+    """
+    find_items
+
+    locates all items in the image, displaying circles on the orig_img (b/c img is binary)
+    (see draw_item() for the colors)
+
+    :param img: binary preprocessed img
+    :param orig_img: cropped image for displaying
+    :param good_item: if masked img is for good or bad items
+    :returns: list of image coordinates (centers)
+    """
+    coords=[]
+    contours, _ = cv2.findContours(img, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE) 
+    for contour in contours:
+        # print(cv2.contourArea(contour))
+        area = cv2.contourArea(contour)
+        if (area > ITEM_MIN_AREA) and(area<ITEM_MAX_AREA) :  # For the outside of the die...
+            # print(cv2.contourArea(contour))
+            # cv2.drawContours(orig_img, contour, -1, (0, 255, 0), 2)
+            x, y, w, h = cv2.boundingRect(contour)
+            x_loc = x+(0.5*w)
+            y_loc = y+(0.5*h)
+            coords.append([x_loc,y_loc])
+            # Draw circle centers based on reachability
+            draw_item(orig_img, x_loc, y_loc, good_item)
+    return coords
+
+
+def _contour_moments(mask, contour, bbox, hole, weights=None):
+    # centroid of the item's pixels: inside the contour and in the mask (a hole contour's item
+    # is the hole, the pixels not in it), weighted by weights (e.g. gray levels) if given,
+    # in pixel index coords (pixel x is at x, not x+0.5 like bbox centers).
+    # Uncertainty: every boundary pixel could just as well be in or out of the mask (p=0.5), so it
+    # moves the centroid by weight*(x-cx)/m00 with variance 1/4; interior pixels are certain
+    # returns x, y centroid, x, y 1 sigma
+    x, y, w, h = bbox
+    x0, y0 = max(x - 1, 0), max(y - 1, 0) # 1 px of background around it for the erosion
+    x1, y1 = min(x + w + 1, mask.shape[1]), min(y + h + 1, mask.shape[0])
+    region = np.zeros((y1 - y0, x1 - x0), np.uint8)
+    cv2.drawContours(region, [contour], -1, 1, -1, offset=(-x0, -y0))
+    region &= (mask[y0:y1, x0:x1] == 0) if hole else (mask[y0:y1, x0:x1] > 0)
+    roi_weights = None if weights is None else weights[y0:y1, x0:x1]
+
+    def pixels(img):
+        ys, xs = np.nonzero(img)
+        return xs, ys, (np.ones(len(xs)) if roi_weights is None else roi_weights[ys, xs].astype(np.float64))
+
+    xs, ys, wts = pixels(region)
+    m00 = max(wts.sum(), 1e-12)
+    cx, cy = (wts * xs).sum() / m00, (wts * ys).sum() / m00
+    xs, ys, wts = pixels(region - cv2.erode(region, np.ones((3, 3), np.uint8))) # boundary pixels (8-conn)
+    var_x = 0.25 * ((wts * (xs - cx)) ** 2).sum() / m00 ** 2
+    var_y = 0.25 * ((wts * (ys - cy)) ** 2).sum() / m00 ** 2
+    return cx + x0, cy + y0, np.sqrt(var_x), np.sqrt(var_y)
+
+
+def detect_contours(masks, max_side=None, centers='bbox', weights=None):
+    """
+    detect_contours
+
+    find_items()' contour path for every class mask of preprocess(), as Detections (nothing
+    drawn): same items and centers, same speed
+
+    centers='bbox' are bbox centers like find_items(): whole/half pixels, and x+0.5*w puts
+    them half a pixel right of/below the middle in pixel index coords (the hand-tuned offsets
+    take that in). centers='moments' are sub-pixel centroids of each item's pixels (weighted
+    by weights if given) in pixel index coords, with their uncertainty in Detections.sigmas;
+    refit the offsets (calibrate_robot.py) before switching main over
+
+    :param masks: binary preprocessed img per class, e.g. [white mask, orange mask]
+    :param max_side: longest allowed bbox side (px), None=any (e.g. 2*cap diameter to drop streaks)
+    :param centers: 'bbox' or 'moments'
+    :param weights: for 'moments': image of pixel weights the size of the masks (e.g. the belt
+        image in gray), None=mask centroids
+    :returns: Detections, areas = contourArea()
+    """
+    points, sigmas, areas, bboxes, classes = [], [], [], [], []
+    for label, mask in enumerate(masks, 1):
+        contours, hierarchy = cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+        for i, contour in enumerate(contours):
+            area = cv2.contourArea(contour)
+            if not ITEM_MIN_AREA < area < ITEM_MAX_AREA:
+                continue
+            x, y, w, h = cv2.boundingRect(contour)
+            if max_side is not None and max(w, h) > max_side:
+                continue
+            if centers == 'moments':
+                depth, parent = 0, hierarchy[0][i][3]
+                while parent >= 0: # odd depth = hole contour (RETR_TREE)
+                    depth, parent = depth + 1, hierarchy[0][parent][3]
+                cx, cy, sx, sy = _contour_moments(mask, contour, (x, y, w, h), depth % 2 == 1, weights)
+                points.append((cx, cy))
+                sigmas.append((sx, sy))
+            else:
+                points.append((x + 0.5 * w, y + 0.5 * h))
+            areas.append(area)
+            bboxes.append((x, y, w, h))
+            classes.append(label)
+    points = np.array(points, dtype=np.float64).reshape(-1, 2)
+    sigmas = np.array(sigmas, dtype=np.float64).reshape(-1, 2) if centers == 'moments' else None
+    return Detections(points, np.array(areas, dtype=np.float64), np.array(bboxes, dtype=np.int32).reshape(-1, 4),
+                      np.array(classes, dtype=np.uint8), reach_zone(points), sigmas)
+
+
+def item_coords(detections, n_classes=len(ITEM_CLASSES)):
+    """
+    :returns: list per class of image coordinates (centers), e.g. [good coords, bad coords]
+    """
+    return [detections.centers[detections.classes == label].tolist() for label in range(1, n_classes + 1)]
+
+
+def start_img_window(window='default'):
+    """
+    starts the image window at the beginning of the program
+        so the show_img() is not blocking
+    
+    :param window: name of window
+    """
+    cv2.startWindowThread()
+    cv2.namedWindow(window, cv2.WINDOW_NORMAL)  
+
+def show_img(img, window='default', resize=True):
+    """
+    shows a blown-up version of the img
+    
+    :param img: image to show
+    :param window: name of window
+    :param resize: if it should be resized or not
+    """
+    if resize:
+        cv2.resizeWindow(window, (1190*2), (208*2)) # scale up
+    cv2.imshow(window, img) # Display the frame
+    # cv2.waitKey(0)
+    # cv2.destroyAllWindows()
+
+
+# hand-picked calibration points: belt image px and the matching robot coords
+CALIBRATION_IMG_PTS = [
+    [287,168],
+    [775,166],
+    [758,35],
+    [331,49]
+]
+CALIBRATION_ROBOT_PTS = [
+    [0,0], # ACCORDING TO FRAME 2....
+    [577.422,7.586],
+    [556.064,160.082],
+    [52.424,140.5]
+]
+
+def calculate_homography():
+    """
+    calculates homography matrix from these calinration points
+    (main.py loads it from the homography.py artifact instead of fitting it every start)
+
+    returns the H matrix for converting to robot coords later
+    """
+    img_pts = np.array(CALIBRATION_IMG_PTS)
+    robot_pts = np.array(CALIBRATION_ROBOT_PTS)
+    H, _ = cv2.findHomography(img_pts, robot_pts)
+    return H
+    
+
+# robot x/y offsets added after H, per class (orange mask was a little off bc of lighting)
+CLASS_OFFSETS = {LABEL_GOOD: (-15, 8), LABEL_BAD: (-17, 7)}
+
+def convert_pix_to_world(pix_x,pix_y,H, good=True):
+    """
+    convert_pix_to_world
+
+    converts pixel value to robot value (one point, see pix_to_world() for many)
+    
+    :param pix_x: pixel x val
+    :param pix_y: pixel y val
+    :param H: Homography matrix
+    :param good: if good or bad item b/c offsets are a little different (orange mask was a little off bc of lighting)
+    """
+    x_offset, y_offset = CLASS_OFFSETS[LABEL_GOOD if good else LABEL_BAD]
+    point = np.array([pix_x,pix_y,1.0])
+    world_pt = H @ point
+    world_pt /= world_pt[2] # normalize
+    return world_pt[0]+x_offset, world_pt[1]+y_offset
+
+def raw_to_belt_points(points, size, crop=BELT_CROP, roi=None):
+    """
+    raw_to_belt_points
+
+    raw (distorted) camera pixels -> belt image pixels: undistort, flip upside down, crop,
+    i.e. what get_belt_maps() does to the whole frame, for just these points
+
+    :param points: (N,2) x, y in the raw frame
+    :param size: (width, height) of the full sensor
+    :param crop: (x, y, w, h) of the belt band in the take_photo() frame
+    :param roi: (x, y, w, h) sensor window the raw frame covers, None=full frame
+    :returns: (N,2) x, y in the belt image
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 1, 2)
+    if roi is not None:
+        points = points + (roi[0], roi[1])
+    if len(points):
+        points = cv2.undistortPoints(points, camera_matrix, dist_coeffs, None, camera_matrix)
+    points = points.reshape(-1, 2)
+    return np.column_stack((points[:, 0] - crop[0], size[1] - 1 - points[:, 1] - crop[1]))
+
+def pix_to_world(points, classes, H, raw_size=None, crop=BELT_CROP, roi=None, offsets=None):
+    """
+    pix_to_world
+
+    convert_pix_to_world() for all items at once: one homography + per-class offsets
+    on an (N,2) array
+
+    :param points: (N,2) item centers, belt image pixels (or raw camera pixels with raw_size)
+    :param classes: (N,) LABEL_GOOD/LABEL_BAD per item, or one label for all of them
+    :param H: Homography matrix
+    :param raw_size: (width, height) of the full sensor if points are raw (distorted) camera
+        pixels: they're undistorted and moved to the belt image in the same step
+        (see raw_to_belt_points()), None=points are already belt image pixels
+    :param crop: (x, y, w, h) of the belt band, for raw points
+    :param roi: sensor window the raw frame covers, for raw points
+    :param offsets: {label: (x, y)} robot offsets per class, None=CLASS_OFFSETS
+    :returns: (N,2) robot x, y
+    """
+    if raw_size is not None:
+        points = raw_to_belt_points(points, raw_size, crop, roi)
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 1, 2)
+    if not len(points):
+        return np.empty((0, 2))
+    world = cv2.perspectiveTransform(points, np.asarray(H, dtype=np.float64)).reshape(-1, 2)
+    if offsets is None:
+        offsets = CLASS_OFFSETS
+    table = np.zeros((max(offsets) + 1, 2))
+    for label, offset in offsets.items():
+        table[label] = offset
+    return world + table[classes]
+
+def wait_for_items(img_coords, img_coords_bad):
+    """
+    wait_for_items
+
+    iterates through image coordinates and returns True if any item is beyond the value threshold
+    
+    :param img_coords: good item coords
+    :param img_coords_bad: bad item coords
+    """
+    value = 640
+    # iterate thru coords, return True if in range
+    for coord in img_coords:
+        if (coord[0]>=value):# and (coord[0]<(value+10)): # ignore starting unreachables
+            return True
+    for coord in img_coords_bad:
+        if (coord[0]>=value):# and (coord[0]<(value+10)):
+            return True
+    return False
@@ -0,0 +1,432 @@
+"""
+camera_session
+
+long-lived gig-E camera session: opens the camera once, keeps the SDK capture
+thread running and reuses aligned frame buffers for every shot
+(grab() copies the frame out, grab_lease() lends a pooled buffer instead)
+Note: pass sdk=fake_mvsdk to run without the camera/vendor SDK
+"""
+import collections
+import ctypes
+import threading
+import time
+import numpy as np
+import mvsdk
+
+
+# camera picked by find_camera(), per (sdk, select); only enumerated again on reconnect
+_devices = {}
+
+
+def camera_ip(DevInfo, sdk=mvsdk):
+    """
+    :returns: the camera's IP, '' if it has none (not GigE)
+    """
+    try:
+        return sdk.CameraGigeGetIp(DevInfo)[0]
+    except sdk.CameraException:
+        return ''
+
+
+def find_camera(select=None, sdk=mvsdk, refresh=False):
+    """
+    find_camera
+
+    picks a camera by serial number, friendly name or IP. The camera list is only
+    enumerated the first time (or with refresh=True, e.g. after the camera dropped off),
+    after that the same tSdkCameraDevInfo is handed back straight away
+
+    :param select: serial number, friendly name or IP; None=the only camera there is
+    :param sdk: mvsdk module (or fake_mvsdk)
+    :param refresh: enumerate again even if the camera was already found
+    :returns: tSdkCameraDevInfo for CameraInit
+    raises mvsdk.CameraException(CAMERA_STATUS_NO_DEVICE_FOUND) if no camera matches,
+        ValueError if select is None but there's more than one camera
+    """
+    key = (sdk.__name__, select)
+    if not refresh and key in _devices:
+        return _devices[key]
+    DevList = sdk.CameraEnumerateDevice()
+    for i, DevInfo in enumerate(DevList):
+        print("{}: {} {} sn={}".format(i, DevInfo.GetFriendlyName(), DevInfo.GetPortType(), DevInfo.GetSn()))
+    if select is None:
+        if len(DevList) > 1:
+            raise ValueError("{} cameras found, pick one by serial number, friendly name or IP".format(len(DevList)))
+        matches = DevList
+    else:
+        matches = [DevInfo for DevInfo in DevList if select in (DevInfo.GetSn(), DevInfo.GetFriendlyName())]
+        if not matches:
+            matches = [DevInfo for DevInfo in DevList if camera_ip(DevInfo, sdk) == select]
+    if not matches:
+        raise sdk.CameraException(sdk.CAMERA_STATUS_NO_DEVICE_FOUND)
+    _devices[key] = matches[0]
+    return matches[0]
+
+
+def forget_cameras():
+    """
+    forget_cameras
+
+    clears the find_camera() cache, the next open() enumerates again
+    """
+    _devices.clear()
+
+
+class BufferReleasedError(RuntimeError):
+    """
+    a FrameLease's image was used after release()
+    """
+
+
+class BufferPool:
+    """
+    BufferPool
+
+    fixed set of CameraAlignMalloc frame buffers, handed out and given back by address
+    """
+    def __init__(self, sdk, size, n_buffers=3, poison=False):
+        """
+        :param sdk: mvsdk module (or fake_mvsdk)
+        :param size: bytes per buffer (a full-sensor frame)
+        :param n_buffers: how many frames can be leased at once
+        :param poison: fill buffers with 0xCD on release, so a stale view shows up as garbage (debugging)
+        """
+        self.sdk = sdk
+        self.size = size
+        self.poison = poison
+        self.buffers = [sdk.CameraAlignMalloc(size, 16) for _ in range(n_buffers)]
+        self._free = list(self.buffers)
+        self._lock = threading.Lock()
+
+    @property
+    def n_leased(self):
+        return len(self.buffers) - len(self._free)
+
+    def acquire(self):
+        """
+        :returns: address of a free buffer
+        raises RuntimeError if all of them are leased out
+        """
+        with self._lock:
+            if not self._free:
+                raise RuntimeError("all {} frame buffers are leased, release() old frames first".format(len(self.buffers)))
+            return self._free.pop()
+
+    def release(self, address):
+        """
+        gives a buffer back to the pool
+        """
+        with self._lock:
+            if address in self._free or address not in self.buffers:
+                raise BufferReleasedError("frame buffer released twice")
+            if self.poison:
+                ctypes.memset(address, 0xCD, self.size)
+            self._free.append(address)
+
+    def close(self):
+        """
+        frees the buffers; ones still leased are left alone (not freed) rather than
+        pulled out from under a numpy view that might still be read
+        """
+        with self._lock:
+            if self.n_leased:
+                print("BufferPool: {} frame buffers still leased, not freeing them".format(self.n_leased))
+            for address in self._free:
+                self.sdk.CameraAlignFree(address)
+            self.buffers = [b for b in self.buffers if b not in self._free]
+            self._free = []
+
+
+class FrameLease:
+    """
+    FrameLease
+
+    a frame in a pooled SDK buffer, read through .image (a numpy view, no copy)
+    until release(). After that .image raises BufferReleasedError, and any view taken
+    before must not be used, the buffer goes to the next frame.
+
+    usage:
+        with cam.grab_lease() as lease:
+            process(lease.image)
+    """
+    def __init__(self, pool, address, shape, FrameHead):
+        self.pool = pool
+        self.address = address
+        self.FrameHead = FrameHead
+        frame_data = (pool.sdk.c_ubyte * FrameHead.uBytes).from_address(address)
+        self._image = np.frombuffer(frame_data, dtype=np.uint8).reshape(shape)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    @property
+    def released(self):
+        return self._image is None
+
+    @property
+    def image(self):
+        if self._image is None:
+            raise BufferReleasedError("frame used after release()")
+        return self._image
+
+    def release(self):
+        """
+        gives the buffer back to the pool, safe to call twice
+        """
+        if self._image is None:
+            return
+        self._image = None
+        self.pool.release(self.address)
+
+
+class CameraSession:
+    """
+    CameraSession
+
+    usage:
+        with CameraSession() as cam:
+            frame = cam.grab()
+    """
+    def __init__(self, sdk=mvsdk, exposure_us=50 * 1000, timeout_ms=200, roi=None, n_buffers=3, trigger_mode=0,
+                 select=None):
+        """
+        :param sdk: mvsdk module (or fake_mvsdk)
+        :param exposure_us: manual exposure time in microseconds
+        :param timeout_ms: how long grab() waits for a frame
+        :param roi: (x, y, w, h) sensor window to capture, None=full sensor (see set_roi())
+        :param n_buffers: pooled buffers for grab_lease(), i.e. frames leased at once
+        :param trigger_mode: 0=continuous acquisition, 1=a frame only per soft_trigger()
+        :param select: serial number, friendly name or IP of the camera, None=the only one (see find_camera())
+        """
+        self.sdk = sdk
+        self.select = select
+        self.name = None # friendly name of the opened camera
+        self.exposure_us = exposure_us
+        self.timeout_ms = timeout_ms
+        self.roi = roi
+        self.sensor_size = None # (width, height) of the full sensor, known once open
+        self.hCamera = 0
+        self.pFrameBuffer = 0
+        self.n_buffers = n_buffers
+        self.pool = None
+        self.mono = False
+        self.trigger_mode = trigger_mode
+        self.last_trigger = None # trigger id of the frame grab_into() got last, None=not triggered
+        self.missed_triggers = 0
+        self._trigger_id = 0
+        self._pending_triggers = collections.deque() # (id, time fired) waiting for their frame
+        # soft_trigger() vs. open()/close() (camera_supervisor re-opens from the stream thread)
+        self._trigger_lock = threading.RLock()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @property
+    def is_open(self):
+        return self.hCamera != 0
+
+    def open(self):
+        """
+        open
+
+        finds (see find_camera()), opens and configures the camera, starts capture and allocates the frame buffer
+        raises mvsdk.CameraException if the camera can't be opened
+        """
+        with self._trigger_lock: # no triggers on a handle that isn't configured yet
+            self._open()
+
+    def _open(self):
+        if self.is_open:
+            return
+        sdk = self.sdk
+        DevInfo = find_camera(self.select, sdk)
+        try:
+            self.hCamera = sdk.CameraInit(DevInfo, -1, -1)
+        except sdk.CameraException:
+            # cached camera info is stale (unplugged, new IP...), enumerate again once
+            DevInfo = find_camera(self.select, sdk, refresh=True)
+            self.hCamera = sdk.CameraInit(DevInfo, -1, -1)
+        self.name = sdk.CameraGetFriendlyName(self.hCamera)
+        cap = sdk.CameraGetCapability(self.hCamera)
+        self.mono = (cap.sIspCapacity.bMonoSensor != 0)
+        if self.mono:
+            sdk.CameraSetIspOutFormat(self.hCamera, sdk.CAMERA_MEDIA_TYPE_MONO8)
+        else:
+            sdk.CameraSetIspOutFormat(self.hCamera, sdk.CAMERA_MEDIA_TYPE_BGR8)
+        # continuous (or soft-triggered) acquisition, manual exposure
+        sdk.CameraSetTriggerMode(self.hCamera, self.trigger_mode)
+        sdk.CameraSetAeState(self.hCamera, 0)
+        sdk.CameraSetExposureTime(self.hCamera, self.exposure_us)
+        self.sensor_size = (cap.sResolutionRange.iWidthMax, cap.sResolutionRange.iHeightMax)
+        if self.roi is not None:
+            self._apply_roi()
+        sdk.CameraPlay(self.hCamera)
+        # one buffer big enough for the max resolution, reused for every frame (and any roi)
+        FrameBufferSize = cap.sResolutionRange.iWidthMax * cap.sResolutionRange.iHeightMax * (1 if self.mono else 3)
+        self.pFrameBuffer = sdk.CameraAlignMalloc(FrameBufferSize, 16)
+        self.pool = BufferPool(sdk, FrameBufferSize, self.n_buffers)
+
+    def set_roi(self, roi):
+        """
+        set_roi
+
+        only capture (and send over GigE / run the ISP on) part of the sensor.
+        Frames from grab() are then roi-sized; pixel (0, 0) is sensor pixel (x, y)
+
+        :param roi: (x, y, w, h) in full-sensor pixels, None=back to the full sensor
+        """
+        self.roi = roi
+        if self.is_open:
+            self._apply_roi()
+
+    def _apply_roi(self):
+        if self.roi is None:
+            x, y = 0, 0
+            w, h = self.sensor_size
+        else:
+            x, y, w, h = self.roi
+        # 0xff = custom resolution (ROI), no binning/skipping, no zoom
+        self.sdk.CameraSetImageResolutionEx(self.hCamera, 0xff, 0, 0, x, y, w, h, 0, 0)
+
+    def soft_trigger(self):
+        """
+        soft_trigger
+
+        takes one picture now (trigger_mode=1). The frame grab_into() gets for it
+        has last_trigger == the returned id
+
+        :returns: trigger id (counts up from 1), None if the camera isn't there right now
+        """
+        with self._trigger_lock:
+            if not self.is_open:
+                return None
+            try:
+                self.sdk.CameraSoftTrigger(self.hCamera)
+            except self.sdk.CameraException as e:
+                print("CameraSoftTrigger failed({}): {}".format(e.error_code, e.message))
+                return None
+            self._trigger_id += 1
+            self._pending_triggers.append((self._trigger_id, time.perf_counter()))
+            return self._trigger_id
+
+    def _match_trigger(self, FrameHead):
+        # frames come out in trigger order; a trigger that never got a frame within
+        # exposure + timeout is dropped (counted in missed_triggers) so later ones still match
+        if not FrameHead.bIsTrigger:
+            return None
+        oldest = time.perf_counter() - (self.exposure_us / 1e6 + self.timeout_ms / 1000.0)
+        with self._trigger_lock:
+            while len(self._pending_triggers) > 1 and self._pending_triggers[0][1] < oldest:
+                self._pending_triggers.popleft()
+                self.missed_triggers += 1
+            if not self._pending_triggers:
+                return None
+            return self._pending_triggers.popleft()[0]
+
+    def close(self):
+        """
+        close
+
+        stops the camera and frees the frame buffer, safe to call twice
+        """
+        with self._trigger_lock: # no triggers on a handle being closed
+            if self.hCamera:
+                self.sdk.CameraUnInit(self.hCamera)
+                self.hCamera = 0
+            # their frames won't come any more
+            self.missed_triggers += len(self._pending_triggers)
+            self._pending_triggers.clear()
+        if self.pFrameBuffer:
+            self.sdk.CameraAlignFree(self.pFrameBuffer)
+            self.pFrameBuffer = 0
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+    def reopen(self):
+        """
+        reopen
+
+        close() + open() with soft_trigger() held off the whole time, so a trigger from another
+        thread (camera_trigger) waits for the new handle instead of hitting the old one or
+        one that's half set up. raises like open(), the camera is closed then
+        """
+        with self._trigger_lock:
+            self.close()
+            self.open()
+
+    def grab_into(self, pOut):
+        """
+        grab_into
+
+        gets the next frame from the running camera and has the ISP write it straight into pOut
+
+        :param pOut: address of a buffer big enough for a full-sensor frame
+        :returns: the frame's tSdkFrameHead (size, format, camera timestamp), None on timeout/error;
+            self.last_trigger says which soft_trigger() it answers
+        """
+        sdk = self.sdk
+        if not self.is_open:
+            self.open()
+        try:
+            pRawData, FrameHead = sdk.CameraGetImageBuffer(self.hCamera, self.timeout_ms)
+            sdk.CameraImageProcess(self.hCamera, pRawData, pOut, FrameHead)
+            sdk.CameraReleaseImageBuffer(self.hCamera, pRawData)
+        except sdk.CameraException as e:
+            if e.error_code != sdk.CAMERA_STATUS_TIME_OUT:
+                print("CameraGetImageBuffer failed({}): {}".format(e.error_code, e.message))
+            return None
+        self.last_trigger = self._match_trigger(FrameHead)
+        return FrameHead
+
+    def frame_shape(self, FrameHead):
+        """
+        :returns: numpy shape (h, w, channels) of a frame with this header
+        """
+        return (FrameHead.iHeight, FrameHead.iWidth, 1 if FrameHead.uiMediaType == self.sdk.CAMERA_MEDIA_TYPE_MONO8 else 3)
+
+    def grab_lease(self):
+        """
+        grab_lease
+
+        gets the next frame without copying it: the ISP writes into a pooled buffer and
+        the frame is read through lease.image until lease.release()
+
+        :returns: FrameLease, None on timeout/error
+        raises RuntimeError if every pooled buffer is still leased
+        """
+        if not self.is_open:
+            self.open()
+        address = self.pool.acquire()
+        FrameHead = self.grab_into(address)
+        if FrameHead is None:
+            self.pool.release(address)
+            return None
+        return FrameLease(self.pool, address, self.frame_shape(FrameHead), FrameHead)
+
+    def grab(self):
+        """
+        grab
+
+        gets the next frame from the running camera
+
+        :returns: copy of the frame (HxWx3 BGR or HxWx1 mono), None on timeout/error
+        """
+        if not self.is_open:
+            self.open()
+        FrameHead = self.grab_into(self.pFrameBuffer)
+        if FrameHead is None:
+            return None
+        frame_data = (self.sdk.c_ubyte * FrameHead.uBytes).from_address(self.pFrameBuffer)
+        frame = np.frombuffer(frame_data, dtype=np.uint8)
+        frame = frame.reshape(self.frame_shape(FrameHead))
+        return frame.copy()
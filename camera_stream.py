@@ -0,0 +1,174 @@
+"""
+camera_stream
+
+background acquisition: a producer thread pulls frames from an open CameraSession
+as fast as the camera sends them, into a fixed ring of preallocated numpy buffers,
+and the main loop just takes the newest one (no waiting on the camera, no copy)
+"""
+import collections
+import threading
+import time
+import numpy as np
+
+# image: HxWxC view into a ring slot, valid until the next latest() call
+# seq: frame number since start()
+# timestamp: camera time of the exposure in s (tSdkFrameHead.uiTimeStamp, 0.1 ms units, wraps)
+# grabbed_at: time.perf_counter() when the frame got to the PC
+# trigger: id of the session.soft_trigger() the frame answers, None in continuous mode
+Frame = collections.namedtuple('Frame', ['image', 'seq', 'timestamp', 'grabbed_at', 'trigger'])
+
+
+def age(frame):
+    """
+    :returns: how old the frame is in s (since it got to the PC)
+    """
+    return time.perf_counter() - frame.grabbed_at
+
+
+class CameraStream:
+    """
+    CameraStream
+
+    usage:
+        with camera_session.CameraSession() as cam, CameraStream(cam) as stream:
+            frame = stream.latest()
+            ... frame.image, age(frame) ...
+
+    Only the stream's thread grabs from the session while it runs, don't call cam.grab() too.
+    Meant for one consumer: the slot handed out by latest() is never written until the
+    next latest() call, every other slot gets recycled.
+    """
+    def __init__(self, session, n_slots=4, supervisor=None):
+        """
+        :param session: camera_session.CameraSession (opened by start() if it isn't yet)
+        :param n_slots: ring size, at least 3 (one being written, the newest, the one handed out)
+        :param supervisor: camera_supervisor.CameraSupervisor told about every frame/timeout,
+            re-opens the camera from this thread when the link is gone; the thread stops if it gives up
+        """
+        if n_slots < 3:
+            raise ValueError("n_slots must be at least 3")
+        self.session = session
+        self.supervisor = supervisor
+        self.n_slots = n_slots
+        self.slots = []
+        self._heads = [None] * n_slots
+        self._seqs = [-1] * n_slots
+        self._grabbed_at = [0.0] * n_slots
+        self._triggers = [None] * n_slots
+        self._newest = None # slot with the newest frame
+        self._held = None   # slot the consumer has
+        self._seq = -1
+        self.timeouts = 0
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._ended = False
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._ended
+
+    def start(self):
+        """
+        start
+
+        opens the session if needed, allocates the ring and starts the producer thread
+        """
+        if self.running:
+            return
+        self.session.open()
+        width, height = self.session.sensor_size
+        size = width * height * (1 if self.session.mono else 3)
+        if not self.slots:
+            self.slots = [np.empty(size, dtype=np.uint8) for _ in range(self.n_slots)]
+        self._stop.clear()
+        self._ended = False
+        self._thread = threading.Thread(target=self._run, name='CameraStream', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        stop
+
+        stops the producer thread (the session stays open)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._cond:
+            self._cond.notify_all()
+
+    def _free_slot(self):
+        # oldest slot that is neither the newest frame nor the one the consumer has
+        with self._cond:
+            free = [i for i in range(self.n_slots) if i != self._newest and i != self._held]
+            return min(free, key=lambda i: self._seqs[i])
+
+    def _run(self):
+        while not self._stop.is_set():
+            i = self._free_slot()
+            FrameHead = self.session.grab_into(self.slots[i].ctypes.data)
+            if FrameHead is None:
+                self.timeouts += 1
+                if self.supervisor is not None and not self.supervisor.frame_missed():
+                    break # camera gone for good
+                continue
+            if self.supervisor is not None:
+                self.supervisor.frame_ok()
+            grabbed_at = time.perf_counter()
+            with self._cond:
+                self._seq += 1
+                self._heads[i] = FrameHead
+                self._seqs[i] = self._seq
+                self._grabbed_at[i] = grabbed_at
+                self._triggers[i] = self.session.last_trigger
+                self._newest = i
+                self._cond.notify_all()
+        with self._cond:
+            self._ended = True # wake anyone waiting in latest()
+            self._cond.notify_all()
+
+    @property
+    def seq(self):
+        """
+        seq of the newest frame so far (-1 = none yet)
+        """
+        return self._seq
+
+    def latest(self, newer_than=-1, since=None, timeout=1.0, trigger=None):
+        """
+        latest
+
+        newest frame, waiting for one if it's not new enough yet
+
+        :param newer_than: only a frame with seq > this (e.g. the last one processed)
+        :param since: only a frame that got to the PC after this time.perf_counter() value
+            (e.g. after the conveyor stopped)
+        :param timeout: s to wait
+        :param trigger: only the frame for this soft trigger id (or a later trigger's)
+        :returns: Frame (image is a view into the ring, not a copy), None on timeout
+        """
+        deadline = time.perf_counter() + timeout
+        with self._cond:
+            while True:
+                i = self._newest
+                if (i is not None and self._seqs[i] > newer_than and (since is None or self._grabbed_at[i] > since)
+                        and (trigger is None or (self._triggers[i] or 0) >= trigger)):
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self.running:
+                    return None
+                self._cond.wait(remaining)
+            self._held = i
+            FrameHead = self._heads[i]
+            image = self.slots[i][:FrameHead.uBytes].reshape(self.session.frame_shape(FrameHead))
+            return Frame(image, self._seqs[i], FrameHead.uiTimeStamp / 10000.0, self._grabbed_at[i], self._triggers[i])
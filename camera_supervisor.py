@@ -0,0 +1,181 @@
+"""
+camera_supervisor
+
+keeps a CameraSession alive through GigE link drops: the SDK reconnects on its own
+(CameraSetAutoConnect), and if frames stop and CameraConnectTest fails the camera is
+re-opened with backoff (soft triggers held off meanwhile), giving up after max_recovery_s so a dead camera can't hang the line.
+Also collects frame/link health numbers for the main loop to print.
+"""
+import time
+
+
+class CameraSupervisor:
+    """
+    CameraSupervisor
+
+    usage:
+        cam.open()
+        supervisor = CameraSupervisor(cam)
+        supervisor.attach()
+        stream = camera_stream.CameraStream(cam, supervisor=supervisor)
+        supervisor.timer = camera_trigger.TriggerTimer(cam)  # held while the camera is re-opened
+        ...
+        print(supervisor.health())
+    """
+    def __init__(self, session, max_recovery_s=5.0, reconnect_grace_s=1.0, timeouts_before_check=3,
+                 backoff_s=0.05, max_backoff_s=1.0, timer=None):
+        """
+        :param session: camera_session.CameraSession
+        :param max_recovery_s: give up after this long (failed=True), the bound on recover()
+        :param reconnect_grace_s: how long to let the SDK's auto-reconnect bring the link back
+            before re-opening the camera ourselves
+        :param timeouts_before_check: frame timeouts in a row before the link is tested
+        :param backoff_s: first wait between re-open attempts, doubled each time
+        :param max_backoff_s: longest wait between re-open attempts
+        :param timer: camera_trigger.TriggerTimer firing the session's soft triggers, held
+            while recover() runs (can be set later, timer attribute), None=no timer
+        """
+        self.session = session
+        self.timer = timer
+        self.sdk = session.sdk
+        self.max_recovery_s = max_recovery_s
+        self.reconnect_grace_s = reconnect_grace_s
+        self.timeouts_before_check = timeouts_before_check
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.failed = False
+        self.link_up = True
+        self.timeouts = 0
+        self.recoveries = [] # s each recovery took
+        self.link_events = [] # (time.perf_counter(), 'lost'/'restored') from the SDK callback
+        self._in_a_row = 0
+        self._status_callback = None
+
+    def attach(self):
+        """
+        attach
+
+        turns on SDK auto-reconnect and the connection status callback for the open camera
+        (called again after every re-open, the handle changes)
+        """
+        sdk = self.sdk
+        hCamera = self.session.hCamera
+        sdk.CameraSetAutoConnect(hCamera, 1)
+        # keep a reference, the SDK only holds the raw function pointer
+        self._status_callback = sdk.CAMERA_CONNECTION_STATUS_CALLBACK(self._on_status)
+        sdk.CameraSetConnectionStatusCallback(hCamera, self._status_callback)
+
+    def _on_status(self, hCamera, MSG, uParam, pContext):
+        # MSG 0 = link lost, 1 = link back (SDK thread)
+        self.link_up = (MSG != 0)
+        self.link_events.append((time.perf_counter(), 'restored' if self.link_up else 'lost'))
+
+    def frame_ok(self):
+        """
+        a frame came in
+        """
+        self._in_a_row = 0
+
+    def frame_missed(self):
+        """
+        frame_missed
+
+        a grab timed out; after timeouts_before_check in a row the link is tested and
+        the camera re-opened if it's gone. Timeouts on a healthy link (e.g. triggers paused)
+        are fine and just counted.
+
+        :returns: False if the camera couldn't be brought back (failed)
+        """
+        self.timeouts += 1
+        self._in_a_row += 1
+        if self._in_a_row < self.timeouts_before_check:
+            return True
+        self._in_a_row = 0
+        if self.connected():
+            return True
+        return self.recover()
+
+    def connected(self):
+        """
+        :returns: True if the camera is open and answers CameraConnectTest
+        """
+        if not self.session.is_open:
+            return False
+        return self.sdk.CameraConnectTest(self.session.hCamera) == self.sdk.CAMERA_STATUS_SUCCESS
+
+    def recover(self):
+        """
+        recover
+
+        first waits up to reconnect_grace_s for the SDK's auto-reconnect, then re-opens the
+        camera (re-enumerating if needed) until it works or max_recovery_s is up.
+        Settings (roi, trigger mode, exposure) are put back by CameraSession.open().
+        Runs on the stream thread: the trigger timer is held meanwhile, and the re-open
+        (CameraSession.reopen()) locks out soft triggers from other threads
+
+        :returns: True once frames can flow again, False if it gave up (failed=True)
+        """
+        timer = self.timer
+        if timer is not None:
+            timer.hold()
+        try:
+            return self._recover()
+        finally:
+            if timer is not None:
+                timer.release()
+
+    def _recover(self):
+        start = time.perf_counter()
+        delay = self.backoff_s
+        while time.perf_counter() - start < self.reconnect_grace_s:
+            time.sleep(delay)
+            if self.connected():
+                self.recoveries.append(time.perf_counter() - start)
+                print("Camera link back after {:.2f} s.".format(self.recoveries[-1]))
+                return True
+            delay = min(delay * 2, self.max_backoff_s, self.reconnect_grace_s / 4)
+        delay = self.backoff_s
+        while True:
+            try:
+                self.session.reopen()
+                self.attach()
+                if self.connected():
+                    self.recoveries.append(time.perf_counter() - start)
+                    print("Camera back after {:.2f} s.".format(self.recoveries[-1]))
+                    return True
+            except (self.sdk.CameraException, ValueError) as e:
+                print("Camera re-open failed: {}".format(e))
+            if time.perf_counter() - start + delay > self.max_recovery_s:
+                self.session.close()
+                self.failed = True
+                print("Camera gone for {:.1f} s, giving up.".format(time.perf_counter() - start))
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_backoff_s)
+
+    def health(self):
+        """
+        health
+
+        :returns: dict with connected, reconnects (SDK auto-reconnects), frames_total,
+            frames_captured, frames_lost, frames_error (from CameraGetFrameStatistic),
+            timeouts, recoveries, last_recovery_s, failed
+        """
+        report = {
+            'connected': self.connected(),
+            'timeouts': self.timeouts,
+            'recoveries': len(self.recoveries),
+            'last_recovery_s': self.recoveries[-1] if self.recoveries else None,
+            'failed': self.failed,
+        }
+        if self.session.is_open:
+            hCamera = self.session.hCamera
+            stats = self.sdk.CameraGetFrameStatistic(hCamera)
+            report.update(
+                reconnects=self.sdk.CameraGetReConnectCounts(hCamera),
+                frames_total=stats.iTotal,
+                frames_captured=stats.iCapture,
+                frames_lost=stats.iLost,
+                frames_error=stats.iTotal - stats.iCapture,
+            )
+        return report
@@ -0,0 +1,127 @@
+"""
+camera_trigger
+
+fires the camera's soft trigger at a set rate while the belt is moving, so frames are
+only taken (and processed) when they're useful instead of as fast as the camera can go
+Note: the session has to be opened with trigger_mode=1
+"""
+import threading
+import time
+
+
+class TriggerTimer:
+    """
+    TriggerTimer
+
+    usage:
+        cam = camera_session.CameraSession(trigger_mode=1)
+        with camera_stream.CameraStream(cam) as stream, TriggerTimer(cam, 10) as timer:
+            frame = stream.latest(seq)      # a frame every 1/10 s
+            timer.pause()                   # belt stopped, no more frames
+            timer.hold() ... timer.release() # camera being re-opened (camera_supervisor)
+            trigger = cam.soft_trigger()    # one picture on an event
+            frame = stream.latest(trigger=trigger)
+    """
+    def __init__(self, session, rate_hz=10.0):
+        """
+        :param session: open camera_session.CameraSession with trigger_mode=1
+        :param rate_hz: triggers per second while running
+        """
+        self.session = session
+        self.rate_hz = rate_hz
+        self.fired = 0
+        self._paused = threading.Event()
+        self._held = threading.Event()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def start(self):
+        """
+        start
+
+        starts firing (un-paused)
+        """
+        self._paused.clear()
+        if self._thread is not None and self._thread.is_alive():
+            self._wake.set()
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='TriggerTimer', daemon=True)
+        self._thread.start()
+
+    def pause(self):
+        """
+        pause
+
+        stops firing until resume() (e.g. belt stopped, nothing new to see)
+        """
+        self._paused.set()
+        self._wake.set()
+
+    def resume(self):
+        """
+        resume
+
+        starts firing again after pause() (starts the thread if it isn't running yet)
+        """
+        self.start()
+
+    def hold(self):
+        """
+        hold
+
+        stops firing until release(), whatever pause()/resume() do in between
+        (the camera is being re-opened, see camera_supervisor)
+        """
+        self._held.set()
+        self._wake.set()
+
+    def release(self):
+        """
+        release
+
+        undoes hold(): fires again unless paused
+        """
+        self._held.clear()
+        self._wake.set()
+
+    def set_rate(self, rate_hz):
+        """
+        :param rate_hz: new triggers per second, takes effect from the next trigger
+        """
+        self.rate_hz = rate_hz
+        self._wake.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        next_at = time.perf_counter()
+        while not self._stop.is_set():
+            if self._paused.is_set() or self._held.is_set():
+                self._wake.wait()
+                self._wake.clear()
+                next_at = time.perf_counter()
+                continue
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                if self._wake.wait(delay):
+                    self._wake.clear()
+                    continue
+            self.session.soft_trigger()
+            self.fired += 1
+            # fixed schedule, but don't try to catch up after a long stall
+            next_at = max(next_at + 1.0 / self.rate_hz, time.perf_counter())
@@ -0,0 +1,331 @@
+"""
+fake_epson
+
+stand-in for the Epson controller's Modbus slave so modbus_fxns can run without the robot
+(benchmarks, offline checks on the laptop): a pymodbus TCP server on localhost, on its own
+thread, with the coils and registers main.py uses (same addresses as modbus_fxns).
+Counts every request (one TCP round trip each) and can delay them like the real network.
+With an EpsonProgram (or just cycle_s) it also runs the robot's side of the handshake, a
+state machine following epson_code's main/Main1: waits for START_COMMAND, cycle_done off,
+reads and "picks" the items Python sent (timed moves), back home, cycle_done on, waits again
+(START still on by then = another cycle, Main1's Wait Sw(robot_start) only looks at the level).
+
+usage:
+    with fake_epson.FakeEpson(latency_s=0.002) as robot:
+        client = robot.client()
+        modbus_fxns.send_item_coords(client, good, bad)
+        robot.registers(32, 68), robot.requests
+"""
+import asyncio
+import collections
+import socket
+import threading
+import time
+from pymodbus.server import ModbusTcpServer
+from pymodbus.simulator import DataType, SimData, SimDevice
+import modbus_async
+import modbus_fxns
+import pick_planner
+
+N_REGISTERS = 256 # holding registers Python writes (Epson InW words)
+N_INPUTS = 64     # input registers Python reads (Epson outputs, cycle_done in ROBOT_CYCLE_COMPLETE)
+N_COILS = 1024    # bits Python writes (START_COMMAND, CONVEYOR_ON, ...)
+
+
+# EpsonProgram.state, where epson_code's main loop is
+HOME = 'home'             # Jump P(1) at the top of the loop
+WAIT_START = 'wait_start' # Main1: Wait Sw(robot_start)
+PICKING = 'picking'       # Main1 after TmReset/Off cycle_done: Pick_and_Place per item
+RETURN = 'return'         # Jump P(1) after Main1, then On cycle_done
+FINISHED = 'finished'     # a pallet's full, program over (cycle_done left on)
+
+# one Pick_and_Place as the sim ran it:
+# x, y: robot coords it read (InW / 100)
+# good: which pallet
+# descend_at: s after START it waited for (pick on the fly), -1=went straight down
+# gripped: s after START the gripper closed
+# placed: False if the pallet was full (Main1 skips it, still counts it)
+Pick = collections.namedtuple('Pick', ['x', 'y', 'good', 'descend_at', 'gripped', 'placed'])
+
+
+def free_port():
+    """
+    :returns: a TCP port nothing on localhost is listening on right now
+    """
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class EpsonProgram:
+    """
+    EpsonProgram
+
+    epson_code's main loop and Main1 as a state machine, run by FakeEpson on its server's loop;
+    move times from pick_planner.RobotTiming (approach, descend, place per item, start_s from
+    seeing START to moving), home_s for the Jump home after the picks
+
+    usage:
+        program = EpsonProgram(timing, home_s=0.3)
+        with FakeEpson(program=program) as robot:
+            ... program.state, program.picks, program.cycles ...
+    """
+    def __init__(self, timing=pick_planner.DEFAULT_TIMING, home_s=0.3, cycle_s=None, limit_good=15, limit_bad=5,
+                 poll_s=0.002):
+        """
+        :param timing: pick_planner.RobotTiming the moves take
+        :param home_s: Jump P(1) after the last item
+        :param cycle_s: s from START seen to cycle_done on, or a function returning the next one,
+            instead of the move times (items are still read and counted); None=from timing
+        :param limit_good, limit_bad: pallet sizes (main's limits), None=no limit
+        :param poll_s: how often Wait Sw looks at START_COMMAND
+        """
+        self.timing = timing
+        self.home_s = home_s
+        self.cycle_s = cycle_s
+        self.limit_good = limit_good
+        self.limit_bad = limit_bad
+        self.poll_s = poll_s
+        self.state = HOME
+        self.total_good = 0
+        self.total_bad = 0
+        self.picks = []  # Pick per Pick_and_Place, all cycles
+        self.cycles = [] # (START seen, cycle_done on) perf_counter times
+
+    def running(self):
+        return ((self.limit_good is None or self.total_good < self.limit_good) and
+                (self.limit_bad is None or self.total_bad < self.limit_bad))
+
+    def items(self, robot):
+        """
+        Main1 reading what Python sent
+
+        :returns: [(x, y, good, descend_at), ...] in pick order
+        """
+        words = robot.registers(0, modbus_fxns.PICK_TIMES_END)
+        scale = 100.0
+        on_the_fly = words[modbus_fxns.PICK_MODE] == 1
+        good = [(words[modbus_fxns.GOOD_COORDS + 2 * i] / scale, words[modbus_fxns.GOOD_COORDS + 2 * i + 1] / scale, True,
+                 words[modbus_fxns.PICK_TIMES_GOOD + i] / scale if on_the_fly else -1)
+                for i in range(words[modbus_fxns.GOOD_COUNT])]
+        bad = [(words[modbus_fxns.BAD_COORDS + 2 * i] / scale, words[modbus_fxns.BAD_COORDS + 2 * i + 1] / scale, False,
+                words[modbus_fxns.PICK_TIMES_BAD + i] / scale if on_the_fly else -1)
+               for i in range(words[modbus_fxns.BAD_COUNT])]
+        if not on_the_fly:
+            return good + bad
+        # merged by descend time, a good item first on a tie (InW(142 + ig) <= InW(181 + ib))
+        merged = []
+        while good or bad:
+            merged.append(good.pop(0) if good and (not bad or good[0][3] <= bad[0][3]) else bad.pop(0))
+        return merged
+
+    async def run(self, robot):
+        """
+        run
+
+        the program: main's loop until a pallet is full
+        :param robot: FakeEpson whose registers/bits it reads and writes
+        """
+        robot.set_cycle_done(True)
+        while self.running():
+            self.state = WAIT_START # Jump P(1): home already
+            while not robot.coil(modbus_fxns.START_COMMAND):
+                await asyncio.sleep(self.poll_s)
+            started = time.perf_counter() # TmReset 0
+            robot.set_cycle_done(False)
+            self.state = PICKING
+            items = self.items(robot)
+            if self.cycle_s is not None:
+                await asyncio.sleep(self.cycle_s() if callable(self.cycle_s) else self.cycle_s)
+                for x, y, good, descend_at in items:
+                    self._count(x, y, good, descend_at, time.perf_counter() - started)
+            else:
+                await asyncio.sleep(self.timing.start_s)
+                for x, y, good, descend_at in items:
+                    await asyncio.sleep(self.timing.approach_s)
+                    await asyncio.sleep(max(0.0, started + descend_at - time.perf_counter()))
+                    await asyncio.sleep(self.timing.descend_s)
+                    gripped = time.perf_counter() - started
+                    await asyncio.sleep(self.timing.place_s)
+                    self._count(x, y, good, descend_at, gripped)
+                self.state = RETURN
+                await asyncio.sleep(self.home_s)
+            robot.set_cycle_done(True)
+            self.cycles.append((started, time.perf_counter()))
+        self.state = FINISHED
+
+    def _count(self, x, y, good, descend_at, gripped):
+        # Pick_and_Place if the pallet has room, the total goes up either way (like Main1)
+        if good:
+            placed = self.limit_good is None or self.total_good < self.limit_good
+            self.total_good += 1
+        else:
+            placed = self.limit_bad is None or self.total_bad < self.limit_bad
+            self.total_bad += 1
+        self.picks.append(Pick(x, y, good, descend_at, gripped, placed))
+
+
+class FakeEpson:
+    """
+    FakeEpson
+
+    usage:
+        robot = FakeEpson()
+        robot.start()
+        client = robot.client()         # modbus_fxns.initialize_modbus() client for it
+        ...
+        robot.registers(99)             # what Python wrote
+        robot.set_cycle_done(True)      # what Python reads
+        robot.stop()
+
+        FakeEpson(cycle_s=2.5)          # robot answers START_COMMAND with a 2.5 s cycle
+        FakeEpson(program=EpsonProgram()) # robot "picks" what was sent, Main1's timing
+    """
+    def __init__(self, port=None, latency_s=0.0, cycle_done=True, cycle_s=None, poll_s=0.002, program=None):
+        """
+        :param port: TCP port, None=any free one
+        :param latency_s: s added to every request (network + controller), 0=as fast as localhost
+        :param cycle_done: starting state of the robot's cycle_done bit
+        :param cycle_s: robot cycle length in s (START_COMMAND seen -> cycle_done on), or a function
+            returning the next one (an EpsonProgram with no pallet limits);
+            None and no program=no robot, cycle_done only changes with set_cycle_done()
+        :param poll_s: how often the robot looks at START_COMMAND (Wait Sw polling)
+        :param program: EpsonProgram to run (instead of cycle_s)
+        """
+        self.port = free_port() if port is None else port
+        self.latency_s = latency_s
+        if program is None and cycle_s is not None:
+            program = EpsonProgram(cycle_s=cycle_s, limit_good=None, limit_bad=None, poll_s=poll_s)
+        self.program = program
+        self.requests = 0 # requests served (round trips)
+        self.function_codes = collections.Counter() # requests per Modbus function code
+        self._cycle_done = cycle_done
+        self._delay_pending = False
+        self._server = None
+        self._robot_task = None
+        self._loop = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    @property
+    def cycles(self):
+        """
+        robot cycles run: (START seen, cycle_done on) perf_counter times
+        """
+        return self.program.cycles if self.program is not None else []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def start(self):
+        """
+        start
+
+        starts the server thread, returns once it's listening
+        """
+        if self._thread is not None:
+            return
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name='FakeEpson', daemon=True)
+        self._thread.start()
+        if not self._ready.wait(5.0):
+            raise RuntimeError("fake_epson server didn't start on port {}".format(self.port))
+
+    def stop(self):
+        if self._thread is None:
+            return
+        if self._robot_task is not None:
+            self._loop.call_soon_threadsafe(self._robot_task.cancel)
+        asyncio.run_coroutine_threadsafe(self._server.shutdown(), self._loop).result(5.0)
+        self._thread.join(5.0)
+        self._thread = None
+
+    def client(self):
+        """
+        :returns: connected modbus_fxns client for this server
+        """
+        return modbus_fxns.initialize_modbus('tcp', '127.0.0.1', self.port)
+
+    async def async_client(self):
+        """
+        :returns: connected modbus_async client for this server (in the caller's event loop)
+        """
+        return await modbus_async.initialize_modbus('127.0.0.1', self.port)
+
+    def reset_counts(self):
+        self.requests = 0
+        self.function_codes.clear()
+
+    def _block(self, name):
+        # (start address, count, values, flags) of the server's 'c'/'h'/'i' block
+        return self._server.context.devices[1].block[name]
+
+    def registers(self, address, count=1):
+        """
+        :returns: list of count holding register values from address (what Python wrote)
+        """
+        start, _, values, _ = self._block('h')
+        return list(values[address - start:address - start + count])
+
+    def coil(self, address):
+        """
+        :returns: the coil's (bit's) state
+        """
+        start, _, values, _ = self._block('c')
+        word, bit = divmod(address, 16)
+        return bool(values[word - start] >> bit & 1)
+
+    def set_cycle_done(self, done):
+        """
+        set_cycle_done
+
+        sets the robot's cycle_done bit (ROBOT_CYCLE_COMPLETE bit 0) Python polls
+        """
+        self._cycle_done = done
+        start, _, values, _ = self._block('i')
+        address = modbus_fxns.ROBOT_CYCLE_COMPLETE - start
+        values[address] = (values[address] & ~1) | int(bool(done))
+
+    def _trace_pdu(self, sending, pdu):
+        # every request and response pdu goes through here
+        if not sending:
+            self.requests += 1
+            self.function_codes[pdu.function_code] += 1
+            self._delay_pending = True
+        return pdu
+
+    async def _action(self, function_code, start_address, address, count, registers, values):
+        # called by pymodbus before it reads/writes the block (twice for writes), the delay once per request
+        if self._delay_pending and self.latency_s:
+            self._delay_pending = False
+            await asyncio.sleep(self.latency_s)
+        return None
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        device = SimDevice(1, (
+            [SimData(0, count=N_COILS, values=False, datatype=DataType.BITS)],
+            [SimData(0, count=16, values=False, datatype=DataType.BITS)],
+            [SimData(0, count=N_REGISTERS, values=0, datatype=DataType.REGISTERS)],
+            [SimData(0, count=N_INPUTS, values=0, datatype=DataType.REGISTERS)]),
+            action=self._action)
+
+        async def serve():
+            self._server = ModbusTcpServer(device, address=('127.0.0.1', self.port), trace_pdu=self._trace_pdu)
+            self.set_cycle_done(self._cycle_done)
+            await self._server.serve_forever(background=True) # returns once listening
+            if self.program is not None:
+                self._robot_task = asyncio.ensure_future(self.program.run(self))
+            self._ready.set()
+            await self._server.serving
+
+        try:
+            self._loop.run_until_complete(serve())
+        finally:
+            self._loop.close()
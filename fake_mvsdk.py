@@ -0,0 +1,362 @@
+"""
+fake_mvsdk
+
+pure-Python stand-in for mvsdk.py so the camera code can run without the vendor SDK
+or a camera plugged in (benchmarks, offline checks on the laptop)
+Only the calls camera_session.py uses are here, with the same names/signatures as mvsdk.
+
+usage:
+    import fake_mvsdk
+    fake_mvsdk.configure(init_delay=0.3)
+    with camera_session.CameraSession(sdk=fake_mvsdk) as cam:
+        frame = cam.grab()
+"""
+import ctypes
+import threading
+import time
+import numpy as np
+
+c_ubyte = ctypes.c_ubyte
+
+# same values as mvsdk
+CAMERA_STATUS_SUCCESS = 0
+CAMERA_STATUS_FAILED = -1
+CAMERA_STATUS_TIME_OUT = -12
+CAMERA_STATUS_NO_DEVICE_FOUND = -16
+CAMERA_STATUS_DEVICE_LOST = -38
+CAMERA_MEDIA_TYPE_MONO8 = 0x01000000 | 0x00080000 | 0x0001
+CAMERA_MEDIA_TYPE_BGR8 = 0x02000000 | 0x00180000 | 0x0015
+CAMERA_CONNECTION_STATUS_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p)
+
+# Simulated rig settings, change with configure()
+settings = {
+    'width': 1280,
+    'height': 1024,
+    'devices': [('FakeCam', 'FAKE0001', '192.168.0.50')], # (friendly name, serial, ip) per camera
+    'enum_delay': 0.1,    # s, CameraEnumerateDevice (GigE discovery broadcast)
+    'init_delay': 0.15,   # s, CameraInit handshake
+    'uninit_delay': 0.05, # s, CameraUnInit
+    'frame_delay': 0.0,   # s, time until the next frame is ready
+    'link_bytes_per_s': None, # GigE throughput, frames also wait size/rate to "transfer" (None=instant)
+    'frame_source': None, # fn(seq) -> (height, width, 3) uint8 BGR full-sensor frame (cut to any ROI)
+    'lose_every': 0,      # every Nth frame is lost on the wire (counted in iLost), 0=never
+    'error_every': 0,     # every Nth frame arrives broken (counted in iTotal, not iCapture), 0=never
+}
+calls = [] # (name, args) of every SDK call, for checking what the camera layer did
+
+_handles = {}
+_buffers = {}
+_next_handle = 1
+_link = {'down_until': 0.0, 'kill_handles': False}
+
+
+class CameraException(Exception):
+    def __init__(self, error_code):
+        super(CameraException, self).__init__()
+        self.error_code = error_code
+        self.message = "fake_mvsdk error {}".format(error_code)
+
+    def __str__(self):
+        return 'error_code:{} message:{}'.format(self.error_code, self.message)
+
+
+class tSdkCameraDevInfo(object):
+    def __init__(self, name='FakeCam', sn='FAKE0001', port='NET-1000M', ip='192.168.0.50'):
+        self.acFriendlyName = name
+        self.acSn = sn
+        self.acPortType = port
+        self.ip = ip
+
+    def GetFriendlyName(self):
+        return self.acFriendlyName
+    def GetPortType(self):
+        return self.acPortType
+    def GetSn(self):
+        return self.acSn
+
+
+class tSdkFrameHead(object):
+    def __init__(self, width, height, media_type, seq):
+        self.uiMediaType = media_type
+        self.iWidth = width
+        self.iHeight = height
+        self.uBytes = width * height * (1 if media_type == CAMERA_MEDIA_TYPE_MONO8 else 3)
+        self.bIsTrigger = 0
+        self.uiTimeStamp = int(time.perf_counter() * 10000) & 0xFFFFFFFF # 0.1 ms units like the SDK
+        self.uiExpTime = 0
+        self.seq = seq
+
+
+class _Struct(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def inject_link_drop(seconds, kill_handles=False):
+    """
+    inject_link_drop
+
+    the GigE link goes down for `seconds`: grabs time out, CameraConnectTest fails,
+    the camera can't be found or opened. With auto connect on, open handles come back
+    by themselves afterwards (reconnect count + status callback) unless kill_handles,
+    then they stay dead and the camera has to be re-opened
+
+    :param seconds: how long the link is down, from now
+    :param kill_handles: open handles don't survive the drop
+    """
+    _link['down_until'] = time.perf_counter() + seconds
+    _link['kill_handles'] = kill_handles
+
+
+def _link_down():
+    return time.perf_counter() < _link['down_until']
+
+
+def _link_ok(hCamera, cam):
+    # tracks a handle through a link drop; False while it can't talk to the camera
+    if _link_down():
+        if not cam['lost_link']:
+            cam['lost_link'] = True
+            cam['dead'] = _link['kill_handles']
+            if cam['status_callback'] is not None:
+                cam['status_callback'](hCamera, 0, 0, None)
+        return False
+    if cam['lost_link'] and not cam['dead'] and cam['auto_connect']:
+        cam['lost_link'] = False
+        cam['reconnects'] += 1
+        if cam['status_callback'] is not None:
+            cam['status_callback'](hCamera, 1, 0, None)
+    return not cam['lost_link']
+
+
+def configure(**kwargs):
+    """
+    configure
+
+    changes the simulated camera (see settings), clears the call log and ends any link drop
+
+    :param kwargs: any key in settings
+    """
+    for key in kwargs:
+        if key not in settings:
+            raise KeyError(key)
+    settings.update(kwargs)
+    del calls[:]
+    _link['down_until'] = 0.0
+
+
+def default_frame(seq, width, height):
+    """
+    default_frame
+
+    flat grey belt with a white and an orange cap, shifted a little every frame
+
+    :param seq: frame number
+    """
+    frame = np.full((height, width, 3), 60, dtype=np.uint8)
+    x = (40 + 7 * seq) % (width - 28)
+    x_bad = (x + 200) % (width - 28)
+    y = height // 2
+    frame[y-14:y+14, x:x+28] = (235, 235, 235)
+    frame[y-14:y+14, x_bad:x_bad+28] = (0, 140, 240)
+    return frame
+
+
+def _log(name, *args):
+    calls.append((name, args))
+
+
+def _camera(hCamera):
+    try:
+        return _handles[hCamera]
+    except KeyError:
+        raise CameraException(CAMERA_STATUS_FAILED)
+
+
+def CameraEnumerateDevice(MaxCount = 32):
+    _log('CameraEnumerateDevice')
+    time.sleep(settings['enum_delay'])
+    if _link_down():
+        return []
+    return [tSdkCameraDevInfo(name, sn, 'NET-1000M', ip) for name, sn, ip in settings['devices']][:MaxCount]
+
+def CameraGigeGetIp(pCameraInfo):
+    _log('CameraGigeGetIp', pCameraInfo.GetSn())
+    return (pCameraInfo.ip, '255.255.252.0', '0.0.0.0', '192.168.0.15', '255.255.252.0', '0.0.0.0')
+
+def CameraGetFriendlyName(hCamera):
+    return _camera(hCamera)['info'].GetFriendlyName()
+
+def CameraInit(pCameraInfo, emParamLoadMode = -1, emTeam = -1):
+    global _next_handle
+    _log('CameraInit', pCameraInfo.GetSn())
+    time.sleep(settings['init_delay'])
+    if _link_down():
+        raise CameraException(CAMERA_STATUS_DEVICE_LOST)
+    if pCameraInfo.GetSn() not in [sn for _, sn, _ in settings['devices']]:
+        raise CameraException(CAMERA_STATUS_FAILED) # unplugged since it was enumerated
+    hCamera = _next_handle
+    _next_handle += 1
+    _handles[hCamera] = {
+        'info': pCameraInfo,
+        'media_type': CAMERA_MEDIA_TYPE_BGR8,
+        'playing': False,
+        'seq': 0,
+        'raw': {},
+        'roi': None,
+        'trigger_mode': 0,
+        'triggers': 0, # soft triggers fired but not answered with a frame yet
+        'cond': threading.Condition(),
+        'auto_connect': False,
+        'status_callback': None,
+        'lost_link': False,
+        'dead': False,
+        'reconnects': 0,
+        'stats': {'total': 0, 'capture': 0, 'lost': 0},
+    }
+    return hCamera
+
+def CameraUnInit(hCamera):
+    _log('CameraUnInit', hCamera)
+    time.sleep(settings['uninit_delay'])
+    _camera(hCamera)
+    del _handles[hCamera]
+    return CAMERA_STATUS_SUCCESS
+
+def CameraGetCapability(hCamera):
+    _camera(hCamera)
+    return _Struct(
+        sIspCapacity=_Struct(bMonoSensor=0),
+        sResolutionRange=_Struct(iWidthMax=settings['width'], iHeightMax=settings['height']),
+    )
+
+def CameraSetIspOutFormat(hCamera, uFormat):
+    _log('CameraSetIspOutFormat', hCamera, uFormat)
+    _camera(hCamera)['media_type'] = uFormat
+    return CAMERA_STATUS_SUCCESS
+
+def CameraSetTriggerMode(hCamera, iModeSel):
+    _log('CameraSetTriggerMode', hCamera, iModeSel)
+    _camera(hCamera)['trigger_mode'] = iModeSel
+    return CAMERA_STATUS_SUCCESS
+
+def CameraSoftTrigger(hCamera):
+    _log('CameraSoftTrigger', hCamera)
+    cam = _camera(hCamera)
+    if cam['trigger_mode'] != 1:
+        raise CameraException(CAMERA_STATUS_FAILED)
+    if not _link_ok(hCamera, cam):
+        raise CameraException(CAMERA_STATUS_DEVICE_LOST)
+    with cam['cond']:
+        cam['triggers'] += 1
+        cam['cond'].notify_all()
+    return CAMERA_STATUS_SUCCESS
+
+def CameraSetAutoConnect(hCamera, bEnable):
+    _log('CameraSetAutoConnect', hCamera, bEnable)
+    _camera(hCamera)['auto_connect'] = bool(bEnable)
+    return CAMERA_STATUS_SUCCESS
+
+def CameraSetConnectionStatusCallback(hCamera, pCallBack, pContext = 0):
+    _log('CameraSetConnectionStatusCallback', hCamera)
+    _camera(hCamera)['status_callback'] = pCallBack
+    return CAMERA_STATUS_SUCCESS
+
+def CameraGetReConnectCounts(hCamera):
+    return _camera(hCamera)['reconnects']
+
+def CameraConnectTest(hCamera):
+    _log('CameraConnectTest', hCamera)
+    cam = _camera(hCamera)
+    return CAMERA_STATUS_SUCCESS if _link_ok(hCamera, cam) else CAMERA_STATUS_DEVICE_LOST
+
+def CameraGetFrameStatistic(hCamera):
+    stats = _camera(hCamera)['stats']
+    return _Struct(iTotal=stats['total'], iCapture=stats['capture'], iLost=stats['lost'])
+
+def CameraSetAeState(hCamera, bAeState):
+    _log('CameraSetAeState', hCamera, bAeState)
+    return CAMERA_STATUS_SUCCESS
+
+def CameraSetExposureTime(hCamera, fExposureTime):
+    _log('CameraSetExposureTime', hCamera, fExposureTime)
+    return CAMERA_STATUS_SUCCESS
+
+def CameraSetImageResolutionEx(hCamera, iIndex, Mode, ModeSize, x, y, width, height, ZoomWidth, ZoomHeight):
+    _log('CameraSetImageResolutionEx', hCamera, iIndex, Mode, ModeSize, x, y, width, height, ZoomWidth, ZoomHeight)
+    cam = _camera(hCamera)
+    if x < 0 or y < 0 or width <= 0 or height <= 0 or x + width > settings['width'] or y + height > settings['height']:
+        raise CameraException(CAMERA_STATUS_FAILED)
+    if (x, y, width, height) == (0, 0, settings['width'], settings['height']):
+        cam['roi'] = None
+    else:
+        cam['roi'] = (x, y, width, height)
+    return CAMERA_STATUS_SUCCESS
+
+def CameraPlay(hCamera):
+    _log('CameraPlay', hCamera)
+    _camera(hCamera)['playing'] = True
+    return CAMERA_STATUS_SUCCESS
+
+def CameraAlignMalloc(size, align = 16):
+    buf = ctypes.create_string_buffer(size + align)
+    address = ctypes.addressof(buf)
+    aligned = (address + align - 1) // align * align
+    _buffers[aligned] = buf # keep the memory alive until CameraAlignFree
+    return aligned
+
+def CameraAlignFree(membuffer):
+    _buffers.pop(membuffer, None)
+
+def CameraGetImageBuffer(hCamera, wTimes):
+    cam = _camera(hCamera)
+    if not cam['playing']:
+        raise CameraException(CAMERA_STATUS_TIME_OUT)
+    if not _link_ok(hCamera, cam):
+        time.sleep(wTimes / 1000.0)
+        raise CameraException(CAMERA_STATUS_TIME_OUT)
+    triggered = cam['trigger_mode'] == 1
+    if triggered:
+        # a frame only comes out for a soft trigger
+        with cam['cond']:
+            if not cam['cond'].wait_for(lambda: cam['triggers'] > 0, wTimes / 1000.0):
+                raise CameraException(CAMERA_STATUS_TIME_OUT)
+            cam['triggers'] -= 1
+    if settings['frame_delay'] > wTimes / 1000.0:
+        time.sleep(wTimes / 1000.0)
+        raise CameraException(CAMERA_STATUS_TIME_OUT)
+    time.sleep(settings['frame_delay'])
+    stats = cam['stats']
+    for every, counter in ((settings['lose_every'], 'lost'), (settings['error_every'], 'total')):
+        if every and (cam['seq'] + 1) % every == 0:
+            stats[counter] += 1 # this frame never makes it, the next one does
+            cam['seq'] += 1
+    stats['total'] += 1
+    stats['capture'] += 1
+    seq = cam['seq']
+    cam['seq'] += 1
+    source = settings['frame_source']
+    if source is None:
+        frame = default_frame(seq, settings['width'], settings['height'])
+    else:
+        frame = source(seq)
+    if cam['roi'] is not None:
+        x, y, w, h = cam['roi']
+        frame = frame[y:y+h, x:x+w]
+    frame = np.ascontiguousarray(frame, dtype=np.uint8)
+    if settings['link_bytes_per_s']:
+        time.sleep(frame.nbytes / float(settings['link_bytes_per_s']))
+    head = tSdkFrameHead(frame.shape[1], frame.shape[0], cam['media_type'], seq)
+    head.bIsTrigger = 1 if triggered else 0
+    pRawData = frame.ctypes.data
+    cam['raw'][pRawData] = frame
+    return (pRawData, head)
+
+def CameraImageProcess(hCamera, pbyIn, pbyOut, pFrInfo):
+    frame = _camera(hCamera)['raw'][pbyIn]
+    ctypes.memmove(pbyOut, pbyIn, frame.nbytes)
+    return CAMERA_STATUS_SUCCESS
+
+def CameraReleaseImageBuffer(hCamera, pbyBuffer):
+    _camera(hCamera)['raw'].pop(pbyBuffer, None)
+    return CAMERA_STATUS_SUCCESS
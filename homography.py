@@ -0,0 +1,205 @@
+"""
+homography
+
+pixel -> robot calibration saved as a versioned artifact (homography.json): H, its inverse,
+the per-class offsets, the point pairs it was fitted from, the fit residuals and a content
+hash. main.py loads it once at start (nothing is refitted unless the points change) and
+picks up a new file while the line runs.
+
+usage:
+    python homography.py              # (re)build homography.json from the points/offsets in it
+                                      # (or camera_fxns' defaults if there's no file yet)
+"""
+import collections
+import hashlib
+import json
+import os
+import sys
+import cv2
+import numpy as np
+import camera_fxns
+
+ARTIFACT_FILE = 'homography.json'
+VERSION = 1
+
+# H, H_inv: 3x3 belt image px -> robot (and back)
+# offsets: {label: (x, y)} robot offsets added per class (camera_fxns.CLASS_OFFSETS)
+# img_pts, robot_pts: (N,2) point pairs H was fitted from
+# residuals: (N,) robot distance (mm) from each robot_pt to where H puts its img_pt
+# calibration: camera_fxns.calibration_id() of the camera-params.json the img_pts were picked with
+# crop: belt band (x, y, w, h) the img_pts are in
+# sha1: content hash, the model's version id
+HomographyModel = collections.namedtuple('HomographyModel', [
+    'H', 'H_inv', 'offsets', 'img_pts', 'robot_pts', 'residuals', 'calibration', 'crop', 'sha1'])
+
+
+def to_world(model, points, classes, **kwargs):
+    """
+    to_world
+
+    camera_fxns.pix_to_world() with this model's H and offsets
+
+    :param model: HomographyModel
+    :param points: (N,2) belt image px
+    :param classes: (N,) labels, or one label for all
+    :returns: (N,2) robot x, y
+    """
+    return camera_fxns.pix_to_world(points, classes, model.H, offsets=model.offsets, **kwargs)
+
+
+def _content(model):
+    # everything but the hash, as saved (labels as class names so the file reads easily)
+    names = {label: name for label, (name, _, _) in enumerate(camera_fxns.ITEM_CLASSES, 1)}
+    return {
+        'version': VERSION,
+        'H': np.asarray(model.H).tolist(),
+        'H_inv': np.asarray(model.H_inv).tolist(),
+        'offsets': {names[label]: list(offset) for label, offset in sorted(model.offsets.items())},
+        'img_pts': np.asarray(model.img_pts).tolist(),
+        'robot_pts': np.asarray(model.robot_pts).tolist(),
+        'residuals_mm': np.asarray(model.residuals).tolist(),
+        'rms_mm': float(np.sqrt(np.mean(np.square(model.residuals)))) if len(model.residuals) else 0.0,
+        'calibration': model.calibration,
+        'crop': list(model.crop),
+    }
+
+
+def _hash(content):
+    return hashlib.sha1(json.dumps(content, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def build_model(img_pts, robot_pts, offsets=None, method=0, H=None):
+    """
+    build_model
+
+    fits H to the point pairs and works out everything else the artifact holds
+
+    :param img_pts: (N,2) belt image px, N >= 4
+    :param robot_pts: (N,2) matching robot coords
+    :param offsets: {label: (x, y)}, None=camera_fxns.CLASS_OFFSETS
+    :param method: cv2.findHomography method (0=least squares over all points, cv2.RANSAC, ...)
+    :param H: already fitted H for these pairs (e.g. calibrate_robot's), None=fit it here
+    :returns: HomographyModel
+    """
+    img_pts = np.asarray(img_pts, dtype=np.float64).reshape(-1, 2)
+    robot_pts = np.asarray(robot_pts, dtype=np.float64).reshape(-1, 2)
+    if H is None:
+        H, _ = cv2.findHomography(img_pts, robot_pts, method)
+    if H is None:
+        raise ValueError("no homography fits these {} points".format(len(img_pts)))
+    fitted = cv2.perspectiveTransform(img_pts.reshape(-1, 1, 2), H).reshape(-1, 2)
+    residuals = np.linalg.norm(fitted - robot_pts, axis=1)
+    if offsets is None:
+        offsets = camera_fxns.CLASS_OFFSETS
+    model = HomographyModel(H, np.linalg.inv(H), {label: tuple(offset) for label, offset in offsets.items()},
+                            img_pts, robot_pts, residuals, camera_fxns.calibration_id(),
+                            tuple(camera_fxns.BELT_CROP), None)
+    return model._replace(sha1=_hash(_content(model)))
+
+
+def save_model(model, path=ARTIFACT_FILE):
+    """
+    save_model
+
+    writes the artifact (to a temp file first, so a running main.py never reads half a file)
+    """
+    content = _content(model)
+    content['sha1'] = _hash(content)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as json_file:
+        json.dump(content, json_file, indent=3)
+    os.replace(tmp, path)
+
+
+def load_model(path=ARTIFACT_FILE):
+    """
+    load_model
+
+    reads and checks the artifact: version, content hash, H_inv, and that it was fitted
+    for the camera-params.json calibration and belt crop camera_fxns is using now
+
+    :returns: HomographyModel
+    :raises ValueError: if the artifact can't be used
+    """
+    with open(path, 'r') as json_file:
+        content = json.load(json_file)
+    if content.get('version') != VERSION:
+        raise ValueError("{}: version {}, expected {}".format(path, content.get('version'), VERSION))
+    sha1 = content.pop('sha1', None)
+    if sha1 != _hash(content):
+        raise ValueError("{}: content doesn't match its hash (edited by hand? rebuild it with homography.py)".format(path))
+    if content['calibration'] != camera_fxns.calibration_id():
+        raise ValueError("{}: fitted for another camera calibration than camera-params.json".format(path))
+    if tuple(content['crop']) != tuple(camera_fxns.BELT_CROP):
+        raise ValueError("{}: fitted for belt crop {}, using {}".format(path, content['crop'], camera_fxns.BELT_CROP))
+    H = np.array(content['H'])
+    H_inv = np.array(content['H_inv'])
+    if H.shape != (3, 3) or not np.allclose(H @ H_inv, np.eye(3), atol=1e-9):
+        raise ValueError("{}: H_inv isn't the inverse of H".format(path))
+    labels = {name: label for label, (name, _, _) in enumerate(camera_fxns.ITEM_CLASSES, 1)}
+    offsets = {labels[name]: tuple(offset) for name, offset in content['offsets'].items()}
+    return HomographyModel(H, H_inv, offsets, np.array(content['img_pts']), np.array(content['robot_pts']),
+                           np.array(content['residuals_mm']), content['calibration'], tuple(content['crop']), sha1)
+
+
+class HomographyFile:
+    """
+    HomographyFile
+
+    the artifact loaded once and kept in memory; .model loads it again only after the file
+    changed (cheap stat per call), so a new calibration gets used without restarting main.py.
+    A new file that doesn't load keeps the old model in use.
+
+    usage:
+        calib = HomographyFile()
+        ...
+        world = homography.to_world(calib.model, points, classes)
+    """
+    def __init__(self, path=ARTIFACT_FILE, build_missing=True):
+        """
+        :param path: artifact file
+        :param build_missing: no file yet: fit camera_fxns' default points once and save it
+        """
+        self.path = path
+        self.reloads = 0
+        if build_missing and not os.path.isfile(path):
+            print("No {}, fitting the default calibration points.".format(path))
+            save_model(build_model(camera_fxns.CALIBRATION_IMG_PTS, camera_fxns.CALIBRATION_ROBOT_PTS), path)
+        self._stamp = self._file_stamp()
+        self._model = load_model(path)
+
+    def _file_stamp(self):
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def model(self):
+        try:
+            stamp = self._file_stamp()
+        except OSError:
+            return self._model # file being replaced, keep the one in memory
+        if stamp != self._stamp:
+            self._stamp = stamp
+            try:
+                self._model = load_model(self.path)
+                self.reloads += 1
+                print("Loaded new calibration {} from {}.".format(self._model.sha1, self.path))
+            except (ValueError, KeyError, OSError) as e:
+                print("Ignoring new {}, keeping calibration {}: {}".format(self.path, self._model.sha1, e))
+        return self._model
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else ARTIFACT_FILE
+    if os.path.isfile(path):
+        # refit from the points/offsets in the file (e.g. after editing them)
+        with open(path, 'r') as json_file:
+            content = json.load(json_file)
+        labels = {name: label for label, (name, _, _) in enumerate(camera_fxns.ITEM_CLASSES, 1)}
+        model = build_model(content['img_pts'], content['robot_pts'],
+                            {labels[name]: offset for name, offset in content['offsets'].items()})
+    else:
+        model = build_model(camera_fxns.CALIBRATION_IMG_PTS, camera_fxns.CALIBRATION_ROBOT_PTS)
+    save_model(model, path)
+    print("{}: calibration {}, {} points, residuals (mm): {}".format(
+        path, model.sha1, len(model.img_pts), np.round(model.residuals, 3).tolist()))
@@ -0,0 +1,146 @@
+"""
+item_overlay
+
+draws the detected items on the belt image and shows it, apart from detection:
+at most rate_hz times a second, or not at all (headless), so the control loop doesn't pay
+for drawing every frame. Showing (imshow/waitKey) always happens in submit(), on the caller's
+thread: HighGUI windows only work from the main thread on Qt/Cocoa. threaded=True only moves
+the drawing to a worker
+"""
+import threading
+import time
+import camera_fxns
+
+
+def show_window(img, window='default'):
+    """
+    show_window
+
+    default show for OverlayRenderer: camera_fxns.show_img() + a 1 ms waitKey
+
+    :returns: True if ESC was pressed
+    """
+    camera_fxns.show_img(img, window)
+    return camera_fxns.cv2.waitKey(1) & 0xFF == 27
+
+
+class OverlayRenderer:
+    """
+    OverlayRenderer
+
+    usage:
+        overlay = OverlayRenderer(rate_hz=5)
+        overlay.start()
+        ...
+        items = camera_fxns.detect_contours([img, bad_img])
+        overlay.submit(cropped, items)  # drawn on a copy, cropped stays as it is
+        if overlay.esc_pressed:
+            ...
+        overlay.stop()
+    """
+    def __init__(self, rate_hz=5.0, threaded=False, show=show_window):
+        """
+        :param rate_hz: most redraws per second, 0 = headless (submit() does nothing)
+        :param threaded: draw on the overlay's own thread, submit() shows the last one it drew
+            (a redraw behind); else draw inside submit(). No faster than inline on the bench
+            (bench_vision.bench_overlay), the drawing is cheap
+        :param show: fn(img) that displays the drawn image, returns True to ask the loop to stop
+            (e.g. ESC pressed); the default needs camera_fxns.start_img_window() (done by start()).
+            Only called from submit()
+        """
+        self.rate_hz = rate_hz
+        self.threaded = threaded
+        self.show = show
+        self.esc_pressed = False
+        self.drawn = 0     # overlays shown
+        self.submitted = 0 # frames handed in
+        self._latest = None # (img, detections) not drawn yet
+        self._ready = None # threaded: drawn image not shown yet
+        self._next_at = 0.0
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread = None
+
+    @property
+    def enabled(self):
+        return self.rate_hz > 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def start(self):
+        """
+        start
+
+        opens the window (default show, call it from the main thread) and starts the drawing
+        thread if threaded
+        """
+        if not self.enabled:
+            return
+        if self.show is show_window:
+            camera_fxns.start_img_window()
+        if self.threaded and self._thread is None:
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name='OverlayRenderer', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.enabled and self.show is show_window:
+            camera_fxns.cv2.destroyAllWindows()
+
+    def submit(self, img, detections):
+        """
+        submit
+
+        hands in the newest belt image + its detections; frames in between redraws are skipped.
+        Shows the overlay (call it from the main thread)
+
+        :param img: belt image (not changed, the overlay is drawn on a copy);
+            don't write to it afterwards while threaded
+        :param detections: camera_fxns.Detections for img
+        """
+        if not self.enabled:
+            return
+        self.submitted += 1
+        if self.threaded:
+            with self._cond:
+                self._latest = (img, detections)
+                ready, self._ready = self._ready, None
+                self._cond.notify_all()
+            if ready is not None:
+                self._show(ready)
+            return
+        now = time.perf_counter()
+        if now >= self._next_at:
+            self._next_at = now + 1.0 / self.rate_hz
+            self._show(camera_fxns.draw_detections(img.copy(), detections))
+
+    def _show(self, drawn):
+        if self.show(drawn):
+            self.esc_pressed = True
+        self.drawn += 1
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._latest is None and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                img, detections = self._latest
+                self._latest = None
+            drawn = camera_fxns.draw_detections(img.copy(), detections)
+            with self._cond: # for the next submit() to show; rate limit, newer frames replace _latest meanwhile
+                self._ready = drawn
+                self._cond.wait_for(lambda: self._stop, 1.0 / self.rate_hz)
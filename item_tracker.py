@@ -0,0 +1,273 @@
+"""
+item_tracker
+
+keeps items' identities from frame to frame: every detect_contours() result is matched to
+the items already known (nearest neighbour, greedy or optimal), so each cap keeps its id
+while it rides the belt. The belt moves everything together, so one belt velocity is
+estimated from the matched items and used to predict where they'll be at any time,
+e.g. where they stopped after the conveyor was switched off, or where they'll be when the
+robot gets there.
+"""
+import collections
+import time
+import numpy as np
+
+# tracked items, one row per item:
+# ids: (N,) persistent item ids
+# centers: (N,2) x, y belt image px at the last update's time (predicted if not seen then)
+# classes: (N,) LABEL_GOOD/LABEL_BAD/...
+# hits: (N,) frames the item was seen in
+# missed: (N,) frames in a row it wasn't seen (0 = in the last frame)
+# seen_at: (N,) time it was last seen
+Tracks = collections.namedtuple('Tracks', ['ids', 'centers', 'classes', 'hits', 'missed', 'seen_at'])
+
+
+def greedy_assignment(cost, max_cost):
+    """
+    greedy_assignment
+
+    nearest pairs first: takes the cheapest (track, detection) pair, drops its row and column,
+    repeats. Same as the optimal assignment unless items are closer together than they move
+
+    :param cost: (T,D) cost matrix (np.inf = not allowed)
+    :param max_cost: pairs costing more aren't matched
+    :returns: (M,) track rows, (M,) detection columns
+    """
+    rows, cols = np.nonzero(cost <= max_cost)
+    order = np.argsort(cost[rows, cols], kind='stable')
+    used_rows, used_cols = set(), set()
+    match_rows, match_cols = [], []
+    for r, c in zip(rows[order].tolist(), cols[order].tolist()):
+        if r not in used_rows and c not in used_cols:
+            used_rows.add(r)
+            used_cols.add(c)
+            match_rows.append(r)
+            match_cols.append(c)
+    return np.array(match_rows, dtype=np.intp), np.array(match_cols, dtype=np.intp)
+
+
+def hungarian_assignment(cost, max_cost):
+    """
+    hungarian_assignment
+
+    optimal assignment (least total cost, Hungarian method with potentials, O(n^3), fine for
+    the ~33 items on a belt photo; no scipy needed). Pairs costing more than max_cost are
+    treated as not allowed
+
+    :param cost: (T,D) cost matrix (np.inf = not allowed)
+    :param max_cost: pairs costing more aren't matched
+    :returns: (M,) track rows, (M,) detection columns
+    """
+    n_rows, n_cols = cost.shape
+    if not n_rows or not n_cols:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    # square, with "not matched" costing a bit more than any allowed pair
+    n = max(n_rows, n_cols)
+    allowed = cost <= max_cost
+    unmatched = (float(cost[allowed].max()) if allowed.any() else 0.0) + 1.0
+    square = np.full((n, n), unmatched)
+    square[:n_rows, :n_cols] = np.where(allowed, cost, unmatched)
+    # e-maxx style: rows added one by one, column potentials v, row potentials u (1-based)
+    u = np.zeros(n + 1)
+    v = np.zeros(n + 1)
+    p = np.zeros(n + 1, dtype=np.intp) # p[j] = row matched to column j
+    way = np.zeros(n + 1, dtype=np.intp)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(n + 1, np.inf)
+        used = np.zeros(n + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used[1:]
+            reduced = square[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    rows, cols = p[1:] - 1, np.arange(n)
+    keep = (rows >= 0) & (rows < n_rows) & (cols < n_cols)
+    rows, cols = rows[keep], cols[keep]
+    keep = allowed[rows, cols]
+    order = np.argsort(rows[keep])
+    return rows[keep][order], cols[keep][order]
+
+
+class ItemTracker:
+    """
+    ItemTracker
+
+    usage:
+        tracker = ItemTracker()
+        ...
+        items = camera_fxns.detect_contours([img, bad_img])
+        tracks = tracker.update(items.centers, items.classes, frame.grabbed_at)
+        ... tracks.ids ...
+        conveyor off at t_stop:
+        tracker.halt(t_stop)                      # belt stopped, items stay where they got to
+        where = tracker.predict(time.perf_counter())
+    """
+    def __init__(self, max_distance=25.0, max_missed=3, assignment='greedy', velocity_smoothing=0.5,
+                 max_speed=None, velocity=(0.0, 0.0)):
+        """
+        :param max_distance: px a detection may be from a track's predicted spot to be that item
+        :param max_missed: frames in a row an item may go unseen before it's dropped
+            (e.g. hidden under the robot arm), after that it's gone (picked or off the belt)
+        :param assignment: 'greedy' (nearest first) or 'hungarian' (least total distance)
+        :param velocity_smoothing: weight of the newest velocity measurement (1 = no smoothing)
+        :param max_speed: px/s; belt velocity measurements faster than this are ignored (mismatches)
+        :param velocity: belt px/s (x, y) to start from, e.g. the conveyor's usual speed; from 0 the
+            first frames are matched as if the belt stood still
+        """
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.assign = {'greedy': greedy_assignment, 'hungarian': hungarian_assignment}[assignment]
+        self.velocity_smoothing = velocity_smoothing
+        self.max_speed = max_speed
+        self.velocity = np.array(velocity, dtype=np.float64) # belt px/s (x, y)
+        self.halted_at = None       # time the belt stopped, None = running
+        self.next_id = 0
+        self.updated_at = None
+        self._ids = np.empty(0, dtype=np.int64)
+        self._centers = np.empty((0, 2))
+        self._first_centers = np.empty((0, 2)) # where each item was first seen (at _first_seen)
+        self._first_seen = np.empty(0)
+        self._classes = np.empty(0, dtype=np.uint8)
+        self._hits = np.empty(0, dtype=np.int64)
+        self._missed = np.empty(0, dtype=np.int64)
+        self._seen_at = np.empty(0)
+
+    @property
+    def tracks(self):
+        """
+        Tracks as of the last update()
+        """
+        return Tracks(self._ids.copy(), self._centers.copy(), self._classes.copy(), self._hits.copy(),
+                      self._missed.copy(), self._seen_at.copy())
+
+    def _moved(self, t0, t1):
+        # belt travel (px) from t0 to t1 at the current velocity, nothing after halt()
+        if self.halted_at is not None:
+            t1 = min(t1, self.halted_at)
+            t0 = min(t0, self.halted_at)
+        return self.velocity * (t1 - t0)
+
+    def predict(self, t, ids=None):
+        """
+        predict
+
+        :param t: time (same clock as update()'s, e.g. time.perf_counter())
+        :param ids: item ids to predict, None=all in tracks order
+        :returns: (N,2) where the items are at time t
+        """
+        centers = self._centers
+        if ids is not None:
+            rows = {item_id: row for row, item_id in enumerate(self._ids.tolist())}
+            centers = centers[[rows[item_id] for item_id in ids]]
+        if self.updated_at is None:
+            return centers.copy()
+        return centers + self._moved(self.updated_at, t)
+
+    def halt(self, t):
+        """
+        halt
+
+        belt stopped at time t: from then on predictions stay put (velocity is kept for resume())
+        """
+        self.halted_at = t
+
+    def resume(self, t=None):
+        """
+        resume
+
+        belt running again at time t (default now, time.perf_counter()): the stop is cut out of
+        the items' history, as if the belt had never stopped, so neither the predictions nor the
+        next velocity measurement count the stopped time as travel
+        """
+        if self.halted_at is None:
+            return
+        if t is None:
+            t = time.perf_counter()
+        if self.updated_at is not None:
+            self._centers = self.predict(self.halted_at)
+            self.updated_at = t
+        stopped = t - self.halted_at
+        self._seen_at = np.minimum(self._seen_at, self.halted_at) + stopped
+        self._first_seen = np.minimum(self._first_seen, self.halted_at) + stopped
+        self.halted_at = None
+
+    def update(self, centers, classes, t):
+        """
+        update
+
+        matches the frame's detections to the known items, updates the belt velocity from the
+        matched ones, starts new items and drops ones gone for more than max_missed frames
+
+        :param centers: (N,2) detected centers (Detections.centers)
+        :param classes: (N,) labels; an item never switches class
+        :param t: time of the frame (camera_stream.Frame.grabbed_at)
+        :returns: Tracks after the update, and (N,) id of every detection (same order as centers)
+        """
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        classes = np.asarray(classes).reshape(-1)
+        predicted = self.predict(t)
+        cost = np.linalg.norm(predicted[:, None] - centers[None], axis=2)
+        cost[self._classes[:, None] != classes[None]] = np.inf
+        rows, cols = self.assign(cost, self.max_distance)
+
+        # belt velocity: median of the matched items' own moves since they were first seen (the
+        # belt moves them all alike; the longer the baseline the less the centers' noise counts,
+        # which is what predicting seconds ahead needs)
+        if len(rows) and self.updated_at is not None and self.halted_at is None:
+            dt = t - self._first_seen[rows]
+            ok = dt > 1e-6
+            if ok.any():
+                measured = np.median((centers[cols[ok]] - self._first_centers[rows[ok]]) / dt[ok, None], axis=0)
+                if self.max_speed is None or np.linalg.norm(measured) <= self.max_speed:
+                    a = self.velocity_smoothing
+                    self.velocity = a * measured + (1 - a) * self.velocity
+
+        n_tracks = len(self._ids)
+        old_ids = self._ids
+        matched = np.zeros(n_tracks, dtype=bool)
+        matched[rows] = True
+        centers_now = predicted
+        centers_now[rows] = centers[cols]
+        self._hits[rows] += 1
+        self._missed[~matched] += 1
+        self._missed[rows] = 0
+        self._seen_at[rows] = t
+
+        new = np.ones(len(centers), dtype=bool)
+        new[cols] = False
+        n_new = int(new.sum())
+        new_ids = np.arange(self.next_id, self.next_id + n_new)
+        self.next_id += n_new
+        keep = self._missed <= self.max_missed
+        self._ids = np.concatenate((self._ids[keep], new_ids))
+        self._centers = np.vstack((centers_now[keep], centers[new]))
+        self._first_centers = np.vstack((self._first_centers[keep], centers[new]))
+        self._first_seen = np.concatenate((self._first_seen[keep], np.full(n_new, float(t))))
+        self._classes = np.concatenate((self._classes[keep], classes[new].astype(self._classes.dtype)))
+        self._hits = np.concatenate((self._hits[keep], np.ones(n_new, dtype=np.int64)))
+        self._missed = np.concatenate((self._missed[keep], np.zeros(n_new, dtype=np.int64)))
+        self._seen_at = np.concatenate((self._seen_at[keep], np.full(n_new, float(t))))
+        self.updated_at = t
+
+        detection_ids = np.empty(len(centers), dtype=np.int64)
+        detection_ids[cols] = old_ids[rows]
+        detection_ids[new] = new_ids
+        return self.tracks, detection_ids
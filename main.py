@@ -1,151 +1,342 @@
-"""
-main
-
-used with EPSON project
-"""
-import modbus_fxns
-import camera_fxns
-
-max_items = 33 # based on num spots in loc 100 on robot
-total_good_spots = 15 # based on num spots in loc 100 on robot
-total_bad_spots = 5
-
-# start image window for non-blocking display
-camera_fxns.start_img_window()
-
-def end(client):
-    """
-    end the program by closing windows and resetting all bits
-    """
-    camera_fxns.cv2.destroyAllWindows()
-    modbus_fxns.reset_bits(client, max_items)
-    quit()
-
-def main():
-    """
-    main
-
-    takes initial photo for display, runs loop while pallets are not full
-    
-    """
-    print("Initializing...")
-    client = modbus_fxns.initialize_modbus('tcp')
-    if modbus_fxns.check_robot_cycle_complete(client)==0:
-        print('Robot cycle incomplete, exiting.')
-        exit(1)
-    modbus_fxns.reset_bits(client, max_items)
-    H = camera_fxns.calculate_homography()
-    modbus_fxns.time.sleep(1)
-    # Take and preprocess photo
-    orig_img = camera_fxns.take_photo()
-    img, cropped, bad_img = camera_fxns.preprocess(orig_img) # preprocess for good items (white) AND bad ones (orange)
-    img_coords = camera_fxns.find_items(img, cropped, True)
-    img_coords_bad = camera_fxns.find_items(bad_img, cropped, False)
-    # num_items = len(img_coords)
-    camera_fxns.show_img(cropped)
-    if camera_fxns.cv2.waitKey(1) & 0xFF == 27:  # ESC to exit
-        end()
-    modbus_fxns.time.sleep(1.5) # let img load
-    ready_for_pickup = False
-    total_items = 0
-    total_good = 0
-    total_bad = 0
-
-    while total_items<(total_good_spots+total_bad_spots) and (total_good<total_good_spots) and (total_bad<total_bad_spots):
-        # Start conveyor belt
-        modbus_fxns.conveyor(client, 'on')
-
-        # Take and preprocess photo
-        orig_img = camera_fxns.take_photo()
-        img, cropped, bad_img = camera_fxns.preprocess(orig_img) # preprocess for good items (white) AND bad ones (orange)
-        img_coords = camera_fxns.find_items(img, cropped, True)
-        img_coords_bad = camera_fxns.find_items(bad_img, cropped, False)
-        # num_items = len(img_coords)
-        camera_fxns.show_img(cropped)
-        if camera_fxns.cv2.waitKey(1) & 0xFF == 27:  # ESC to exit
-                break
-        # check if bottles in view
-        ready_for_pickup = camera_fxns.wait_for_items(img_coords, img_coords_bad)
-
-        if ready_for_pickup:
-            print("Detected items in ready area!")
-            modbus_fxns.conveyor(client, 'off')
-            modbus_fxns.time.sleep(0.5) # let conv turn off
-            ready_for_pickup = False
-            world_coords = []
-            to_robot_coords = []
-            world_coords_bad = []
-            to_robot_coords_bad = []
-
-            # Update photo and locations
-            orig_img = camera_fxns.take_photo()
-            img, cropped, bad_img = camera_fxns.preprocess(orig_img)
-            img_coords = camera_fxns.find_items(img, cropped, True)
-            num_items = len(img_coords)
-            img_coords_bad = camera_fxns.find_items(bad_img, cropped, False)
-            num_items_bad = len(img_coords_bad)
-
-            camera_fxns.show_img(cropped)
-            if camera_fxns.cv2.waitKey(1) & 0xFF == 27:  # ESC to exit
-                break
-
-            for img_coord in img_coords:
-                world_x, world_y = camera_fxns.convert_pix_to_world(img_coord[0], img_coord[1], H)
-                world_coords.append([world_x,world_y])
-            print("GOOD items:")
-            print(world_coords)
-
-            for img_coord in img_coords_bad:
-                world_x, world_y = camera_fxns.convert_pix_to_world(img_coord[0], img_coord[1], H, False)
-                world_coords_bad.append([world_x,world_y])
-            print("BAD items:")
-            print(world_coords_bad)
-
-            top_y_bound = 185
-            bottom_y_bound = 30
-            left_bound = 350
-            right_bound = 750
-
-            # Bounds check values just in case... possibly unnecessary tho bc of cropping
-            for i in range(num_items):
-                if(img_coords[i][1]<top_y_bound and img_coords[i][1]>bottom_y_bound and img_coords[i][0]>left_bound and img_coords[i][0]<right_bound): # check x and y bounds
-                    to_robot_coords.append(world_coords[i])
-            num_reachable = len(to_robot_coords)
-            total_good+=num_reachable
-            print(f"There are {num_items-num_reachable} GOOD items Scaramouche can't reach.")
-            
-            for i in range(num_items_bad):
-                if(img_coords_bad[i][1]<top_y_bound and img_coords_bad[i][1]>bottom_y_bound and img_coords_bad[i][0]>left_bound and img_coords_bad[i][0]<right_bound): # check x and y bounds
-                    to_robot_coords_bad.append(world_coords_bad[i])
-            num_reachable_bad = len(to_robot_coords_bad)
-            total_bad+=num_reachable_bad
-            print(f"There are {num_items-num_reachable} BAD items Scaramouche can't reach.")
-            
-            # Send robot counts and loc values
-            modbus_fxns.send_target_count(client, num_reachable)
-            for i in range(num_reachable):
-                modbus_fxns.send_modbus_coords(client,i+1,to_robot_coords[i][0],to_robot_coords[i][1])
-            
-            modbus_fxns.send_target_count(client, num_reachable_bad,False)
-            for i in range(num_reachable_bad):
-                modbus_fxns.send_modbus_coords(client,i+1,to_robot_coords_bad[i][0],to_robot_coords_bad[i][1], False)
-                
-            print(f"Scaramouche will now palletize {num_reachable} good items and {num_reachable_bad} bad ones.")
-
-            modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1)
-            modbus_fxns.time.sleep(1)
-            modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 0)
-            # wait for robot to be ready again
-            print("Waiting for robot to be done...")
-            modbus_fxns.time.sleep(2)
-            while modbus_fxns.check_robot_cycle_complete(client)==0:
-                # print('Not ready yet...')
-                modbus_fxns.time.sleep(1)
-            print("done with cycle!")
-            modbus_fxns.reset_bits(client, max_items)
-
-            total_items=total_good+total_bad
-
-    end(client)
-   
+"""
+main
+
+used with EPSON project
+"""
+import numpy as np
+import modbus_fxns
+import modbus_async
+import camera_fxns
+import camera_session
+import camera_stream
+import camera_trigger
+import camera_supervisor
+import item_overlay
+import homography
+import item_tracker
+import pick_planner
+import robot_handshake
+
+max_items = 33 # based on num spots in loc 100 on robot
+total_good_spots = 15 # based on num spots in loc 100 on robot
+total_bad_spots = 5
+trigger_hz = 10 # pictures per second while the belt runs
+camera_select = None # serial number, friendly name or IP of the belt camera (None=the only camera)
+lut_bits = None # None=exact hsv thresholds, 5=masks from the 32K BGR table (no hsv conversion, but ~0.7x as fast on the bench box)
+overlay_hz = 5 # item overlay redraws per second (shown from this loop), 0=headless, no window
+homography_file = 'homography.json' # pixel -> robot calibration (homography.py), re-read when it changes
+item_centers = 'bbox' # 'moments' = sub-pixel centroids (refit the offsets with calibrate_robot.py --centers moments first)
+track_after_stop = False # True = pick from the tracker's predicted spots when the belt stops, no still photo
+pick_on_the_fly = False # True = belt keeps running, items picked where they'll be when the robot gets there (needs epson_code's pick mode)
+robot_timing = pick_planner.DEFAULT_TIMING # robot move times for pick_on_the_fly, measure them first
+fly_picks_per_cycle = 1 # items per robot cycle on the fly, more = predicting further ahead (see belt_sim.py)
+send_s = 0.05 # on the fly: time to send a plan (coords, times) before START_COMMAND goes out
+cycle_poll_s = (0.01, 0.05) # cycle_done polled every 10 ms around when the robot should be done, 50 ms before
+cycle_timeout_s = 60 # robot cycle longer than this = error, stop
+start_ack_s = 2.0 # robot must drop cycle_done this soon after START_COMMAND (it's waiting for it), else error, stop
+settle_px = 1.0 # belt counts as stopped once no item moved more than this between two still photos...
+settle_gap_s = 0.1 # ...taken this far apart (< 10 px/s)
+settle_timeout_s = 1.0 # longest to wait for that, then the last photo is used
+coast_s = 0.5 # track_after_stop: belt coasting after conveyor off (no photos to see it stop)
+async_modbus = False # on the fly: poll cycle_done on an asyncio task (modbus_async.RobotLink), not once per frame
+
+def end(client, cam, stream, timer, overlay, link=None):
+    """
+    end the program by closing windows, stopping the trigger/frame/overlay threads, closing the camera and resetting all bits
+    """
+    if link is not None:
+        link.stop()
+    overlay.stop()
+    timer.stop()
+    stream.stop()
+    cam.close()
+    modbus_fxns.reset_bits(client)
+    quit()
+
+def still_photo(cam, stream, supervisor):
+    """
+    one soft-triggered belt photo (belt stopped), triggering again while the camera recovers
+
+    returns belt_img, frame or None, None if the camera is gone for good
+    """
+    while not supervisor.failed:
+        trigger = cam.soft_trigger()
+        if trigger is None: # camera being re-opened
+            modbus_fxns.time.sleep(0.05)
+            continue
+        belt_img, frame = camera_fxns.stream_belt_photo(stream, trigger=trigger)
+        if belt_img is not None:
+            return belt_img, frame
+        print("No frame for trigger {}, camera health: {}".format(trigger, supervisor.health()))
+    return None, None
+
+def detect(belt_img):
+    """
+    finds the good items (white) AND bad ones (orange) on a belt photo
+
+    returns cropped, items (camera_fxns.Detections)
+    """
+    img, cropped, bad_img = camera_fxns.preprocess(belt_img, True, lut_bits=lut_bits)
+    return cropped, camera_fxns.detect_contours([img, bad_img], centers=item_centers)
+
+def items_moved(before, after):
+    """
+    how far the items moved between two photos, to tell the belt has stopped
+
+    returns largest px from an item (N,2 / M,2 centers) to the nearest one in the other photo, inf if the counts differ
+    """
+    before = np.asarray(before, dtype=np.float64).reshape(-1, 2)
+    after = np.asarray(after, dtype=np.float64).reshape(-1, 2)
+    if len(before) != len(after):
+        return np.inf
+    if not len(after):
+        return 0.0
+    distance = np.linalg.norm(after[:, None] - before[None], axis=2)
+    return float(max(distance.min(axis=1).max(), distance.min(axis=0).max()))
+
+def settled_photo(cam, stream, supervisor):
+    """
+    still photos after conveyor off until the items stop moving between two of them (settle_px
+    over settle_gap_s, at most settle_timeout_s), instead of a fixed wait for the belt to coast
+
+    returns belt_img, frame, cropped, items of the last photo, all None if the camera is gone for good
+    """
+    deadline = modbus_fxns.time.perf_counter() + settle_timeout_s
+    before = None
+    while True:
+        belt_img, frame = still_photo(cam, stream, supervisor)
+        if belt_img is None:
+            return None, None, None, None
+        cropped, items = detect(belt_img)
+        if before is not None and items_moved(before.centers, items.centers) <= settle_px:
+            return belt_img, frame, cropped, items
+        if frame.grabbed_at >= deadline:
+            print(f"Belt not settled after {settle_timeout_s} s, using the last photo.")
+            return belt_img, frame, cropped, items
+        before = items
+        modbus_fxns.time.sleep(max(0.0, frame.grabbed_at + settle_gap_s - modbus_fxns.time.perf_counter()))
+
+def main():
+    """
+    main
+
+    takes initial photo for display, runs loop while pallets are not full
+    
+    """
+    print("Initializing...")
+    client = modbus_fxns.initialize_modbus('tcp')
+    if modbus_fxns.check_robot_cycle_complete(client)==0:
+        print('Robot cycle incomplete, exiting.')
+        exit(1)
+    if not modbus_fxns.reset_bits(client):
+        print('Could not reset the robot registers, exiting.')
+        exit(1)
+    # second connection, its loop waits on the robot while this one processes frames
+    link = modbus_async.RobotLink() if async_modbus and pick_on_the_fly else None
+    if link is not None:
+        link.start()
+    # saved calibration, loaded once; a new file (python homography.py) is picked up between picks
+    calib = homography.HomographyFile(homography_file)
+    # open the camera once, a background thread keeps the newest frame ready
+    # pictures are soft-triggered: trigger_hz while the belt runs, one when it stops
+    cam = camera_session.CameraSession(trigger_mode=1, select=camera_select)
+    cam.open()
+    camera_fxns.use_belt_roi(cam) # only transfer the belt band's part of the sensor
+    timer = camera_trigger.TriggerTimer(cam, trigger_hz)
+    # reconnects the camera if the link drops (triggers held meanwhile), gives up (and ends the run) after a few s
+    supervisor = camera_supervisor.CameraSupervisor(cam, timer=timer)
+    supervisor.attach()
+    stream = camera_stream.CameraStream(cam, supervisor=supervisor)
+    stream.start()
+    # non-blocking display, drawn apart from detection
+    overlay = item_overlay.OverlayRenderer(overlay_hz)
+    overlay.start()
+    # same item ids from frame to frame + belt speed, to know where items are between photos
+    tracker = item_tracker.ItemTracker()
+    # START_COMMAND held until the robot takes it, then its cycle_done edge; measures the robot's cycles
+    waiter = robot_handshake.CycleWaiter(*cycle_poll_s, timeout_s=cycle_timeout_s, ack_timeout_s=start_ack_s)
+    # Take and preprocess photo
+    belt_img, frame = still_photo(cam, stream, supervisor)
+    if belt_img is None:
+        print("No camera, exiting.")
+        end(client, cam, stream, timer, overlay, link)
+    seq = frame.seq
+    cropped, items = detect(belt_img)
+    img_coords, img_coords_bad = camera_fxns.item_coords(items)
+    # num_items = len(img_coords)
+    overlay.submit(cropped, items)
+    if overlay.esc_pressed:  # ESC to exit
+        end(client, cam, stream, timer, overlay, link)
+    ready_for_pickup = False
+    total_items = 0
+    total_good = 0
+    total_bad = 0
+    robot_busy = False # on the fly: robot cycle running
+    cycle = None # async_modbus: wait_cycle_done future of the running robot cycle
+    planned = []
+
+    while total_items<(total_good_spots+total_bad_spots) and (total_good<total_good_spots) and (total_bad<total_bad_spots):
+        # Start conveyor belt
+        modbus_fxns.conveyor(client, 'on')
+        timer.resume()
+        tracker.resume()
+
+        # Take and preprocess photo (next frame the loop hasn't seen yet)
+        belt_img, frame = camera_fxns.stream_belt_photo(stream, seq)
+        if belt_img is None:
+            if supervisor.failed:
+                print("Camera lost, stopping.")
+                break
+            print("No new frame, camera health: {}".format(supervisor.health()))
+            continue
+        seq = frame.seq
+        cropped, items = detect(belt_img)
+        tracker.update(items.centers, items.classes, frame.grabbed_at)
+        img_coords, img_coords_bad = camera_fxns.item_coords(items)
+        # num_items = len(img_coords)
+        overlay.submit(cropped, items)
+        if overlay.esc_pressed:  # ESC to exit
+                break
+        if pick_on_the_fly:
+            now = modbus_fxns.time.perf_counter()
+            if link is not None:
+                if cycle is not None and cycle.done():
+                    state, _ = cycle.result()
+                    cycle = None
+                    if state != modbus_fxns.RobotState.WAITING_STATE:
+                        print(f"Robot cycle failed ({state.value}), stopping.")
+                        break
+                robot_busy = cycle is not None
+            elif robot_busy:
+                state = waiter.poll(client)
+                if state in (modbus_fxns.RobotState.ERROR_STATE, modbus_fxns.RobotState.NO_COMM_STATE):
+                    break
+                robot_busy = state == modbus_fxns.RobotState.MOVING_STATE
+                if not robot_busy:
+                    print(f"Robot cycle took {waiter.durations[-1]:.2f} s.")
+            if robot_busy:
+                continue
+            # where the next items will be when the robot gets to them, belt running
+            plan = pick_planner.plan_picks(tracker, calib.model, now + send_s, robot_timing, exclude=planned,
+                                           max_picks=fly_picks_per_cycle)
+            if not len(plan.ids):
+                continue
+            (world, descend_at), (world_bad, descend_at_bad) = pick_planner.split_by_class(plan)
+            sent = (modbus_fxns.send_item_coords(client, world.tolist(), world_bad.tolist()) and
+                    modbus_fxns.send_pick_times(client, descend_at) and
+                    modbus_fxns.send_pick_times(client, descend_at_bad, False) and
+                    modbus_fxns.send_pick_mode(client, True))
+            if not sent: # no START on a half-sent plan, plan again next frame
+                print("Plan not sent, skipping this cycle.")
+                continue
+            late = modbus_fxns.time.perf_counter() - plan.start
+            if late > 0:
+                print(f"Plan sent {late*1000:.0f} ms late, raise send_s.")
+            modbus_fxns.time.sleep(max(0.0, -late))
+            if waiter.start(client) != modbus_fxns.RobotState.MOVING_STATE:
+                print("Robot didn't start, stopping.")
+                break
+            if link is not None: # START's cleared already, just the end of the cycle
+                cycle = link.submit(modbus_async.wait_cycle_done, 0.1, cycle_timeout_s)
+            robot_busy = True
+            planned = plan.ids.tolist()
+            total_good += int((plan.classes == camera_fxns.LABEL_GOOD).sum())
+            total_bad += int((plan.classes == camera_fxns.LABEL_BAD).sum())
+            total_items = total_good+total_bad
+            print(f"Scaramouche will pick {len(plan.ids)} items on the fly, first in {plan.descend_at[0]:.2f} s.")
+            continue
+
+        # check if bottles in view
+        ready_for_pickup = camera_fxns.wait_for_items(img_coords, img_coords_bad)
+
+        if ready_for_pickup:
+            print("Detected items in ready area!")
+            modbus_fxns.conveyor(client, 'off')
+            timer.pause() # belt stopped, nothing new to see
+            tracker.halt(modbus_fxns.time.perf_counter())
+            ready_for_pickup = False
+            to_robot_coords = []
+            to_robot_coords_bad = []
+
+            if track_after_stop:
+                # where the items seen in the last frame stopped, no new photo
+                modbus_fxns.time.sleep(coast_s) # let conv turn off
+                tracks = tracker.tracks
+                seen = tracks.missed == 0
+                centers = tracker.predict(modbus_fxns.time.perf_counter())[seen]
+                items = camera_fxns.Detections(centers, None, None, tracks.classes[seen], camera_fxns.reach_zone(centers))
+            else:
+                # Update photo and locations (photos until the belt has stopped)
+                belt_img, frame, cropped, items = settled_photo(cam, stream, supervisor)
+                if belt_img is None:
+                    print("Camera lost, stopping.")
+                    break
+                seq = frame.seq
+                print(f"Using frame {frame.seq}, {camera_stream.age(frame)*1000:.0f} ms old.")
+                # how far off the tracker's stop positions were (coasting after conveyor off etc.)
+                predicted = dict(zip(tracker.tracks.ids.tolist(), tracker.predict(frame.grabbed_at)))
+                _, ids = tracker.update(items.centers, items.classes, frame.grabbed_at)
+                errors = [modbus_fxns.math.dist(predicted[i], c) for i, c in zip(ids.tolist(), items.centers) if i in predicted]
+                if errors:
+                    print(f"Tracker had {len(errors)} items within {max(errors):.1f} px of where they stopped.")
+                overlay.submit(cropped, items)
+                if overlay.esc_pressed:  # ESC to exit
+                    break
+            img_coords, img_coords_bad = camera_fxns.item_coords(items)
+            num_items = len(img_coords)
+            num_items_bad = len(img_coords_bad)
+
+            # all items to robot coords at once (class offsets applied), then split like img_coords
+            world = homography.to_world(calib.model, items.centers, items.classes)
+            world_coords, world_coords_bad = camera_fxns.item_coords(items._replace(centers=world))
+            print("GOOD items:")
+            print(world_coords)
+
+            print("BAD items:")
+            print(world_coords_bad)
+
+            top_y_bound = 185
+            bottom_y_bound = 30
+            left_bound = 350
+            right_bound = 750
+
+            # Bounds check values just in case... possibly unnecessary tho bc of cropping
+            for i in range(num_items):
+                if(img_coords[i][1]<top_y_bound and img_coords[i][1]>bottom_y_bound and img_coords[i][0]>left_bound and img_coords[i][0]<right_bound): # check x and y bounds
+                    to_robot_coords.append(world_coords[i])
+            num_reachable = len(to_robot_coords)
+            total_good+=num_reachable
+            print(f"There are {num_items-num_reachable} GOOD items Scaramouche can't reach.")
+            
+            for i in range(num_items_bad):
+                if(img_coords_bad[i][1]<top_y_bound and img_coords_bad[i][1]>bottom_y_bound and img_coords_bad[i][0]>left_bound and img_coords_bad[i][0]<right_bound): # check x and y bounds
+                    to_robot_coords_bad.append(world_coords_bad[i])
+            num_reachable_bad = len(to_robot_coords_bad)
+            total_bad+=num_reachable_bad
+            print(f"There are {num_items-num_reachable} BAD items Scaramouche can't reach.")
+            
+            # Send robot counts and loc values (one request for both blocks)
+            if not modbus_fxns.send_item_coords(client, to_robot_coords, to_robot_coords_bad):
+                print("Coords not sent, stopping (the robot would pick from the old ones).")
+                break
+
+            print(f"Scaramouche will now palletize {num_reachable} good items and {num_reachable_bad} bad ones.")
+
+            # START until the robot takes it (cycle_done off), then wait for it to be ready again (cycle_done on)
+            print("Waiting for robot to be done...")
+            if waiter.cycle(client) != modbus_fxns.RobotState.WAITING_STATE:
+                print("Robot cycle failed, stopping.")
+                break
+            print(f"done with cycle! Robot took {waiter.durations[-1]:.2f} s (START taken in {waiter.acks[-1]*1000:.0f} ms).")
+            if not modbus_fxns.reset_bits(client, only_dirty=True):
+                print("Reset failed, trying again after the next cycle.")
+
+            total_items=total_good+total_bad
+
+    if cycle is not None: # on the fly: let the last cycle finish
+        cycle.result()
+    elif robot_busy:
+        waiter.wait(client)
+    end(client, cam, stream, timer, overlay, link)
+   
 main()
\ No newline at end of file
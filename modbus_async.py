@@ -0,0 +1,381 @@
+"""
+modbus_async
+
+asyncio versions of the modbus_fxns operations main.py uses, on pymodbus' AsyncModbusTcpClient:
+waiting on the robot (sleeps, cycle_done polls, slow requests) is an await, so frames keep being
+processed while the robot works and a finished cycle is seen without waiting for the next frame.
+Same registers, scaling and prints as modbus_fxns (its constants, item_table(), mark_dirty()).
+Note: all locs are off by 1 from the Epson side b/c Epson is not 0-indexed
+
+usage, all asyncio (vision and the robot handshake as tasks on one loop):
+    client = await modbus_async.initialize_modbus()
+    cycle = asyncio.create_task(modbus_async.robot_cycle(client, coords, coords_bad))
+    while not cycle.done():
+        await asyncio.to_thread(process_frame, ...)
+
+from main.py's (threaded) loop, after robot_handshake.CycleWaiter.start(), the wait for
+cycle_done on its own thread's loop:
+    with modbus_async.RobotLink() as link:
+        cycle = link.submit(modbus_async.wait_cycle_done, 0.1)  # concurrent.futures.Future
+        ... frames ...
+        if cycle.done(): state, done_at = cycle.result()
+"""
+import asyncio
+import threading
+import time
+import pymodbus.client as ModbusClient
+from pymodbus import (
+    ExceptionResponse,
+    FramerType,
+    ModbusException,
+    pymodbus_apply_logging_config,
+)
+import modbus_fxns
+from modbus_fxns import RobotState
+
+
+async def initialize_modbus(host=modbus_fxns.robot_ip, port=502):
+    """Run async client.
+
+    :param host: robot controller's ip (fake_epson: 127.0.0.1)
+    :param port: Modbus TCP port
+    :returns: connected AsyncModbusTcpClient
+    """
+    if modbus_fxns.DEBUG_MODE:
+        pymodbus_apply_logging_config("DEBUG")
+    print("get async client")
+    client = ModbusClient.AsyncModbusTcpClient(host, port=port, framer=FramerType.SOCKET)
+    print("connect to server")
+    await client.connect()
+    return client
+
+
+async def _request(method, *args):
+    # one pymodbus request (client method + args), the response or None (printed) if it failed;
+    # called in here because a client that isn't connected raises right away, not when awaited
+    try:
+        rr = await method(*args)
+    except ModbusException as exc:
+        print(f"Received ModbusException({exc}) from library")
+        return None
+    if rr.isError():
+        print(f"Received Modbus library error({rr})")
+        return None
+    if isinstance(rr, ExceptionResponse):
+        print(f"Received Modbus library exception ({rr})")
+        return None
+    return rr
+
+
+async def set_modbus_bit(client, address, command):
+    """
+    set_modbus_bit
+
+    :param client
+    :param address: where to set
+    :param command: what to set it as
+    :return: True if sent
+    """
+    print(f"Sending address {address} command {command}")
+    if await _request(client.write_coil, address, bool(command)) is None:
+        return False
+    print(f"Address {address} command {command} successfully sent.")
+    return True
+
+
+async def conveyor(client, status):
+    """
+    conveyor
+
+    controls conveyor_on bit for Epson I/O
+    :param client
+    :param status: 'on' or 'off'
+    """
+    if status == 'on':
+        await set_modbus_bit(client, modbus_fxns.CONVEYOR_ON, 1)
+    elif status == 'off':
+        await set_modbus_bit(client, modbus_fxns.CONVEYOR_ON, 0)
+
+
+async def write_register_block(client, address, values):
+    """
+    write_register_block
+
+    like modbus_fxns.write_register_block(): consecutive registers in as few requests as fit
+
+    :return: requests sent, None if one failed
+    """
+    modbus_fxns.mark_dirty(address, len(values))
+    requests = 0
+    for offset in range(0, len(values), modbus_fxns.MAX_WRITE_REGISTERS):
+        requests += 1
+        chunk = values[offset:offset + modbus_fxns.MAX_WRITE_REGISTERS]
+        if await _request(client.write_registers, address + offset, chunk) is None:
+            return None
+    return requests
+
+
+async def send_target_count(client, target_count, good=True):
+    """
+    send_target_count
+
+    sends the num of items to palletize
+    :param client
+    :param target_count: number to set
+    :param good: True=set 'num_bottles' value; False=set 'num_bottles_bad' value
+    """
+    if target_count < 0 or target_count > 40:
+        print("Invalid Target Count.")
+        return
+    register = modbus_fxns.GOOD_COUNT if good else modbus_fxns.BAD_COUNT
+    print(f"Sending target count: {target_count}")
+    modbus_fxns.mark_dirty(register)
+    if await _request(client.write_register, register, target_count) is None:
+        return
+    print(f"Target count {target_count} successfully sent.")
+
+
+async def send_modbus_coords(client, target_num, x_coord, y_coord, good=True):
+    """
+    send_modbus_coords
+
+    sends the world coordinates of one good (good=True) or bad (good=False) item, x and y in
+    one write_registers request (modbus_fxns' takes 2)
+
+    :param client
+    :param target_num: coordinate number (1..)
+    :param x_coord: x coord
+    :param y_coord: y coord
+    :param good: True=white, False=orange
+    """
+    if target_num == 0:
+        return
+    start = modbus_fxns.GOOD_COORDS if good else modbus_fxns.BAD_COORDS
+    mb_x_register = start + 2 * (target_num - 1)
+    values = [modbus_fxns.to_int16_and_scale(x_coord), modbus_fxns.to_int16_and_scale(y_coord)]
+    if await write_register_block(client, mb_x_register, values) is None:
+        return
+    if y_coord > 0: # don't print for the reset bits
+        print(f"Coordinate ({x_coord}, {y_coord}) successfully sent to register {mb_x_register}.")
+
+
+async def send_item_coords(client, coords, coords_bad):
+    """
+    send_item_coords
+
+    modbus_fxns.send_item_coords(): both classes' counts and coords (32-129) in one request
+
+    :return: True if sent
+    """
+    good = modbus_fxns.item_table(coords)
+    bad = modbus_fxns.item_table(coords_bad, False)
+    if good is None or bad is None:
+        return False
+    values = good + [0] * (modbus_fxns.BAD_COORDS - modbus_fxns.GOOD_COUNT - 1) + bad
+    if await write_register_block(client, modbus_fxns.GOOD_COORDS, values) is None:
+        return False
+    print(f"Sent {len(coords)} good and {len(coords_bad)} bad coordinates.")
+    return True
+
+
+async def check_robot_cycle_complete(client):
+    """
+    check_robot_cycle_complete
+
+    checks if the robot has finished its pick/place cycle
+
+    :param client
+    :return: 1=cycle is done; 0=cycle not done; None=couldn't read it
+    """
+    try:
+        result = await client.read_input_registers(modbus_fxns.ROBOT_CYCLE_COMPLETE, count=1)
+    except Exception as exc: # ModbusException, or the link gone under the request
+        print(f"Exception occurred while checking robot cycle_done register..")
+        print(exc)
+        return None
+    if result.isError():
+        print(f"Error reading input register {modbus_fxns.ROBOT_CYCLE_COMPLETE}")
+        return None
+    if result.registers[0] & 0b0001:
+        print("Robot cycle is done.")
+        return 1
+    return 0
+
+
+async def wait_cycle_done(client, poll_s=1.0, timeout_s=60.0, max_failures=5):
+    """
+    wait_cycle_done
+
+    polls cycle_done every poll_s until it's on, gives up like robot_handshake.CycleWaiter:
+    past timeout_s, or max_failures failed reads in a row
+
+    :return: (modbus_fxns.RobotState, time.perf_counter() it ended): WAITING_STATE = done,
+        ERROR_STATE = not done in timeout_s, NO_COMM_STATE = cycle_done couldn't be read
+    """
+    started = time.perf_counter()
+    failures = 0
+    while True:
+        done = await check_robot_cycle_complete(client)
+        now = time.perf_counter()
+        if done == 1:
+            return RobotState.WAITING_STATE, now
+        failures = failures + 1 if done is None else 0
+        if failures >= max_failures:
+            print(f"Can't read cycle_done, {failures} tries.")
+            return RobotState.NO_COMM_STATE, now
+        if now - started > timeout_s:
+            print(f"Robot cycle not done after {timeout_s} s.")
+            return RobotState.ERROR_STATE, now
+        await asyncio.sleep(poll_s)
+
+
+async def start_cycle(client, ack_timeout_s=2.0, poll_s=0.01, max_failures=5):
+    """
+    start_cycle
+
+    robot_handshake.CycleWaiter.start(): checks the robot is waiting (cycle_done on), raises
+    START_COMMAND, polls every poll_s until cycle_done drops (the ack), clears START. START is
+    cleared on errors too, so the robot doesn't start a cycle later on its own
+
+    :param ack_timeout_s: longest the robot may take to drop cycle_done after START_COMMAND
+    :return: (modbus_fxns.RobotState, time.perf_counter() START went on): MOVING_STATE = cycle
+        running (wait_cycle_done() for its end), ERROR_STATE = robot busy or didn't take START,
+        NO_COMM_STATE = cycle_done couldn't be read or START not written
+    """
+    done = await check_robot_cycle_complete(client)
+    started = time.perf_counter()
+    if done is None:
+        return RobotState.NO_COMM_STATE, started
+    if done == 0:
+        print("Robot isn't waiting for START (cycle_done off), not starting.")
+        return RobotState.ERROR_STATE, started
+    if not await set_modbus_bit(client, modbus_fxns.START_COMMAND, 1):
+        return RobotState.NO_COMM_STATE, started
+    started = time.perf_counter()
+    state = RobotState.MOVING_STATE
+    failures = 0
+    while True:
+        await asyncio.sleep(poll_s)
+        done = await check_robot_cycle_complete(client)
+        if done == 0:
+            break
+        failures = failures + 1 if done is None else 0
+        if failures >= max_failures:
+            print(f"Can't read cycle_done, {failures} tries.")
+            state = RobotState.NO_COMM_STATE
+            break
+        if time.perf_counter() - started > ack_timeout_s:
+            print(f"Robot didn't take START in {ack_timeout_s} s.")
+            state = RobotState.ERROR_STATE
+            break
+    if not await set_modbus_bit(client, modbus_fxns.START_COMMAND, 0):
+        print("Couldn't clear START, the robot will run another cycle after this one!")
+        state = RobotState.NO_COMM_STATE
+    return state, started
+
+
+async def robot_cycle(client, coords, coords_bad, poll_s=0.02, timeout_s=60.0, ack_timeout_s=2.0):
+    """
+    robot_cycle
+
+    a stop-and-go robot cycle like main.py's (robot_handshake.CycleWaiter.cycle()): send the
+    coords, start_cycle(), then wait_cycle_done()
+
+    :param client
+    :param coords: [(x, y), ...] good items' robot coords
+    :param coords_bad: [(x, y), ...] bad items' robot coords
+    :param poll_s: cycle_done poll interval
+    :param timeout_s: deadline for the cycle, s after START_COMMAND
+    :param ack_timeout_s: see start_cycle()
+    :return: s from START_COMMAND to the cycle seen done, None if the coords weren't sent, START
+        wasn't taken or the cycle didn't finish
+    """
+    if not await send_item_coords(client, coords, coords_bad):
+        return None
+    state, started = await start_cycle(client, ack_timeout_s, min(poll_s, 0.01))
+    if state != RobotState.MOVING_STATE:
+        return None
+    print("Waiting for robot to be done...")
+    state, done = await wait_cycle_done(client, poll_s, timeout_s)
+    if state != RobotState.WAITING_STATE:
+        return None
+    print("done with cycle!")
+    return done - started
+
+
+class RobotLink:
+    """
+    RobotLink
+
+    an asyncio loop on its own thread with a modbus_async client, for running the robot
+    handshake next to a threaded (non-asyncio) frame loop like main.py's
+
+    usage:
+        link = RobotLink()
+        link.start()
+        cycle = link.submit(wait_cycle_done, 0.1)     # coroutine function, gets the client first
+        ... cycle.done(), cycle.result() ...
+        link.run(conveyor, 'off')                     # submit and wait
+        link.stop()
+    """
+    def __init__(self, host=modbus_fxns.robot_ip, port=502):
+        """
+        :param host: robot controller's ip
+        :param port: Modbus TCP port
+        """
+        self.host = host
+        self.port = port
+        self.client = None
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def start(self):
+        """
+        start
+
+        starts the loop's thread and connects, returns once connected
+        """
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='RobotLink', daemon=True)
+        self._thread.start()
+        try:
+            self.client = asyncio.run_coroutine_threadsafe(initialize_modbus(self.host, self.port), self._loop).result(10.0)
+        except Exception:
+            self.stop()
+            raise
+        if not self.client.connected:
+            print(f"RobotLink couldn't connect to {self.host}:{self.port}.")
+
+    def stop(self):
+        if self._thread is None:
+            return
+        if self.client is not None: # closed on its own loop, before the loop stops
+            self._loop.call_soon_threadsafe(self.client.close)
+            self.client = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5.0)
+        self._loop.close()
+        self._thread = None
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        :param fn: coroutine function of this module (client first), e.g. wait_cycle_done
+        :returns: concurrent.futures.Future of its result
+        """
+        return asyncio.run_coroutine_threadsafe(fn(self.client, *args, **kwargs), self._loop)
+
+    def run(self, fn, *args, **kwargs):
+        """
+        :returns: fn's result, once it's done
+        """
+        return self.submit(fn, *args, **kwargs).result()
@@ -1,305 +1,472 @@
-"""
-modbus_fxns
-
-all modbus helper functions used in main.py
-Note: all locs are off by 1 from the Epson side b/c Epson is not 0-indexed
-"""
-import numpy as np
-import cv2 as cv
-import math
-import time
-import platform
-import os
-from enum import Enum
-import csv
-from datetime import datetime
-import pymodbus.client as ModbusClient
-from pymodbus import (
-    ExceptionResponse,
-    FramerType,
-    ModbusException,
-    pymodbus_apply_logging_config,
-)
-log = False
-robot_ip = '192.168.0.1'
-# May not need:
-CALIBRATION_TEST_MODE = False
-INTEGRATION_TEST_MODE = True
-CONV_TEST_MODE = False
-SMALL_TEST_MODE = False
-DEBUG_MODE = False
-IMAGE_TEST_MODE = True
-DISPLAY_MODE = False
-
-
-# Modbus Constants
-#--BITS
-CYCLE_COMPLETE = 511
-START_COMMAND = 512
-CONVEYOR_ON = 513
-# CONV_INCLINE = 514
-# AGITATORS = 515
-# BURST = 516
-
-#--REGISTERS
-ROBOT_CYCLE_COMPLETE = 31
-class RobotState(Enum):
-    OFF_STATE = "off_state"
-    WAITING_STATE = "waiting_state"
-    MOVING_STATE = "moving_state"
-    ERROR_STATE = "error_state"
-    NO_COMM_STATE = "no_comm_state"
-
-#Datalogging, unused for now
-if log is True:
-    csv_file = 'item_location_data.csv'
-    file_exists = os.path.isfile(csv_file)
-    print(file_exists)
-
-#Data logging functions, unused for now
-def log_seal_data(total, rejected_width):  #, rejected_overlap, rejected_edge):
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-    #Open the file in append mode
-    with open(csv_file, mode= 'a', newline='') as file:
-        writer = csv.writer(file)
-
-        if not file_exists:
-            writer.writerow(['total', 'rejected_width', 'time_date'])
-
-        writer.writerow([total, rejected_width, current_time])
-
-def initialize_modbus(comm):
-    """Run sync client."""
-    # activate debugging
-    if DEBUG_MODE:
-        pymodbus_apply_logging_config("DEBUG")
-    framer=FramerType.SOCKET
-    port = "502"
-
-    print("get client")
-    if comm == "tcp":
-        client = ModbusClient.ModbusTcpClient(
-            robot_ip,
-            port=port,
-            framer=framer,
-            # timeout=10,
-            # retries=3,
-            # source_address=("localhost", 0),
-        )
-
-    print("connect to server")
-    client.connect()
-    return client
-
-def set_modbus_bit(client, address, command):
-    """
-    set_modbus_bit
-    
-    :param client
-    :param address: where to set
-    :param command: what to set it as
-    """
-    print(f"Sending address {address} command {command}")
-    try:
-        rr = client.write_coil(address, command)#, slave=1)
-    except ModbusException as exc:
-        print(f"Received ModbusException({exc}) from library")
-        return
-
-    if rr.isError():
-        print(f"Received Modbus library error({rr})")
-        return
-
-    if isinstance(rr, ExceptionResponse):
-        print(f"Received Modbus library exception ({rr})")
-        return
-
-    print(f"Address {address} command {command} successfully sent.")
-
-def reset_bits(client, max_items=33, max_items_bad=15):
-    """
-    reset_bits
-
-    resets all values to 0, used at the start and end of every cycle
-    
-    :param client
-    :param max_items: max good item values to reset (for resetting x and y to 0)
-    :param max_items_bad: max bad item values to reset (for resetting x and y to 0)
-    """
-    set_modbus_bit(client, START_COMMAND, 0)
-    set_modbus_bit(client, CONVEYOR_ON, 0)
-    print("Resetting old coords...")
-    send_target_count(client, max_items)
-    for i in range(max_items):
-        send_modbus_coords(client, i, 0, 0)
-    send_target_count(client, max_items_bad,False)
-    for i in range(max_items_bad):
-        send_modbus_coords(client, i, 0, 0,False)
-
-def conveyor(client, status):
-    """
-    conveyor
-    
-    controls conveyor_on bit for Epson I/O
-    :param client
-    :param status: 1=on, 0=off
-    """
-    if status == 'on':
-        set_modbus_bit(client, CONVEYOR_ON, 1)
-    elif status == 'off':
-        set_modbus_bit(client, CONVEYOR_ON, 0)
-
-def send_target_count(client, target_count, good=True):
-    """
-    send_target_count
-    
-    sends the num of items to palletize 
-    :param client
-    :param target_count: number to set
-    :param good: True=set 'num_bottles' value; False=set 'num_bottles_bad' value
-    """
-    if target_count < 0 or target_count > 40:
-        print("Invalid Target Count.")
-        return
-    # Modbus register address for the target count
-    if good:
-        mb_target_count_register = 99 # Target count register
-    else:
-        mb_target_count_register = 129 # Target count register for bad items
-    print(f"Sending target count: {target_count}")
-    try:
-        rr = client.write_register(mb_target_count_register, target_count)#, slave=1)
-    except ModbusException as exc:
-        print(f"Received ModbusException({exc}) from library")
-        return
-    if rr.isError():
-        print(f"Received Modbus library error({rr})")
-        return
-    if isinstance(rr, ExceptionResponse):
-        print(f"Received Modbus library exception ({rr})")
-        return
-    print(f"Target count {target_count} successfully sent.")
-
-def to_int16_and_scale(value):
-    """
-    to_int16_and_scale
-        scales x/y value to fit in Modbus register (unscaled on the Epson side)
-        need to be unsigned, two decimals of accuracy
-    :param value: value to convert
-    """
-    value*=100
-    value = int(value)
-    if not (0<=value<=0xFFFF):
-        print("error scaling!")
-        return 0
-    return value
-
-def send_modbus_coords(client, target_num, x_coord, y_coord, good=True):
-    """
-    send_modbus_coords
-    
-    sends the world coordinates of either good (good=True) or bad (good=False) items to Epson locations
-    
-    :param client
-    :param target_num: coordinate number
-    :param x_coord: x coord
-    :param y_coord: y coord
-    :param good: True=white, False=orange
-    """
-    # print(f"sending coord {target_num}")
-    if target_num == 0:
-        return
-    
-    if good:
-        start = 32
-    else:
-        start = 100
-    # Modbus register addresses for x and y coordinates
-    mb_x_register = start + 2 * (target_num - 1)  # X register for target_num
-    mb_y_register = mb_x_register + 1          # Y register for target_num
-
-    # Scale coordinates and convert to integers
-    # Has to be unsigned 16bit...
-    mb_x_coordinate = to_int16_and_scale(x_coord) #int(x_coord * 100)
-    mb_y_coordinate = to_int16_and_scale(y_coord) #int(y_coord * 100)
-
-    # print("send and verify x data")
-    try:
-        rr = client.write_register(mb_x_register, mb_x_coordinate)#, slave=1)
-    except ModbusException as exc:
-        print(f"Received ModbusException({exc}) from library")
-        return
-
-    if rr.isError():
-        print(f"Received Modbus library error({rr})")
-        return
-
-    if isinstance(rr, ExceptionResponse):
-        print(f"Received Modbus library exception ({rr})")
-        return
-
-    # print("send and verify y data")
-    try:
-        rr = client.write_register(mb_y_register, mb_y_coordinate)#, slave=1)
-    except ModbusException as exc:
-        print(f"Received ModbusException({exc}) from library")
-        return
-
-    if rr.isError():
-        print(f"Received Modbus library error({rr})")
-        return
-
-    if isinstance(rr, ExceptionResponse):
-        print(f"Received Modbus library exception ({rr})")
-        return
-    
-    if y_coord>0: # don't print for the reset bits
-        print(f"Coordinate ({x_coord}, {y_coord}) successfully sent to register {mb_x_register}.")
-
-def check_robot_cycle_complete(client) -> int:
-    """
-    check_robot_cycle_complete
-
-    checks if the robot has finished its pick/place cycle
-    
-    :param client
-    :return: 1=cycle is done; 0=cycle not done
-    """
-    try:
-        result = client.read_input_registers(address = ROBOT_CYCLE_COMPLETE, count=1) # Read 1 register starting at 31
-        if result.isError():
-            print(f"Error reading input register 31")
-            return
-
-        register_value = result.registers[0]
-        # print(f"RESULTS FROM READ REGISTER: {register_value} (binary: {bin(register_value)})")
-
-        # Interpret the register value
-        if register_value & 0b0001:  # Check if the '1' bit is set for off state
-            print("Robot cycle is done.")
-            return 1
-        else:
-            # print("No command sent.")
-            return 0
-
-    except Exception as e:
-        print(f"Exception occurred while checking robot cycle_done register..")
-        print(e)
-        return 
-    
-def test():
-    """
-    test
-
-    unused, test modbus connection and verify locations
-    """
-    client = initialize_modbus('tcp')
-    # result = client.read_input_registers(31, 1) #, slave=1)
-
-    result = client.read_input_registers(32)
-    print(f"RESULTS FROM READ REGISTER {32} = {result.registers}")
-
-    send_modbus_coords(client, 1, 10, 13)
-    send_modbus_coords(client, 2, 11, 14)
+"""
+modbus_fxns
+
+all modbus helper functions used in main.py
+Note: all locs are off by 1 from the Epson side b/c Epson is not 0-indexed
+"""
+import numpy as np
+import cv2 as cv
+import math
+import time
+import platform
+import os
+from enum import Enum
+import csv
+from datetime import datetime
+import pymodbus.client as ModbusClient
+from pymodbus import (
+    ExceptionResponse,
+    FramerType,
+    ModbusException,
+    pymodbus_apply_logging_config,
+)
+log = False
+robot_ip = '192.168.0.1'
+# May not need:
+CALIBRATION_TEST_MODE = False
+INTEGRATION_TEST_MODE = True
+CONV_TEST_MODE = False
+SMALL_TEST_MODE = False
+DEBUG_MODE = False
+IMAGE_TEST_MODE = True
+DISPLAY_MODE = False
+
+
+# Modbus Constants
+#--BITS
+CYCLE_COMPLETE = 511
+START_COMMAND = 512
+CONVEYOR_ON = 513
+# CONV_INCLINE = 514
+# AGITATORS = 515
+# BURST = 516
+
+#--REGISTERS
+ROBOT_CYCLE_COMPLETE = 31
+GOOD_COORDS = 32 # x, y of good item n (1..) at GOOD_COORDS + 2*(n-1), +1
+GOOD_COUNT = 99 # number of good items
+BAD_COORDS = 100 # same for bad items
+BAD_COUNT = 129
+MAX_WRITE_REGISTERS = 123 # most registers one write_registers request can carry (Modbus limit)
+PICK_MODE = 140 # 0=stop-and-go, 1=pick on the fly (descend times below are used)
+PICK_TIMES_GOOD = 141 # descend times (1/100 s after START_COMMAND), one per good coord
+PICK_TIMES_BAD = 180 # same for the bad coords
+PICK_TIMES_END = PICK_TIMES_BAD + 15
+MAX_PICK_TIME_S = 0xFFFF / 100 # longest descend time a register holds (655.35 s)
+# registers written since the last reset_bits(), per area: [first, last] (for reset_bits(only_dirty=True))
+dirty = {}
+class RobotState(Enum):
+    OFF_STATE = "off_state"
+    WAITING_STATE = "waiting_state"
+    MOVING_STATE = "moving_state"
+    ERROR_STATE = "error_state"
+    NO_COMM_STATE = "no_comm_state"
+
+#Datalogging, unused for now
+if log is True:
+    csv_file = 'item_location_data.csv'
+    file_exists = os.path.isfile(csv_file)
+    print(file_exists)
+
+#Data logging functions, unused for now
+def log_seal_data(total, rejected_width):  #, rejected_overlap, rejected_edge):
+    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    #Open the file in append mode
+    with open(csv_file, mode= 'a', newline='') as file:
+        writer = csv.writer(file)
+
+        if not file_exists:
+            writer.writerow(['total', 'rejected_width', 'time_date'])
+
+        writer.writerow([total, rejected_width, current_time])
+
+def initialize_modbus(comm, host=robot_ip, port=502):
+    """Run sync client.
+
+    :param comm: 'tcp'
+    :param host: robot controller's ip (fake_epson: 127.0.0.1)
+    :param port: Modbus TCP port
+    """
+    # activate debugging
+    if DEBUG_MODE:
+        pymodbus_apply_logging_config("DEBUG")
+    framer=FramerType.SOCKET
+
+    print("get client")
+    if comm == "tcp":
+        client = ModbusClient.ModbusTcpClient(
+            host,
+            port=port,
+            framer=framer,
+            # timeout=10,
+            # retries=3,
+            # source_address=("localhost", 0),
+        )
+
+    print("connect to server")
+    client.connect()
+    return client
+
+def set_modbus_bit(client, address, command):
+    """
+    set_modbus_bit
+    
+    :param client
+    :param address: where to set
+    :param command: what to set it as
+    :return: True if sent
+    """
+    print(f"Sending address {address} command {command}")
+    try:
+        rr = client.write_coil(address, command)#, slave=1)
+    except ModbusException as exc:
+        print(f"Received ModbusException({exc}) from library")
+        return False
+
+    if rr.isError():
+        print(f"Received Modbus library error({rr})")
+        return False
+
+    if isinstance(rr, ExceptionResponse):
+        print(f"Received Modbus library exception ({rr})")
+        return False
+
+    print(f"Address {address} command {command} successfully sent.")
+    return True
+
+def mark_dirty(address, count=1):
+    """
+    mark_dirty
+
+    notes registers about to be written, so reset_bits(only_dirty=True) knows to zero them
+    """
+    area = 'pick' if address >= PICK_MODE else 'items'
+    first, last = dirty.get(area, (address, address + count - 1))
+    dirty[area] = [min(first, address), max(last, address + count - 1)]
+
+def write_register_block(client, address, values):
+    """
+    write_register_block
+
+    writes consecutive registers with as few write_registers requests as fit (123 registers each)
+
+    :param client
+    :param address: first register
+    :param values: register values
+    :return: requests sent, None if one failed
+    """
+    mark_dirty(address, len(values))
+    requests = 0
+    for offset in range(0, len(values), MAX_WRITE_REGISTERS):
+        requests += 1
+        try:
+            rr = client.write_registers(address + offset, values[offset:offset + MAX_WRITE_REGISTERS])#, slave=1)
+        except ModbusException as exc:
+            print(f"Received ModbusException({exc}) from library")
+            return None
+        if rr.isError():
+            print(f"Received Modbus library error({rr})")
+            return None
+        if isinstance(rr, ExceptionResponse):
+            print(f"Received Modbus library exception ({rr})")
+            return None
+    return requests
+
+def reset_bits(client, only_dirty=False):
+    """
+    reset_bits
+
+    resets all values to 0, used at the start and end of every cycle:
+    START_COMMAND and CONVEYOR_ON off in one request, then the good/bad counts + coords
+    (32-129) and the pick mode + times (140-194) each zeroed with one write_registers request
+    
+    :param client
+    :param only_dirty: only zero what this program wrote since the last reset, skipping the
+        areas nothing was written to; False=zero all of it (e.g. at start)
+    :return: True if everything was reset; an area that wasn't stays dirty for the next reset
+    """
+    ok = True
+    try:
+        rr = client.write_coils(START_COMMAND, [False, False])#, slave=1) # START_COMMAND, CONVEYOR_ON
+        if rr.isError():
+            print(f"Received Modbus library error({rr})")
+            ok = False
+        elif isinstance(rr, ExceptionResponse):
+            print(f"Received Modbus library exception ({rr})")
+            ok = False
+    except ModbusException as exc:
+        print(f"Received ModbusException({exc}) from library")
+        ok = False
+    print("Resetting old coords...")
+    if only_dirty:
+        areas = dict(dirty)
+    else:
+        areas = {'items': (GOOD_COORDS, BAD_COUNT), 'pick': (PICK_MODE, PICK_TIMES_END - 1)}
+    for area, (first, last) in areas.items():
+        # write_register_block() marks what it writes dirty, only forgotten once it's zeroed
+        if write_register_block(client, first, [0] * (last - first + 1)) is None:
+            print(f"Couldn't reset registers {first}-{last}.")
+            ok = False
+        else:
+            dirty.pop(area, None)
+    return ok
+
+def conveyor(client, status):
+    """
+    conveyor
+    
+    controls conveyor_on bit for Epson I/O
+    :param client
+    :param status: 1=on, 0=off
+    """
+    if status == 'on':
+        set_modbus_bit(client, CONVEYOR_ON, 1)
+    elif status == 'off':
+        set_modbus_bit(client, CONVEYOR_ON, 0)
+
+def send_target_count(client, target_count, good=True):
+    """
+    send_target_count
+    
+    sends the num of items to palletize 
+    :param client
+    :param target_count: number to set
+    :param good: True=set 'num_bottles' value; False=set 'num_bottles_bad' value
+    """
+    if target_count < 0 or target_count > 40:
+        print("Invalid Target Count.")
+        return
+    # Modbus register address for the target count
+    if good:
+        mb_target_count_register = GOOD_COUNT # Target count register
+    else:
+        mb_target_count_register = BAD_COUNT # Target count register for bad items
+    print(f"Sending target count: {target_count}")
+    mark_dirty(mb_target_count_register)
+    try:
+        rr = client.write_register(mb_target_count_register, target_count)#, slave=1)
+    except ModbusException as exc:
+        print(f"Received ModbusException({exc}) from library")
+        return
+    if rr.isError():
+        print(f"Received Modbus library error({rr})")
+        return
+    if isinstance(rr, ExceptionResponse):
+        print(f"Received Modbus library exception ({rr})")
+        return
+    print(f"Target count {target_count} successfully sent.")
+
+def send_pick_mode(client, on_the_fly):
+    """
+    send_pick_mode
+
+    tells the robot whether to wait for each item's descend time (pick on the fly) or not
+    :param client
+    :param on_the_fly: True=use the descend times (send_pick_times()), False=stop-and-go
+    :return: True if sent
+    """
+    mark_dirty(PICK_MODE)
+    try:
+        rr = client.write_register(PICK_MODE, int(bool(on_the_fly)))#, slave=1)
+    except ModbusException as exc:
+        print(f"Received ModbusException({exc}) from library")
+        return False
+    if rr.isError():
+        print(f"Received Modbus library error({rr})")
+        return False
+    if isinstance(rr, ExceptionResponse):
+        print(f"Received Modbus library exception ({rr})")
+        return False
+    return True
+
+def send_pick_times(client, descend_at, good=True):
+    """
+    send_pick_times
+
+    sends when the robot should go down for each item (pick on the fly), same order as its coords;
+    the robot counts from when it sees START_COMMAND
+    :param client
+    :param descend_at: s after START_COMMAND, one per item (pick_planner.PickPlan.descend_at)
+    :param good: True=good items' times; False=bad items' times
+    :return: True if sent (or nothing to send), False if not sent: a time outside
+        0..MAX_PICK_TIME_S (to_int16_and_scale() would make it 0 = go down right away)
+    """
+    if not len(descend_at):
+        return True
+    out_of_range = [seconds for seconds in descend_at if not 0 <= seconds <= MAX_PICK_TIME_S]
+    if out_of_range:
+        print(f"Pick times out of range (0-{MAX_PICK_TIME_S} s): {out_of_range}, not sent.")
+        return False
+    start = PICK_TIMES_GOOD if good else PICK_TIMES_BAD
+    return write_register_block(client, start, [to_int16_and_scale(seconds) for seconds in descend_at]) is not None
+
+def to_int16_and_scale(value):
+    """
+    to_int16_and_scale
+        scales x/y value to fit in Modbus register (unscaled on the Epson side)
+        need to be unsigned, two decimals of accuracy
+    :param value: value to convert
+    """
+    value*=100
+    value = int(value)
+    if not (0<=value<=0xFFFF):
+        print("error scaling!")
+        return 0
+    return value
+
+def send_modbus_coords(client, target_num, x_coord, y_coord, good=True):
+    """
+    send_modbus_coords
+    
+    sends the world coordinates of either good (good=True) or bad (good=False) items to Epson locations
+    
+    :param client
+    :param target_num: coordinate number
+    :param x_coord: x coord
+    :param y_coord: y coord
+    :param good: True=white, False=orange
+    """
+    # print(f"sending coord {target_num}")
+    if target_num == 0:
+        return
+    
+    if good:
+        start = GOOD_COORDS
+    else:
+        start = BAD_COORDS
+    # Modbus register addresses for x and y coordinates
+    mb_x_register = start + 2 * (target_num - 1)  # X register for target_num
+    mb_y_register = mb_x_register + 1          # Y register for target_num
+
+    # Scale coordinates and convert to integers
+    # Has to be unsigned 16bit...
+    mb_x_coordinate = to_int16_and_scale(x_coord) #int(x_coord * 100)
+    mb_y_coordinate = to_int16_and_scale(y_coord) #int(y_coord * 100)
+
+    # print("send and verify x data")
+    mark_dirty(mb_x_register, 2)
+    try:
+        rr = client.write_register(mb_x_register, mb_x_coordinate)#, slave=1)
+    except ModbusException as exc:
+        print(f"Received ModbusException({exc}) from library")
+        return
+
+    if rr.isError():
+        print(f"Received Modbus library error({rr})")
+        return
+
+    if isinstance(rr, ExceptionResponse):
+        print(f"Received Modbus library exception ({rr})")
+        return
+
+    # print("send and verify y data")
+    try:
+        rr = client.write_register(mb_y_register, mb_y_coordinate)#, slave=1)
+    except ModbusException as exc:
+        print(f"Received ModbusException({exc}) from library")
+        return
+
+    if rr.isError():
+        print(f"Received Modbus library error({rr})")
+        return
+
+    if isinstance(rr, ExceptionResponse):
+        print(f"Received Modbus library exception ({rr})")
+        return
+    
+    if y_coord>0: # don't print for the reset bits
+        print(f"Coordinate ({x_coord}, {y_coord}) successfully sent to register {mb_x_register}.")
+
+def item_table(coords, good=True):
+    """
+    item_table
+
+    register values for one class's whole block, from its first x up to its count register:
+    the coords scaled like send_modbus_coords(), 0 in the unused slots, the count last
+
+    :param coords: [(x, y), ...] robot coords
+    :param good: True=good block (32-99); False=bad block (100-129)
+    :return: list of register values, None if there are more items than slots
+    """
+    start, count_register = (GOOD_COORDS, GOOD_COUNT) if good else (BAD_COORDS, BAD_COUNT)
+    slots = (count_register - start) // 2 # 33 good, 14 bad (a 15th bad y would be the count)
+    if len(coords) > slots:
+        print(f"Too many items for the {'good' if good else 'bad'} block: {len(coords)}, room for {slots}.")
+        return None
+    values = [0] * (count_register - start + 1)
+    for i, (x, y) in enumerate(coords):
+        values[2 * i] = to_int16_and_scale(x)
+        values[2 * i + 1] = to_int16_and_scale(y)
+    values[-1] = len(coords)
+    return values
+
+def send_item_coords(client, coords, coords_bad):
+    """
+    send_item_coords
+
+    sends the good and bad items' counts and coordinates in one write_registers request
+    (registers 32-129) instead of 2 per item + 1 per count with send_target_count()/send_modbus_coords();
+    the slots not used this time are zeroed too
+
+    :param client
+    :param coords: [(x, y), ...] good items' robot coords
+    :param coords_bad: [(x, y), ...] bad items' robot coords
+    :return: True if sent
+    """
+    good = item_table(coords)
+    bad = item_table(coords_bad, False)
+    if good is None or bad is None:
+        return False
+    values = good + [0] * (BAD_COORDS - GOOD_COUNT - 1) + bad
+    if write_register_block(client, GOOD_COORDS, values) is None:
+        return False
+    print(f"Sent {len(coords)} good and {len(coords_bad)} bad coordinates.")
+    return True
+
+def check_robot_cycle_complete(client) -> int:
+    """
+    check_robot_cycle_complete
+
+    checks if the robot has finished its pick/place cycle
+    
+    :param client
+    :return: 1=cycle is done; 0=cycle not done
+    """
+    try:
+        result = client.read_input_registers(address = ROBOT_CYCLE_COMPLETE, count=1) # Read 1 register starting at 31
+        if result.isError():
+            print(f"Error reading input register 31")
+            return
+
+        register_value = result.registers[0]
+        # print(f"RESULTS FROM READ REGISTER: {register_value} (binary: {bin(register_value)})")
+
+        # Interpret the register value
+        if register_value & 0b0001:  # Check if the '1' bit is set for off state
+            print("Robot cycle is done.")
+            return 1
+        else:
+            # print("No command sent.")
+            return 0
+
+    except Exception as e:
+        print(f"Exception occurred while checking robot cycle_done register..")
+        print(e)
+        return 
+    
+def test():
+    """
+    test
+
+    unused, test modbus connection and verify locations
+    """
+    client = initialize_modbus('tcp')
+    # result = client.read_input_registers(31, 1) #, slave=1)
+
+    result = client.read_input_registers(32)
+    print(f"RESULTS FROM READ REGISTER {32} = {result.registers}")
+
+    send_modbus_coords(client, 1, 10, 13)
+    send_modbus_coords(client, 2, 11, 14)
     send_modbus_coords(client, 3, 12, 15)
\ No newline at end of file
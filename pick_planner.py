@@ -0,0 +1,121 @@
+"""
+pick_planner
+
+pick on the fly: instead of stopping the belt, each item's pick is planned for the moment
+the robot will get to it. The robot's pick cycle is timed (RobotTiming), the tracker says
+where each item will be then, and the robot is sent that spot plus when to go down for it
+(seconds after START_COMMAND, it waits on its timer until then, see epson_code Main1)
+"""
+import collections
+import numpy as np
+import camera_fxns
+import homography
+
+# robot pick cycle times (s), measure on the robot (print Tmr(0) around the moves in Pick_and_Place):
+# approach_s: from home/the pallet to above the next item (Jump)
+# descend_s: going down and closing the gripper (the item has to be under it by then)
+# place_s: up, to the pallet, release, back up
+# start_s: from START_COMMAND to the robot reading the coords and setting off
+RobotTiming = collections.namedtuple('RobotTiming', ['approach_s', 'descend_s', 'place_s', 'start_s'])
+DEFAULT_TIMING = RobotTiming(approach_s=0.6, descend_s=0.5, place_s=1.6, start_s=0.1)
+
+# belt image px the gripper can go down in (main's reachable bounds): left, bottom, right, top
+REACH_WINDOW = (350, 30, 750, 185)
+
+# planned picks, one row per item, in pick order:
+# ids: (N,) tracker ids
+# classes: (N,) labels
+# pixels: (N,2) belt image px where the item will be when gripped
+# world: (N,2) robot x, y of that spot (class offsets applied)
+# descend_at: (N,) s after start to go down (what the robot gets)
+# grip_at: (N,) clock time the gripper closes on the item
+# start: clock time the plan counts from (START_COMMAND sent)
+PickPlan = collections.namedtuple('PickPlan', ['ids', 'classes', 'pixels', 'world', 'descend_at', 'grip_at', 'start'])
+
+
+def in_reach(pixels, reach=REACH_WINDOW, margin=0.0):
+    """
+    :returns: (N,) True where the belt px are inside the reach window (shrunk by margin px)
+    """
+    pixels = np.asarray(pixels, dtype=np.float64).reshape(-1, 2)
+    left, bottom, right, top = reach
+    x, y = pixels[:, 0], pixels[:, 1]
+    return (x > left + margin) & (x < right - margin) & (y > bottom + margin) & (y < top - margin)
+
+
+def plan_picks(tracker, model, start, timing=DEFAULT_TIMING, reach=REACH_WINDOW, margin=10.0, exclude=(),
+               max_picks=None, max_wait_s=1.0, slack_s=0.2, min_hits=3):
+    """
+    plan_picks
+
+    lays out the robot's next cycle: items the tracker saw in its last frame, the furthest
+    along the belt first (they leave first), each picked where it will be when the gripper
+    closes. An item not in reach yet is waited for (up to max_wait_s), one that will be past
+    the window by the time the robot could get there is left out
+
+    :param tracker: item_tracker.ItemTracker, updated with the latest frame
+    :param model: homography.HomographyModel for the robot coords
+    :param start: clock time (tracker's) START_COMMAND goes out
+    :param timing: RobotTiming
+    :param reach: belt px reach window (REACH_WINDOW)
+    :param margin: px the grip spot has to be inside the window
+    :param exclude: tracker ids already planned (picked, or in the running cycle)
+    :param max_picks: most items in the cycle, None=all that fit (fewer = shorter predictions:
+        the 2nd pick is a whole pick cycle further ahead, belt_sim picks best with 1)
+    :param max_wait_s: longest the robot may wait above the belt for an item to come into reach
+        (items further upstream are left for a later plan, when they're closer)
+    :param slack_s: s the robot is planned to be above each item early, so a slow move doesn't
+        make it go down late (on an item that has moved on)
+    :param min_hits: frames an item must have been seen in (so the belt speed is measured)
+    :returns: PickPlan (empty if nothing can be picked)
+    """
+    tracks = tracker.tracks
+    velocity = tracker.velocity if tracker.halted_at is None else np.zeros(2)
+    exclude = set(exclude)
+    candidates = [i for i in range(len(tracks.ids))
+                  if tracks.missed[i] == 0 and tracks.hits[i] >= min_hits and tracks.ids[i] not in exclude]
+    # furthest along the belt (its direction of travel) first
+    direction = velocity / np.linalg.norm(velocity) if np.linalg.norm(velocity) > 1e-6 else np.array([1.0, 0.0])
+    now = tracker.predict(start)
+    candidates.sort(key=lambda i: -float(now[i] @ direction))
+    rows, pixels, descend_at, grip_at = [], [], [], []
+    free_at = start + timing.start_s # robot free to set off for the next item
+    for i in candidates:
+        if max_picks is not None and len(rows) >= max_picks:
+            break
+        earliest = free_at + timing.approach_s + slack_s + timing.descend_s
+        grip = _grip_time(tracker, tracks.ids[i], earliest, earliest + max_wait_s, reach, margin)
+        if grip is None:
+            continue
+        rows.append(i)
+        pixels.append(tracker.predict(grip, [tracks.ids[i]])[0])
+        descend_at.append(grip - timing.descend_s - start)
+        grip_at.append(grip)
+        free_at = grip + timing.place_s
+    rows = np.array(rows, dtype=np.intp)
+    pixels = np.array(pixels, dtype=np.float64).reshape(-1, 2)
+    classes = tracks.classes[rows]
+    world = homography.to_world(model, pixels, classes) if len(rows) else np.empty((0, 2))
+    return PickPlan(tracks.ids[rows], classes, pixels, world, np.array(descend_at), np.array(grip_at), start)
+
+
+def _grip_time(tracker, item_id, earliest, latest, reach, margin, step=0.02):
+    # first time in [earliest, latest] the item is in reach, None if never (the tracker's
+    # prediction is a straight line at the belt velocity, so in between is interpolated;
+    # step s is fine enough at belt speeds)
+    times = np.arange(earliest, latest + step, step)
+    first, last = tracker.predict(earliest, [item_id])[0], tracker.predict(times[-1], [item_id])[0]
+    path = first + (last - first) * ((times - earliest) / max(times[-1] - earliest, 1e-9))[:, None]
+    inside = np.flatnonzero(in_reach(path, reach, margin))
+    if not len(inside):
+        return None
+    return float(times[inside[0]])
+
+
+def split_by_class(plan, n_classes=len(camera_fxns.ITEM_CLASSES)):
+    """
+    :returns: list per class of (world (n,2), descend_at (n,)) in pick order, e.g. [good, bad]
+        (like camera_fxns.item_coords(), what the robot gets per pallet)
+    """
+    return [(plan.world[plan.classes == label], plan.descend_at[plan.classes == label])
+            for label in range(1, n_classes + 1)]
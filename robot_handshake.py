@@ -0,0 +1,206 @@
+"""
+robot_handshake
+
+Python's side of the robot cycle handshake (epson_code main loop: Wait Sw(robot_start),
+Off cycle_done, picks, On cycle_done).
+
+CycleWaiter: waits for the robot's cycle_done (ROBOT_CYCLE_COMPLETE bit 0) after START_COMMAND
+by polling every 10-50 ms instead of sleeping 2 s then polling every 1 s. It polls fast around
+when the cycle should end (from the cycles it measured), slower before, with some jitter so the
+polls don't beat with the controller's scan. The bit is still on from the last cycle until the
+robot sees START, so a cycle only counts as done once cycle_done was seen off first (edge);
+not done by the deadline is an error (so is a cycle shorter than a poll, never seen off).
+
+START_COMMAND itself is acknowledged instead of pulsed for a fixed 1 s (start()): raised, held
+until cycle_done drops (Main1 is past Wait Sw(robot_start) then), cleared right away. A held
+START would start the next cycle as soon as this one ends, a short pulse could be missed.
+
+usage:
+    waiter = CycleWaiter()
+    state = waiter.cycle(client)                       # START, ack, cycle done (blocking)
+    ... or per frame: waiter.start(client); waiter.poll(client) ...
+    waiter.durations[-1], waiter.acks[-1]              # s the robot took, s it took to take START
+"""
+import statistics
+import time
+import numpy as np
+import modbus_fxns
+from modbus_fxns import RobotState
+
+
+class CycleWaiter:
+    """
+    CycleWaiter
+
+    poll()/wait() return a modbus_fxns.RobotState:
+    MOVING_STATE: cycle running (or the robot hasn't taken START yet)
+    WAITING_STATE: cycle done, robot waiting for the next START (duration in durations)
+    ERROR_STATE: not done by the deadline; start(): robot busy or didn't take START in time
+    NO_COMM_STATE: cycle_done couldn't be read max_failures times in a row, or START not written
+    """
+    def __init__(self, min_poll_s=0.01, max_poll_s=0.05, jitter=0.2, timeout_s=60.0, max_failures=5,
+                 history=20, seed=None, ack_timeout_s=2.0):
+        """
+        :param min_poll_s: poll interval around the expected end of the cycle
+        :param max_poll_s: poll interval well before it (and the longest one)
+        :param jitter: +- fraction the intervals are randomized by
+        :param timeout_s: deadline, s after START_COMMAND
+        :param max_failures: failed reads in a row before NO_COMM_STATE
+        :param history: cycles kept in durations (the expected cycle is their median)
+        :param seed: jitter random seed
+        :param ack_timeout_s: longest the robot may take to drop cycle_done after START_COMMAND
+            (it's in Wait Sw(robot_start) when cycle_done is on, so it's its I/O scan + Modbus)
+        """
+        if not 0 < min_poll_s <= max_poll_s:
+            raise ValueError("need 0 < min_poll_s <= max_poll_s")
+        self.min_poll_s = min_poll_s
+        self.max_poll_s = max_poll_s
+        self.jitter = jitter
+        self.timeout_s = timeout_s
+        self.max_failures = max_failures
+        self.history = history
+        self.ack_timeout_s = ack_timeout_s
+        self.acks = [] # measured: s from START_COMMAND on to cycle_done seen off
+        self.durations = [] # measured cycles: s from START_COMMAND to cycle_done seen on
+        self.started_at = None
+        self.polls = 0 # polls this cycle
+        self.state = RobotState.WAITING_STATE
+        self._busy_seen = False
+        self._failures = 0
+        self._rng = np.random.default_rng(seed)
+
+    def begin(self, started_at=None):
+        """
+        begin
+
+        a new cycle: START_COMMAND went on at started_at (time.perf_counter(), None=now)
+        """
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.polls = 0
+        self.state = RobotState.MOVING_STATE
+        self._busy_seen = False
+        self._failures = 0
+
+    def start(self, client):
+        """
+        start
+
+        starts a robot cycle: checks the robot is waiting (cycle_done on), raises START_COMMAND,
+        polls every min_poll_s until cycle_done drops (the ack), clears START. START is cleared
+        on errors too, so the robot doesn't start a cycle later on its own
+
+        :returns: RobotState, MOVING_STATE = cycle running, poll()/wait() for its end
+        """
+        self.state = RobotState.MOVING_STATE
+        self._failures = 0
+        done = modbus_fxns.check_robot_cycle_complete(client)
+        if done is None:
+            self.state = RobotState.NO_COMM_STATE
+            return self.state
+        if done == 0:
+            print("Robot isn't waiting for START (cycle_done off), not starting.")
+            self.state = RobotState.ERROR_STATE
+            return self.state
+        if not modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 1):
+            self.state = RobotState.NO_COMM_STATE
+            return self.state
+        self.begin()
+        while True:
+            done = modbus_fxns.check_robot_cycle_complete(client)
+            now = time.perf_counter()
+            self.polls += 1
+            if done == 0:
+                self._busy_seen = True
+                self.acks = (self.acks + [now - self.started_at])[-self.history:]
+                break
+            self._failures = 0 if done is not None else self._failures + 1
+            if self._failures >= self.max_failures:
+                print(f"Can't read cycle_done, {self._failures} tries.")
+                self.state = RobotState.NO_COMM_STATE
+                break
+            if now - self.started_at > self.ack_timeout_s:
+                print(f"Robot didn't take START in {self.ack_timeout_s} s.")
+                self.state = RobotState.ERROR_STATE
+                break
+            time.sleep(self.min_poll_s * (1 + self._rng.uniform(-self.jitter, self.jitter)))
+        if not modbus_fxns.set_modbus_bit(client, modbus_fxns.START_COMMAND, 0):
+            print("Couldn't clear START, the robot will run another cycle after this one!")
+            self.state = RobotState.NO_COMM_STATE
+        return self.state
+
+    def cycle(self, client):
+        """
+        cycle
+
+        start() and wait() for the end of the cycle
+
+        :returns: RobotState, WAITING_STATE when done
+        """
+        if self.start(client) != RobotState.MOVING_STATE:
+            return self.state
+        return self.wait(client)
+
+    def expected_s(self):
+        """
+        :returns: median measured cycle in s, None before the first one
+        """
+        return statistics.median(self.durations) if self.durations else None
+
+    def poll(self, client):
+        """
+        poll
+
+        reads cycle_done once (no waiting), e.g. once per frame
+
+        :returns: RobotState (see the class)
+        """
+        if self.state != RobotState.MOVING_STATE:
+            return self.state
+        done = modbus_fxns.check_robot_cycle_complete(client)
+        now = time.perf_counter()
+        self.polls += 1
+        if done is None:
+            self._failures += 1
+            if self._failures >= self.max_failures:
+                print(f"Can't read cycle_done, {self._failures} tries.")
+                self.state = RobotState.NO_COMM_STATE
+            return self.state
+        self._failures = 0
+        if done == 0:
+            self._busy_seen = True
+        elif self._busy_seen: # off then on: this cycle's done, not the last one's
+            self.durations = (self.durations + [now - self.started_at])[-self.history:]
+            self.state = RobotState.WAITING_STATE
+            return self.state
+        if now - self.started_at > self.timeout_s:
+            print(f"Robot cycle not done after {self.timeout_s} s ({'running' if self._busy_seen else 'never started'}).")
+            self.state = RobotState.ERROR_STATE
+        return self.state
+
+    def interval(self, now=None):
+        """
+        :returns: s until the next poll: min_poll_s from max_poll_s before the expected end on,
+            max_poll_s until then (and before the first measured cycle), jittered
+        """
+        now = time.perf_counter() if now is None else now
+        expected = self.expected_s()
+        if expected is not None and self.started_at + expected - now <= self.max_poll_s:
+            interval = self.min_poll_s
+        else:
+            interval = self.max_poll_s
+        return interval * (1 + self._rng.uniform(-self.jitter, self.jitter))
+
+    def wait(self, client, started_at=None):
+        """
+        wait
+
+        polls until the cycle is done, past the deadline, or cycle_done can't be read
+
+        :param started_at: time.perf_counter() START_COMMAND went on, None=already begin()'d
+        :returns: RobotState, WAITING_STATE when done
+        """
+        if started_at is not None:
+            self.begin(started_at)
+        while self.poll(client) == RobotState.MOVING_STATE:
+            time.sleep(self.interval())
+        return self.state